@@ -0,0 +1,4 @@
+# ai_qazaq - AI QAZAQ Teachers платформасының пакеті
+# Streamlit app.py-ды әр әрекетте қайта орындайды; пакет модульдері бір рет
+# импортталып sys.modules-та қалады, сондықтан функциялар, мәтіндер мен CSS
+# әр rerun сайын қайта құрылмайды.
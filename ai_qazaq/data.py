@@ -0,0 +1,2717 @@
+# ai_qazaq/data.py - деректер қабаты: SQLite қосылымдары, кэштер, сессиялар, миграциялар және дерек функциялары
+import streamlit as st
+import sqlite3
+import hashlib
+import hmac
+import json
+import os
+import io
+import string
+import re
+import secrets
+import sys
+import time
+import traceback
+import tempfile
+import threading
+import queue
+import weakref
+from collections import OrderedDict, Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import wraps
+from importlib.util import find_spec
+from pathlib import Path
+
+# pandas, numpy және openpyxl тек импорт, рейтинг және логин беттерінде керек -
+# олар сол функциялардың ішінде импортталады, сондықтан кіру беті мен оқушы
+# порталы оларды жүктемейді. Мұнда тек openpyxl бар-жоғы тексеріледі.
+OPENPYXL_AVAILABLE = find_spec('openpyxl') is not None
+
+# ============ ДЕРЕКҚОР ҚОСЫЛЫМДАРЫ ============
+DB_PATH = 'ai_qazaq_teachers.db'
+DB_POOL_SIZE = 16
+DB_BUSY_TIMEOUT_MS = 5000
+DB_CACHE_SIZE_KB = 20000
+
+class _ConnectionHolder:
+    """Бір ағынға тиесілі қосылым, транзакция тереңдігі және commit/rollback-тен кейінгі әрекеттер"""
+    __slots__ = ('conn', 'depth', 'after_commit', 'after_rollback', '__weakref__')
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.depth = 0
+        self.after_commit = []
+        self.after_rollback = []
+
+class ConnectionPool:
+    """Ағын сайын бір SQLite қосылымын ұстайтын пул.
+
+    Әр Streamlit ағыны өз қосылымын алады. Ағын аяқталғанда қосылым
+    пулға қайтарылады, сондықтан келесі ағын PRAGMA баптауларын қайта
+    орындамай-ақ дайын қосылымды пайдаланады.
+    """
+
+    def __init__(self, db_path, max_idle=DB_POOL_SIZE):
+        self.db_path = db_path
+        self._idle = queue.LifoQueue(maxsize=max_idle)
+        self._local = threading.local()
+
+    def _open(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               timeout=DB_BUSY_TIMEOUT_MS / 1000)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute(f"PRAGMA cache_size=-{DB_CACHE_SIZE_KB}")
+        # SQLite lower() тек ASCII әріптерін өзгертеді, кириллица үшін Python нұсқасы
+        conn.create_function("unicode_lower", 1,
+                             lambda value: value.lower() if isinstance(value, str) else value,
+                             deterministic=True)
+        return conn
+
+    def _release(self, conn):
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.close()
+
+    def holder(self):
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open()
+            holder = _ConnectionHolder(conn)
+            # Ағын жойылғанда қосылымды пулға қайтару
+            weakref.finalize(holder, self._release, conn)
+            self._local.holder = holder
+        return holder
+
+@st.cache_resource(show_spinner=False)
+def get_connection_pool(db_path=DB_PATH):
+    """Процесс бойы ортақ қосылым пулы (Streamlit қайта іске қосуларынан аман қалады)"""
+    return ConnectionPool(db_path)
+
+@contextmanager
+def db_connection():
+    """Ағымдағы ағынның қосылымын транзакциямен бірге беру.
+
+    Сыртқы блок сәтті аяқталса commit, қате болса rollback жасалады.
+    Кірістірілген блоктар сыртқы транзакцияның бөлігі болып қалады.
+    holder.after_commit ішіндегі әрекеттер тек сәтті commit-тен кейін орындалады.
+    holder.after_rollback әрекеттері rollback-тен кейін, блоктан шыққан соң
+    орындалады - олар жаңа db_connection() транзакциясын аша алады.
+    """
+    holder = get_connection_pool(DB_PATH).holder()
+    holder.depth += 1
+    rolled_back = []
+    try:
+        yield holder.conn
+        if holder.depth == 1:
+            holder.conn.commit()
+            holder.after_rollback = []
+            callbacks, holder.after_commit = holder.after_commit, []
+            for callback in callbacks:
+                callback()
+    except BaseException:
+        if holder.depth == 1:
+            holder.conn.rollback()
+            holder.after_commit = []
+            rolled_back, holder.after_rollback = holder.after_rollback, []
+        raise
+    finally:
+        holder.depth -= 1
+        for callback in rolled_back:
+            callback()
+
+# ============ СҰРАНЫС КЭШІ ============
+QUERY_CACHE_MAX_ENTRIES = 4096
+
+class QueryCache:
+    """Оқу функцияларының нәтижелерін тегтер (мұғалім/сынып) бойынша сақтайтын кэш.
+
+    Жазу функциялары тиісті тегтерді invalidate_query_cache() арқылы тазалайды.
+    Сұраныс орындалып жатқанда тег тазаланса, нәтиже кэшке жазылмайды -
+    ескі дерек қайта сақталып қалмауы үшін әр тегтің буын нөмірі бар.
+    """
+
+    def __init__(self, max_entries=QUERY_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._tag_keys = {}
+        self._generations = Counter()
+        self._lock = threading.Lock()
+        self.hits = Counter()
+        self.misses = Counter()
+
+    def get(self, name, args, tags, loader):
+        key = (name, args)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits[name] += 1
+                return self._entries[key]
+            self.misses[name] += 1
+            generations = [self._generations[tag] for tag in tags]
+
+        value = loader()
+
+        with self._lock:
+            if generations == [self._generations[tag] for tag in tags]:
+                self._entries[key] = value
+                for tag in tags:
+                    self._tag_keys.setdefault(tag, set()).add(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, *tags):
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] += 1
+                for key in self._tag_keys.pop(tag, ()):
+                    self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tag_keys.clear()
+            self._generations.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': dict(self.hits),
+                'misses': dict(self.misses),
+                'entries': len(self._entries)
+            }
+
+@st.cache_resource(show_spinner=False)
+def get_query_cache():
+    """Процесс бойы ортақ сұраныс кэші"""
+    return QueryCache()
+
+def cached_query(*tag_names):
+    """Оқу функциясын кэштеу: tag_names[i] - i-ші аргументтің тегі.
+
+    'teacher' - мұғалімнің сыныптары, 'teacher_students' - мұғалімнің барлық
+    оқушылары, 'class' - бір сыныптың оқушылары.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            tags = tuple(zip(tag_names, args))
+            value = get_query_cache().get(func.__name__, args, tags, lambda: func(*args))
+            # Шақырушы тізімді/кестені өзгертсе, кэштегі нұсқа бұзылмасын.
+            # DataFrame тек pandas жүктелген болса ғана болуы мүмкін - оны осында импорттамаймыз
+            if isinstance(value, list):
+                return list(value)
+            pandas = sys.modules.get('pandas')
+            if pandas is not None and isinstance(value, pandas.DataFrame):
+                return value.copy()
+            return value
+        return wrapper
+    return decorator
+
+def invalidate_query_cache(*tags):
+    """Тегтерге байланысты кэш жазбаларын тазалау (транзакция ішінде болса - commit-тен кейін)"""
+    holder = get_connection_pool(DB_PATH).holder()
+    if holder.depth > 0:
+        holder.after_commit.append(lambda: get_query_cache().invalidate(*tags))
+    else:
+        get_query_cache().invalidate(*tags)
+
+def get_query_cache_stats():
+    """Кэштің hit/miss есептегіштері функция аттары бойынша"""
+    return get_query_cache().stats()
+
+# ============ ДЕРЕКҚОР БАЗАСЫ ============
+def _migrate_initial_schema(conn):
+    """Бастапқы кестелер"""
+    c = conn.cursor()
+    
+    # Мұғалімдер кестесі
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS teachers (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL,
+            email TEXT,
+            full_name TEXT,
+            school TEXT,
+            city TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    # Сыныптар кестесі
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS classes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            teacher_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            subject TEXT,
+            grade_level TEXT,
+            description TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (teacher_id) REFERENCES teachers (id)
+        )
+    ''')
+    
+    # Оқушылар кестесі
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            class_id INTEGER NOT NULL,
+            full_name TEXT NOT NULL,
+            student_code TEXT UNIQUE,
+            grade_points INTEGER DEFAULT 0,
+            academic_performance TEXT DEFAULT 'Орташа',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (class_id) REFERENCES classes (id)
+        )
+    ''')
+    
+    # Оқушы логиндері
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS student_logins (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id INTEGER NOT NULL,
+            username TEXT UNIQUE NOT NULL,
+            password TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (student_id) REFERENCES students (id)
+        )
+    ''')
+    
+    # БЖБ тапсырмалары
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS bzb_tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            teacher_id INTEGER NOT NULL,
+            class_id INTEGER NOT NULL,
+            task_name TEXT NOT NULL,
+            task_file BLOB,
+            file_type TEXT,
+            upload_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            completion_rate INTEGER DEFAULT 0,
+            difficulty_level TEXT,
+            ai_solution TEXT,
+            FOREIGN KEY (teacher_id) REFERENCES teachers (id),
+            FOREIGN KEY (class_id) REFERENCES classes (id)
+        )
+    ''')
+    
+    # Көрнекіліктер
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS visual_materials (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            teacher_id INTEGER NOT NULL,
+            file_name TEXT NOT NULL,
+            file_data BLOB,
+            file_type TEXT,
+            file_size INTEGER,
+            category TEXT,
+            upload_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (teacher_id) REFERENCES teachers (id)
+        )
+    ''')
+    
+    # Сабақ жоспарлары
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS lesson_plans (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            teacher_id INTEGER NOT NULL,
+            class_id INTEGER NOT NULL,
+            lesson_name TEXT NOT NULL,
+            subject TEXT,
+            grade_level TEXT,
+            lesson_type TEXT,
+            duration_minutes INTEGER DEFAULT 40,
+            goals TEXT,
+            methods TEXT,
+            equipment TEXT,
+            stages TEXT,
+            reflection TEXT,
+            ai_suggestions TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (teacher_id) REFERENCES teachers (id),
+            FOREIGN KEY (class_id) REFERENCES classes (id)
+        )
+    ''')
+    
+    # Оқушыларға тапсырмалар - БІРІКТІРІЛГЕН ЖАҢА КЕСТЕ
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS student_tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            teacher_id INTEGER NOT NULL,
+            student_id INTEGER NOT NULL,
+            class_id INTEGER NOT NULL,
+            
+            -- Тапсырма ақпараты
+            task_name TEXT NOT NULL,
+            task_description TEXT,
+            
+            -- Тапсырма файлы
+            task_file BLOB,
+            task_file_type TEXT,
+            task_file_name TEXT,
+            task_file_size INTEGER,
+            
+            -- Мұғалім ақпараты
+            teacher_name TEXT,
+            
+            -- Оқушы ақпараты  
+            student_name TEXT,
+            class_name TEXT,
+            
+            -- Мерзімдер
+            assigned_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            due_date DATE,
+            
+            -- Статус
+            status TEXT DEFAULT 'Тағайындалды',
+            
+            -- Оқушының жауабы
+            student_answer_text TEXT,
+            student_answer_file BLOB,
+            student_answer_file_type TEXT,
+            student_answer_file_name TEXT,
+            student_answer_file_size INTEGER,
+            student_submitted_date TIMESTAMP,
+            
+            -- Бағалау
+            points INTEGER DEFAULT 10,
+            score INTEGER,
+            teacher_feedback TEXT,
+            checked_date TIMESTAMP,
+            
+            -- Түйіндеулер
+            tags TEXT,
+            difficulty TEXT DEFAULT 'Орташа',
+            
+            FOREIGN KEY (teacher_id) REFERENCES teachers (id),
+            FOREIGN KEY (student_id) REFERENCES students (id),
+            FOREIGN KEY (class_id) REFERENCES classes (id)
+        )
+    ''')
+
+# ============ СЕССИЯ БАСҚАРУ ============
+# Браузерде тек мағынасыз токен сақталады (URL-дегі ?session=...), дерегі серверде
+SESSION_QUERY_PARAM = "session"
+SESSION_TTL_SECONDS = 7 * 24 * 3600
+SESSION_CACHE_SIZE = 10000
+
+USER_SESSION_FIELDS = ["id", "username", "full_name", "school", "city"]
+STUDENT_SESSION_FIELDS = ["id", "full_name", "student_code", "class_id", "class_name",
+                          "subject", "grade_points", "academic_performance"]
+
+def _session_key(token):
+    # Дерекқорда токеннің өзі емес, хеші сақталады
+    return hashlib.sha256(token.encode()).hexdigest()
+
+class SessionStore:
+    """Сессиялар: жадтағы LRU (TTL-мен) + SQLite sessions кестесі.
+
+    Белсенді сессияны қалпына келтіру - бір сөздік іздеу; жадта жоқ болса
+    (сервер қайта іске қосылған, LRU-дан шығып қалған) кестеден оқылады.
+    """
+
+    def __init__(self, ttl=SESSION_TTL_SECONDS, max_entries=SESSION_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key, session):
+        with self._lock:
+            self._entries[key] = session
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def create(self, kind, data):
+        token = secrets.token_urlsafe(32)
+        key = _session_key(token)
+        expires_at = time.time() + self.ttl
+        with db_connection() as conn:
+            conn.execute(
+                "INSERT INTO sessions (token_hash, kind, data, expires_at) VALUES (?, ?, ?, ?)",
+                (key, kind, json.dumps(data, ensure_ascii=False), expires_at)
+            )
+            # Мерзімі өткен сессияларды тазалау (expires_at индексі бойынша)
+            conn.execute("DELETE FROM sessions WHERE expires_at < ?", (time.time(),))
+        self._remember(key, (kind, tuple(data), expires_at))
+        return token
+
+    def get(self, token):
+        """(kind, data) немесе None"""
+        if not token:
+            return None
+        key = _session_key(token)
+        with self._lock:
+            session = self._entries.get(key)
+            if session is not None:
+                self._entries.move_to_end(key)
+        
+        if session is None:
+            with db_connection() as conn:
+                row = conn.execute(
+                    "SELECT kind, data, expires_at FROM sessions WHERE token_hash = ?", (key,)
+                ).fetchone()
+            if row is None:
+                return None
+            session = (row[0], tuple(json.loads(row[1])), row[2])
+            self._remember(key, session)
+        
+        kind, data, expires_at = session
+        if expires_at < time.time():
+            self.delete(token)
+            return None
+        return kind, data
+
+    def delete(self, token):
+        key = _session_key(token)
+        with self._lock:
+            self._entries.pop(key, None)
+        with db_connection() as conn:
+            conn.execute("DELETE FROM sessions WHERE token_hash = ?", (key,))
+
+@st.cache_resource(show_spinner=False)
+def get_session_store():
+    """Процесс бойы ортақ сессия қоймасы"""
+    return SessionStore()
+
+def _current_session_token():
+    return st.query_params.get(SESSION_QUERY_PARAM)
+
+def _start_session(kind, data):
+    token = get_session_store().create(kind, list(data))
+    st.query_params[SESSION_QUERY_PARAM] = token
+    return token
+
+def load_session():
+    """URL-дегі токен бойынша (kind, data) - бір сөздік іздеу"""
+    try:
+        return get_session_store().get(_current_session_token())
+    except Exception as e:
+        print(f"❌ Сессияны жүктеу қатесі: {e}")
+        return None
+
+def _load_session(kind):
+    session = load_session()
+    if session and session[0] == kind:
+        return session[1]
+    return None
+
+def _end_session():
+    token = _current_session_token()
+    if token:
+        try:
+            get_session_store().delete(token)
+        except Exception as e:
+            print(f"❌ Сессияны жою қатесі: {e}")
+        del st.query_params[SESSION_QUERY_PARAM]
+
+def save_user_session(user):
+    try:
+        return _start_session('teacher', user[:len(USER_SESSION_FIELDS)])
+    except Exception as e:
+        print(f"❌ Сессияны сақтау қатесі: {e}")
+
+def load_user_session():
+    return _load_session('teacher')
+
+def save_student_session(student):
+    try:
+        data = list(student[:len(STUDENT_SESSION_FIELDS)])
+        if len(data) < len(STUDENT_SESSION_FIELDS):
+            data.append("Орташа")
+        return _start_session('student', data)
+    except Exception as e:
+        print(f"❌ Студент сессиясын сақтау қатесі: {e}")
+
+def load_student_session():
+    return _load_session('student')
+
+def clear_user_session():
+    _end_session()
+
+def clear_student_session():
+    _end_session()
+
+# ============ ҚҰПИЯ СӨЗ ХЭШІ ============
+# scrypt параметрлері хэштің өзінде сақталады: scrypt$N$r$p$salt$hash.
+# N мәнін хостқа calibrate_password_hash() арқылы таңдап, PASSWORD_SCRYPT_N-ге жазыңыз.
+PASSWORD_SCRYPT_N = int(os.environ.get('PASSWORD_SCRYPT_N', 2 ** 14))
+PASSWORD_SCRYPT_R = 8
+PASSWORD_SCRYPT_P = 1
+PASSWORD_SALT_BYTES = 16
+PASSWORD_HASH_BYTES = 32
+PASSWORD_HASH_TARGET_MS = 100
+# Бір уақытта есептелетін хэштер саны - таңғы кіру толқыны CPU мен жадты (128*r*N әрқайсысы) толтырмауы үшін
+PASSWORD_HASH_WORKERS = min(4, os.cpu_count() or 1)
+# Топтап логин құру (бүкіл сынып/мұғалім) бөлек пулда - жүздеген хэш кезегі
+# кіру кезіндегі тексерулерді күттірмеуі үшін. Жалпы шек - екі пулдың қосындысы
+PASSWORD_BATCH_HASH_WORKERS = max(1, PASSWORD_HASH_WORKERS // 2)
+
+@st.cache_resource(show_spinner=False)
+def get_password_hash_pool():
+    return ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
+@st.cache_resource(show_spinner=False)
+def get_password_batch_hash_pool():
+    return ThreadPoolExecutor(max_workers=PASSWORD_BATCH_HASH_WORKERS, thread_name_prefix="password-batch-hash")
+
+def _scrypt(password, salt, n, r, p):
+    # hashlib.scrypt есептеу кезінде GIL-ді босатады
+    return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                          maxmem=256 * r * n, dklen=PASSWORD_HASH_BYTES)
+
+def _hash_password_now(password):
+    salt = secrets.token_bytes(PASSWORD_SALT_BYTES)
+    digest = _scrypt(password, salt, PASSWORD_SCRYPT_N, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P)
+    return f"scrypt${PASSWORD_SCRYPT_N}${PASSWORD_SCRYPT_R}${PASSWORD_SCRYPT_P}${salt.hex()}${digest.hex()}"
+
+def _verify_password_now(password, stored):
+    if not stored:
+        return False
+    if not stored.startswith('scrypt$'):
+        # Ескі тұзсыз SHA-256 хэші
+        legacy = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, stored)
+    try:
+        _, n, r, p, salt, digest = stored.split('$')
+        expected = _scrypt(password, bytes.fromhex(salt), int(n), int(r), int(p))
+    except ValueError:
+        return False
+    return hmac.compare_digest(expected.hex(), digest)
+
+def hash_password(password):
+    """Тұзды scrypt хэші - хэштеу пулында есептеледі"""
+    return get_password_hash_pool().submit(_hash_password_now, password).result()
+
+def hash_passwords(passwords):
+    """Бірнеше құпия сөзді топтық пулда хэштеу - кіру пулы бос қалады"""
+    return list(get_password_batch_hash_pool().map(_hash_password_now, passwords))
+
+def verify_password(password, stored):
+    return get_password_hash_pool().submit(_verify_password_now, password, stored).result()
+
+def password_needs_rehash(stored):
+    """Ескі SHA-256 немесе ағымдағыдан басқа параметрлі хэш"""
+    current = f"scrypt${PASSWORD_SCRYPT_N}${PASSWORD_SCRYPT_R}${PASSWORD_SCRYPT_P}$"
+    return not stored.startswith(current)
+
+def calibrate_password_hash(target_ms=PASSWORD_HASH_TARGET_MS, max_n=2 ** 20):
+    """Осы хостта бір хэш target_ms-тен аспайтын ең үлкен scrypt N мәнін табу.
+
+    Нәтижені PASSWORD_SCRYPT_N ортасы айнымалысына қойыңыз:
+    python -c "from ai_qazaq.data import calibrate_password_hash; calibrate_password_hash()"
+    """
+    chosen = None
+    n = 2 ** 12
+    while n <= max_n:
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            _scrypt("calibration", b"0" * PASSWORD_SALT_BYTES, n, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P)
+            timings.append((time.perf_counter() - started) * 1000)
+        elapsed = min(timings)
+        memory_mb = 128 * PASSWORD_SCRYPT_R * n / (1024 * 1024)
+        print(f"N=2^{n.bit_length() - 1}: {elapsed:.1f} мс, {memory_mb:.0f} МБ")
+        if elapsed > target_ms:
+            break
+        chosen = n
+        n *= 2
+
+    if chosen is None:
+        print(f"⚠️ Ең кіші N да {target_ms} мс-тен баяу")
+        return 2 ** 12
+    print(f"✅ PASSWORD_SCRYPT_N={chosen} (мақсат {target_ms} мс, {PASSWORD_HASH_WORKERS} ағын)")
+    return chosen
+
+# ============ ОРТАҚ ФУНКЦИЯЛАР ============
+
+def generate_random_password(length=8):
+    characters = string.ascii_letters + string.digits
+    return ''.join(secrets.choice(characters) for _ in range(length))
+
+def get_file_extension(file_type):
+    if '/' in file_type:
+        return file_type.split('/')[-1]
+    return 'file'
+
+def get_file_size_str(size_bytes):
+    """Файл көлемін оқуға ыңғайлы форматтау"""
+    if size_bytes < 1024:
+        return f"{size_bytes} Б"
+    elif size_bytes < 1024 * 1024:
+        return f"{size_bytes / 1024:.1f} КБ"
+    elif size_bytes < 1024 * 1024 * 1024:
+        return f"{size_bytes / (1024 * 1024):.1f} МБ"
+    else:
+        return f"{size_bytes / (1024 * 1024 * 1024):.1f} ГБ"
+
+def points_to_grade(points):
+    try:
+        if isinstance(points, str):
+            points = points.strip()
+            if points == '':
+                return "F"
+            try:
+                points_int = int(float(points))
+            except:
+                return "F"
+        elif isinstance(points, (int, float)):
+            points_int = int(points)
+        else:
+            return "F"
+        
+        if points_int >= 9: return "A"
+        elif points_int >= 7: return "B"
+        elif points_int >= 5: return "C"
+        elif points_int >= 3: return "D"
+        else: return "F"
+    except:
+        return "F"
+
+def get_grade_class(grade):
+    grade_classes = {
+        "A": "grade-a", "B": "grade-b", "C": "grade-c",
+        "D": "grade-d", "F": "grade-f"
+    }
+    return grade_classes.get(grade, "grade-f")
+
+def export_to_csv(dataframe):
+    output = io.BytesIO()
+    csv_data = dataframe.to_csv(index=False, encoding='utf-8-sig')
+    output.write(csv_data.encode('utf-8-sig'))
+    output.seek(0)
+    return output
+
+# ============ СХЕМА МИГРАЦИЯЛАРЫ ============
+def _migrate_student_tasks_columns(conn):
+    """Ескі student_tasks кестесіне жетіспейтін бағаналарды қосу"""
+    c = conn.cursor()
+    c.execute("PRAGMA table_info(student_tasks)")
+    column_names = [col[1] for col in c.fetchall()]
+    
+    required_columns = [
+        ('task_file_size', 'INTEGER'),
+        ('student_answer_file_name', 'TEXT'),
+        ('student_answer_file_size', 'INTEGER'),
+        ('points', 'INTEGER DEFAULT 10'),
+        ('due_date', 'DATE'),
+        ('task_file_type', 'TEXT'),
+        ('task_file_name', 'TEXT'),
+        ('teacher_name', 'TEXT'),
+        ('student_name', 'TEXT'),
+        ('class_name', 'TEXT'),
+        ('tags', 'TEXT'),
+        ('difficulty', 'TEXT DEFAULT "Орташа"'),
+        ('checked_date', 'TIMESTAMP'),
+        ('student_answer_file_type', 'TEXT'),
+        ('status', 'TEXT DEFAULT "Тағайындалды"'),
+        ('teacher_feedback', 'TEXT'),
+        ('score', 'INTEGER'),
+        ('student_answer_text', 'TEXT'),
+        ('student_answer_file', 'BLOB'),
+        ('student_submitted_date', 'TIMESTAMP'),
+        # ALTER TABLE тұрақты емес DEFAULT мәнін қабылдамайды, сондықтан төменде толтырылады
+        ('assigned_date', 'TIMESTAMP')
+    ]
+    
+    for col_name, col_type in required_columns:
+        if col_name not in column_names:
+            c.execute(f"ALTER TABLE student_tasks ADD COLUMN {col_name} {col_type}")
+            print(f"➕ student_tasks.{col_name} бағанасы қосылды")
+    
+    if 'assigned_date' not in column_names:
+        c.execute("UPDATE student_tasks SET assigned_date = CURRENT_TIMESTAMP WHERE assigned_date IS NULL")
+
+def _migrate_student_tasks_indexes(conn):
+    """student_tasks индекстері (бағаналар толықтырылғаннан кейін)"""
+    c = conn.cursor()
+    c.execute('CREATE INDEX IF NOT EXISTS idx_student_tasks_student_id ON student_tasks(student_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_student_tasks_teacher_id ON student_tasks(teacher_id)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_student_tasks_status ON student_tasks(status)')
+    c.execute('CREATE INDEX IF NOT EXISTS idx_student_tasks_due_date ON student_tasks(due_date)')
+
+# Файл сілтемелері: (кесте, ескі BLOB бағанасы, blobs кестесіне сілтейтін хеш бағанасы)
+BLOB_REFERENCES = [
+    ('student_tasks', 'task_file', 'task_file_hash'),
+    ('student_tasks', 'student_answer_file', 'student_answer_file_hash'),
+    ('bzb_tasks', 'task_file', 'file_hash'),
+    ('visual_materials', 'file_data', 'file_hash'),
+]
+
+def _blob_sha256(data):
+    if data is None:
+        return None
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+def _migrate_blob_store(conn):
+    """Файлдарды SHA-256 бойынша бір рет сақтайтын blobs кестесіне көшіру"""
+    c = conn.cursor()
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS blobs (
+            sha256 TEXT PRIMARY KEY,
+            data BLOB,
+            size INTEGER NOT NULL,
+            ref_count INTEGER NOT NULL DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    
+    tables = {}
+    for table, _, hash_col in BLOB_REFERENCES:
+        tables.setdefault(table, []).append(hash_col)
+        c.execute(f"ALTER TABLE {table} ADD COLUMN {hash_col} TEXT")
+    
+    # Сілтеме санын триггерлер жүргізеді: соңғы сілтеме кеткенде blob жойылады
+    for table, hash_cols in tables.items():
+        increments = "\n".join(
+            f"UPDATE blobs SET ref_count = ref_count + 1 WHERE sha256 = NEW.{col};" for col in hash_cols)
+        decrements = "\n".join(
+            f"UPDATE blobs SET ref_count = ref_count - 1 WHERE sha256 = OLD.{col};" for col in hash_cols)
+        released = ", ".join(f"OLD.{col}" for col in hash_cols)
+        cleanup = f"DELETE FROM blobs WHERE ref_count <= 0 AND sha256 IN ({released});"
+        c.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_blob_insert AFTER INSERT ON {table}
+            BEGIN
+                {increments}
+            END
+        """)
+        c.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_blob_update
+            AFTER UPDATE OF {", ".join(hash_cols)} ON {table}
+            BEGIN
+                {increments}
+                {decrements}
+                {cleanup}
+            END
+        """)
+        c.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_blob_delete AFTER DELETE ON {table}
+            BEGIN
+                {decrements}
+                {cleanup}
+            END
+        """)
+    
+    # Бұрын жолдың ішінде сақталған файлдарды blobs кестесіне көшіру
+    conn.create_function('blob_sha256', 1, _blob_sha256, deterministic=True)
+    for table, data_col, hash_col in BLOB_REFERENCES:
+        c.execute(f"""
+            INSERT OR IGNORE INTO blobs (sha256, data, size)
+            SELECT blob_sha256({data_col}), {data_col}, length(CAST({data_col} AS BLOB))
+            FROM {table} WHERE {data_col} IS NOT NULL
+        """)
+        c.execute(f"""
+            UPDATE {table} SET {hash_col} = blob_sha256({data_col}), {data_col} = NULL
+            WHERE {data_col} IS NOT NULL
+        """)
+
+def _migrate_blob_storage(conn):
+    """Әр blob мазмұны қай жерде сақталатынын белгілеу (дерекқор немесе диск)"""
+    c = conn.cursor()
+    c.execute("ALTER TABLE blobs ADD COLUMN storage TEXT NOT NULL DEFAULT 'sqlite'")
+    # Дискідегі файлдарды транзакция сәтті аяқталғаннан кейін ғана өшіру үшін
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS blob_trash (
+            sha256 TEXT PRIMARY KEY,
+            storage TEXT NOT NULL
+        )
+    ''')
+    c.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_blobs_trash AFTER DELETE ON blobs
+        WHEN OLD.storage != 'sqlite'
+        BEGIN
+            INSERT OR IGNORE INTO blob_trash (sha256, storage) VALUES (OLD.sha256, OLD.storage);
+        END
+    ''')
+
+# Нұсқа нөмірі бойынша реттелген миграциялар. Жаңа қадам тек тізім соңына қосылады.
+def _migrate_task_list_indexes(conn):
+    """Тапсырмалар тізімін беттеп шығаруға арналған индекстер (кілт + id)"""
+    c = conn.cursor()
+    c.execute("""CREATE INDEX IF NOT EXISTS idx_student_tasks_teacher_due
+                 ON student_tasks(teacher_id, IFNULL(due_date, ''), id)""")
+    c.execute("""CREATE INDEX IF NOT EXISTS idx_student_tasks_teacher_student
+                 ON student_tasks(teacher_id, IFNULL(student_name, ''), id)""")
+
+# Толық мәтінді іздеу индексіне кіретін student_tasks бағаналары
+TASK_SEARCH_COLUMNS = ['task_name', 'task_description', 'student_name', 'tags',
+                       'student_answer_text', 'teacher_feedback']
+# bm25 салмақтары (TASK_SEARCH_COLUMNS ретімен): атау мен оқушы аты маңыздырақ
+TASK_SEARCH_WEIGHTS = [10.0, 2.0, 5.0, 3.0, 1.0, 1.0]
+
+def _fts5_available(conn):
+    return any(row[0] == 'ENABLE_FTS5' for row in conn.execute("PRAGMA compile_options"))
+
+def _migrate_task_search_index(conn):
+    """student_tasks үшін FTS5 индексі және оны үйлестіретін триггерлер"""
+    if not _fts5_available(conn):
+        print("⚠️ SQLite FTS5 қолжетімсіз - тапсырмаларды іздеу қарапайым режимде жұмыс істейді")
+        return
+    
+    c = conn.cursor()
+    columns = ', '.join(TASK_SEARCH_COLUMNS)
+    old_values = ', '.join(f"old.{col}" for col in TASK_SEARCH_COLUMNS)
+    new_values = ', '.join(f"new.{col}" for col in TASK_SEARCH_COLUMNS)
+    
+    # unicode61 кириллицаны регистрсіз салыстырады; remove_diacritics 0 - й/и, ё/е бөлек қалады
+    c.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS student_tasks_fts USING fts5(
+            {columns},
+            content='student_tasks', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 0'
+        )
+    """)
+    c.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_student_tasks_fts_insert
+        AFTER INSERT ON student_tasks BEGIN
+            INSERT INTO student_tasks_fts(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    c.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_student_tasks_fts_delete
+        AFTER DELETE ON student_tasks BEGIN
+            INSERT INTO student_tasks_fts(student_tasks_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_values});
+        END
+    """)
+    c.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_student_tasks_fts_update
+        AFTER UPDATE OF {columns} ON student_tasks BEGIN
+            INSERT INTO student_tasks_fts(student_tasks_fts, rowid, {columns})
+            VALUES ('delete', old.id, {old_values});
+            INSERT INTO student_tasks_fts(rowid, {columns}) VALUES (new.id, {new_values});
+        END
+    """)
+    c.execute("INSERT INTO student_tasks_fts(student_tasks_fts) VALUES ('rebuild')")
+    c.execute(
+        "INSERT INTO student_tasks_fts(student_tasks_fts, rank) VALUES ('rank', ?)",
+        (f"bm25({', '.join(str(w) for w in TASK_SEARCH_WEIGHTS)})",)
+    )
+
+def _migrate_sessions(conn):
+    """Сервердегі сессиялар кестесі (бұрынғы *_session.json файлдарының орнына)"""
+    c = conn.cursor()
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS sessions (
+            token_hash TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            data TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            expires_at REAL NOT NULL
+        )
+    """)
+    c.execute("CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at)")
+
+# task_stats деңгейлері: (scope атауы, student_tasks бағанасы)
+TASK_STATS_SCOPES = [('teacher', 'teacher_id'), ('class', 'class_id'), ('student', 'student_id')]
+
+def _task_stats_change_sql(row, delta):
+    """row ('new'/'old') жолын барлық деңгейдегі есептегіштерге delta қосатын SQL"""
+    statements = []
+    for scope, column in TASK_STATS_SCOPES:
+        statements.append(f"""
+            INSERT INTO task_stats (scope, scope_id, status, task_count)
+            VALUES ('{scope}', IFNULL({row}.{column}, 0), IFNULL({row}.status, ''), {delta})
+            ON CONFLICT (scope, scope_id, status) DO UPDATE SET task_count = task_count + ({delta});""")
+    return ''.join(statements)
+
+def _migrate_task_stats(conn):
+    """Тапсырма есептегіштері (мұғалім/сынып/оқушы × статус), триггерлермен жүргізіледі"""
+    c = conn.cursor()
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS task_stats (
+            scope TEXT NOT NULL,
+            scope_id INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            task_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (scope, scope_id, status)
+        ) WITHOUT ROWID
+    """)
+    c.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_student_tasks_stats_insert
+        AFTER INSERT ON student_tasks BEGIN {_task_stats_change_sql('new', 1)}
+        END
+    """)
+    c.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_student_tasks_stats_delete
+        AFTER DELETE ON student_tasks BEGIN {_task_stats_change_sql('old', -1)}
+        END
+    """)
+    changed = ' OR '.join(f"old.{column} IS NOT new.{column}" for column in ['status'] + [col for _, col in TASK_STATS_SCOPES])
+    c.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_student_tasks_stats_update
+        AFTER UPDATE OF status, teacher_id, class_id, student_id ON student_tasks
+        WHEN {changed}
+        BEGIN {_task_stats_change_sql('old', -1)}{_task_stats_change_sql('new', 1)}
+        END
+    """)
+    # Мерзімі өткендер уақытқа тәуелді, сондықтан индекс арқылы саналады
+    c.execute("""CREATE INDEX IF NOT EXISTS idx_student_tasks_teacher_status_due
+                 ON student_tasks(teacher_id, status, due_date)""")
+    _fill_task_stats(conn)
+
+def _task_stats_expected_sql():
+    return ' UNION ALL '.join(f"""
+        SELECT '{scope}', IFNULL({column}, 0), IFNULL(status, ''), COUNT(*)
+        FROM student_tasks GROUP BY 2, 3""" for scope, column in TASK_STATS_SCOPES)
+
+def _fill_task_stats(conn):
+    conn.execute("DELETE FROM task_stats")
+    conn.execute(f"INSERT INTO task_stats (scope, scope_id, status, task_count) {_task_stats_expected_sql()}")
+
+# "Бүгін" - сервердің жергілікті күні (бұрынғы datetime.now().date() сияқты).
+# display_status триггерлері, sweeper және days_left бәрі осы анықтаманы қолданады
+TODAY_SQL = "date('now', 'localtime')"
+
+def _display_status_sql(row):
+    """row ('new' немесе кесте) үшін көрсетілетін статус: мерзімі өткен 'Тағайындалды' -> 'Кешікті'"""
+    return f"""CASE WHEN {row}.due_date < {TODAY_SQL} AND {row}.status = 'Тағайындалды'
+                    THEN 'Кешікті' ELSE {row}.status END"""
+
+def _create_display_status_triggers(c):
+    """display_status-ты жазу кезінде TODAY_SQL бойынша жүргізетін триггерлер"""
+    c.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_student_tasks_display_status_insert
+        AFTER INSERT ON student_tasks
+        WHEN new.display_status IS NOT ({_display_status_sql('new')})
+        BEGIN
+            UPDATE student_tasks SET display_status = {_display_status_sql('new')} WHERE id = new.id;
+        END
+    """)
+    c.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_student_tasks_display_status_update
+        AFTER UPDATE OF status, due_date ON student_tasks
+        BEGIN
+            UPDATE student_tasks SET display_status = {_display_status_sql('new')} WHERE id = new.id;
+        END
+    """)
+
+def _migrate_display_status(conn):
+    """Сақталған display_status бағанасы, оны жүргізетін триггерлер және индекстер"""
+    c = conn.cursor()
+    c.execute("PRAGMA table_info(student_tasks)")
+    if 'display_status' not in [col[1] for col in c.fetchall()]:
+        c.execute("ALTER TABLE student_tasks ADD COLUMN display_status TEXT DEFAULT 'Тағайындалды'")
+    c.execute(f"UPDATE student_tasks SET display_status = {_display_status_sql('student_tasks')}")
+    
+    # Бүгінгі күн тұрақсыз, сондықтан генерацияланған баған емес - триггер мен sweeper
+    _create_display_status_triggers(c)
+    
+    # Статус бойынша сүзілген тізім мен мерзімі өткендер саны
+    c.execute("""CREATE INDEX IF NOT EXISTS idx_student_tasks_teacher_display_due
+                 ON student_tasks(teacher_id, display_status, IFNULL(due_date, ''), id)""")
+    # "Статус" сұрыптауы (DISPLAY_STATUS_ORDER өрнегімен дәл сәйкес)
+    c.execute(f"""CREATE INDEX IF NOT EXISTS idx_student_tasks_teacher_status_order
+                  ON student_tasks(teacher_id, {DISPLAY_STATUS_ORDER}, IFNULL(due_date, ''), id)""")
+    # Sweeper үшін
+    c.execute("""CREATE INDEX IF NOT EXISTS idx_student_tasks_display_due
+                 ON student_tasks(display_status, due_date)""")
+    c.execute("DROP INDEX IF EXISTS idx_student_tasks_teacher_status_due")
+
+def _migrate_lookup_indexes(conn):
+    """student_tasks-тен басқа кестелердің сұраныстарына және сыртқы кілт тексерулеріне индекстер"""
+    c = conn.cursor()
+    # get_classes: сүзу, ORDER BY name және бағандар индекстің өзінен
+    c.execute("CREATE INDEX IF NOT EXISTS idx_classes_teacher ON classes(teacher_id, name, subject, grade_level)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_students_class ON students(class_id, full_name)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_student_logins_student ON student_logins(student_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_bzb_tasks_teacher_upload ON bzb_tasks(teacher_id, upload_date)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_bzb_tasks_class ON bzb_tasks(class_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_visual_materials_teacher_upload ON visual_materials(teacher_id, upload_date)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_lesson_plans_class ON lesson_plans(class_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_student_tasks_class ON student_tasks(class_id)")
+
+def _migrate_normalize_task_dates(conn):
+    """Ескі ISO ('T', 'Z') уақыттарын CURRENT_TIMESTAMP пішіміне келтіру"""
+    c = conn.cursor()
+    for column in ['assigned_date', 'student_submitted_date', 'checked_date']:
+        c.execute(f'''
+            UPDATE student_tasks SET {column} = datetime({column})
+            WHERE {column} IS NOT NULL AND datetime({column}) IS NOT NULL
+              AND {column} != datetime({column})
+        ''')
+    c.execute('''
+        UPDATE student_tasks SET due_date = date(due_date)
+        WHERE due_date IS NOT NULL AND date(due_date) IS NOT NULL AND due_date != date(due_date)
+    ''')
+
+def _migrate_local_today(conn):
+    """display_status триггерлерін UTC date('now') орнына TODAY_SQL-ге көшіру"""
+    c = conn.cursor()
+    c.execute("DROP TRIGGER IF EXISTS trg_student_tasks_display_status_insert")
+    c.execute("DROP TRIGGER IF EXISTS trg_student_tasks_display_status_update")
+    _create_display_status_triggers(c)
+    c.execute(f"""
+        UPDATE student_tasks SET display_status = {_display_status_sql('student_tasks')}
+        WHERE display_status IS NOT ({_display_status_sql('student_tasks')})
+    """)
+
+MIGRATIONS = [
+    (1, "Бастапқы кестелер", _migrate_initial_schema),
+    (2, "student_tasks бағаналарын толықтыру", _migrate_student_tasks_columns),
+    (3, "student_tasks индекстері", _migrate_student_tasks_indexes),
+    (4, "Файлдардың ортақ blobs қоймасы", _migrate_blob_store),
+    (5, "Blob сақтау орнын таңдау", _migrate_blob_storage),
+    (6, "Тапсырмалар тізімінің индекстері", _migrate_task_list_indexes),
+    (7, "Тапсырмаларды толық мәтінді іздеу", _migrate_task_search_index),
+    (8, "Сервердегі сессиялар", _migrate_sessions),
+    (9, "Тапсырма есептегіштері", _migrate_task_stats),
+    (10, "Сақталған display_status және мерзім sweeper-і", _migrate_display_status),
+    (11, "Қалған кестелердің индекстері", _migrate_lookup_indexes),
+    (12, "Тапсырма уақыттарының бірыңғай пішімі", _migrate_normalize_task_dates),
+    (13, "Бүгінгі күн - жергілікті уақыт бойынша", _migrate_local_today),
+]
+
+def get_schema_version(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    return conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()[0]
+
+def run_migrations():
+    """Орындалмаған миграцияларды ретімен бір транзакцияда қолдану"""
+    with db_connection() as conn:
+        if get_schema_version(conn) >= MIGRATIONS[-1][0]:
+            return MIGRATIONS[-1][0]
+        
+        # Басқа процесс қатар миграция жасамауы үшін жазу құлпын алу
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        current_version = get_schema_version(conn)
+        for version, description, migrate in MIGRATIONS:
+            if version <= current_version:
+                continue
+            migrate(conn)
+            conn.execute(
+                "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                (version, description)
+            )
+            current_version = version
+            print(f"✅ Миграция {version}: {description}")
+        return current_version
+
+@st.cache_resource(show_spinner=False)
+def ensure_schema(db_path=DB_PATH):
+    """Дерекқор схемасын процесс бойы бір рет жаңарту"""
+    version = run_migrations()
+    purge_deleted_blobs()
+    return version
+
+# ============ ФАЙЛ ҚОЙМАСЫ ============
+BLOB_STORAGE = os.environ.get('BLOB_STORAGE', 'sqlite')
+BLOB_STORE_DIR = os.environ.get('BLOB_STORE_DIR', 'blob_store')
+BLOB_CHUNK_SIZE = 1024 * 1024
+
+class _SQLiteBlobReader(io.RawIOBase):
+    """blobs.data бағанасын SQLite incremental BLOB I/O арқылы бөліктеп оқу"""
+
+    def __init__(self, db_path, rowid):
+        self._conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+        self._blob = self._conn.blobopen('blobs', 'data', rowid, readonly=True)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        chunk = self._blob.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    def close(self):
+        if not self.closed:
+            self._blob.close()
+            self._conn.close()
+        super().close()
+
+class SQLiteBlobBackend:
+    """Файл мазмұнын blobs.data бағанасында сақтау"""
+    name = 'sqlite'
+
+    def write(self, conn, sha256, data):
+        conn.execute(
+            "INSERT OR IGNORE INTO blobs (sha256, data, size, storage) VALUES (?, ?, ?, ?)",
+            (sha256, data, len(data), self.name)
+        )
+
+    def open(self, sha256, rowid):
+        return io.BufferedReader(_SQLiteBlobReader(DB_PATH, rowid), BLOB_CHUNK_SIZE)
+
+    def path(self, sha256):
+        return None
+
+    def remove(self, sha256):
+        pass
+
+class FileSystemBlobBackend:
+    """Файл мазмұнын дискіде ab/cd/<sha256> түріндегі бумаларда сақтау"""
+    name = 'filesystem'
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, sha256):
+        return self.root / sha256[:2] / sha256[2:4] / sha256
+
+    def write(self, conn, sha256, data):
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO blobs (sha256, data, size, storage) VALUES (?, NULL, ?, ?)",
+            (sha256, len(data), self.name)
+        )
+        path = self.path(sha256)
+        if cursor.rowcount == 0:
+            # Жол бұрыннан бар: файл тек жол дискіде сақталса және файлы жоғалса жазылады
+            # (мазмұны дерекқорда болса, дискідегі көшірмеге ешкім сілтемейді)
+            storage = conn.execute("SELECT storage FROM blobs WHERE sha256 = ?", (sha256,)).fetchone()[0]
+            if storage != self.name or path.exists():
+                return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Жартылай жазылған файл көрінбеуі үшін уақытша файл арқылы ауыстыру
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_file.name, path)
+        # Транзакция rollback болса, дискідегі blobs жолы жоқ файл қалмауы керек
+        get_connection_pool(DB_PATH).holder().after_rollback.append(
+            lambda: self.discard_if_unreferenced(sha256))
+
+    def discard_if_unreferenced(self, sha256):
+        """Дискіде сақталатын blobs жолы жоқ файлды өшіру (rollback болған транзакция жазған файл).
+
+        Жазу құлпы астында тексеріледі - осы уақытта басқа транзакция сол
+        хешті тіркеп, файлын жаза алмайды.
+        """
+        try:
+            with db_connection() as conn:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN IMMEDIATE")
+                if conn.execute(
+                    "SELECT 1 FROM blobs WHERE sha256 = ? AND storage = ?", (sha256, self.name)
+                ).fetchone() is None:
+                    self.remove(sha256)
+        except sqlite3.Error as e:
+            print(f"⚠️ Тіркелмеген blob файлын өшіру қатесі: {e}")
+
+    def open(self, sha256, rowid):
+        return open(self.path(sha256), 'rb', buffering=BLOB_CHUNK_SIZE)
+
+    def remove(self, sha256):
+        try:
+            self.path(sha256).unlink()
+        except FileNotFoundError:
+            pass
+
+BLOB_BACKENDS = {
+    SQLiteBlobBackend.name: SQLiteBlobBackend(),
+    FileSystemBlobBackend.name: FileSystemBlobBackend(BLOB_STORE_DIR),
+}
+
+def get_blob_backend(storage=None):
+    return BLOB_BACKENDS[storage or BLOB_STORAGE]
+
+def store_blob(conn, data, storage=None):
+    """Файл байттарын SHA-256 бойынша бір рет сақтап, кілтін қайтару.
+
+    Сілтеме санын кестелердегі триггерлер жүргізеді, сондықтан қайтарылған
+    хеш сол транзакцияда бір жолға жазылуы керек.
+    """
+    sha256 = _blob_sha256(data)
+    get_blob_backend(storage).write(conn, sha256, data)
+    return sha256
+
+def _get_blob_location(sha256):
+    with db_connection() as conn:
+        return conn.execute(
+            "SELECT rowid, storage FROM blobs WHERE sha256 = ?", (sha256,)
+        ).fetchone()
+
+def open_blob(sha256):
+    """Blob мазмұнын толық жадқа жүктемей оқуға арналған файл объектісі"""
+    location = _get_blob_location(sha256)
+    if location is None:
+        raise FileNotFoundError(sha256)
+    rowid, storage = location
+    return get_blob_backend(storage).open(sha256, rowid)
+
+def iter_blob_chunks(sha256, chunk_size=BLOB_CHUNK_SIZE):
+    """Blob мазмұнын chunk_size байттан бөліктеп беру"""
+    with open_blob(sha256) as reader:
+        while True:
+            chunk = reader.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+def read_blob(sha256):
+    """Кішкентай файлдар үшін бүкіл мазмұнды bytes ретінде алу"""
+    with open_blob(sha256) as reader:
+        return reader.read()
+
+def get_blob_media_source(sha256):
+    """st.video/st.audio үшін көз: дискідегі файлдың жолы немесе мазмұн байттары.
+
+    Streamlit медиа қоймасы екі жағдайда да файлды толық жадқа оқиды,
+    сондықтан мұнда ашық оқушы қайтарылмайды - оны ешкім жаппайды.
+    """
+    location = _get_blob_location(sha256)
+    if location is None:
+        return None
+    path = get_blob_backend(location[1]).path(sha256)
+    if path is not None:
+        return str(path)
+    return read_blob(sha256)
+
+def purge_deleted_blobs():
+    """Сілтемесі қалмаған blob файлдарын дискіден өшіру"""
+    with db_connection() as conn:
+        if not conn.execute("SELECT EXISTS (SELECT 1 FROM blob_trash)").fetchone()[0]:
+            return 0
+        # Жазу құлпы: осы уақытта сол хешпен жаңа blob тіркелмейді
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        trash = conn.execute("""
+            SELECT t.sha256, t.storage, b.sha256 IS NOT NULL
+            FROM blob_trash t LEFT JOIN blobs b ON b.sha256 = t.sha256
+        """).fetchall()
+        for sha256, storage, still_referenced in trash:
+            if not still_referenced:
+                get_blob_backend(storage).remove(sha256)
+            conn.execute("DELETE FROM blob_trash WHERE sha256 = ?", (sha256,))
+        return len(trash)
+
+def move_blobs(storage=None):
+    """Бар blob-тарды басқа сақтау орнына көшіру (мысалы, дерекқордан дискіге)"""
+    target = get_blob_backend(storage)
+    with db_connection() as conn:
+        rows = conn.execute(
+            "SELECT sha256 FROM blobs WHERE storage != ?", (target.name,)
+        ).fetchall()
+    moved = 0
+    for (sha256,) in rows:
+        data = read_blob(sha256)
+        with db_connection() as conn:
+            source = conn.execute("SELECT storage FROM blobs WHERE sha256 = ?", (sha256,)).fetchone()
+            if source is None:
+                continue
+            if target.name == 'filesystem':
+                # Алдымен жол дискіге аударылады - write файлды тек сонда жазады
+                conn.execute("UPDATE blobs SET data = NULL, storage = ? WHERE sha256 = ?", (target.name, sha256))
+                target.write(conn, sha256, data)
+            else:
+                conn.execute("UPDATE blobs SET data = ?, storage = ? WHERE sha256 = ?", (data, target.name, sha256))
+        # Ескі көшірме тек commit-тен кейін өшіріледі
+        get_blob_backend(source[0]).remove(sha256)
+        moved += 1
+    return moved
+
+# ============ МҰҒАЛІМ ФУНКЦИЯЛАРЫ ============
+def register_user(username, password, email, full_name, school, city):
+    # Хэш транзакциядан тыс есептеледі - жазу құлпын ұстамау үшін
+    hashed_password = hash_password(password)
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(
+                """INSERT INTO teachers (username, password, email, full_name, school, city) 
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                (username, hashed_password, email, full_name, school, city)
+            )
+            return True
+    except sqlite3.IntegrityError:
+        return False
+
+def login_user(username, password):
+    with db_connection() as conn:
+        c = conn.cursor()
+        c.execute(
+            """SELECT id, username, full_name, school, city, password FROM teachers 
+            WHERE username=?""",
+            (username,)
+        )
+        row = c.fetchone()
+    if not row or not verify_password(password, row[5]):
+        return None
+    
+    # Ескі хэшті келесі кіруде жаңа параметрлермен ауыстыру
+    if password_needs_rehash(row[5]):
+        with db_connection() as conn:
+            conn.execute("UPDATE teachers SET password = ? WHERE id = ? AND password = ?",
+                         (hash_password(password), row[0], row[5]))
+    return row[:5]
+
+@cached_query('teacher')
+def get_classes(teacher_id):
+    with db_connection() as conn:
+        c = conn.cursor()
+        c.execute("SELECT id, name, subject, grade_level FROM classes WHERE teacher_id = ? ORDER BY name", (teacher_id,))
+        classes = c.fetchall()
+        return classes
+
+def add_class(teacher_id, name, subject, grade_level, description):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(
+                """INSERT INTO classes (teacher_id, name, subject, grade_level, description) 
+                VALUES (?, ?, ?, ?, ?)""",
+                (teacher_id, name, subject, grade_level, description)
+            )
+            invalidate_query_cache(('teacher', teacher_id))
+            return True
+    except Exception as e:
+        print(f"❌ Сынып қосу қатесі: {e}")
+        return False
+
+def _class_teacher_id(c, class_id):
+    c.execute("SELECT teacher_id FROM classes WHERE id = ?", (class_id,))
+    row = c.fetchone()
+    return row[0] if row else None
+
+def delete_class(class_id):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            teacher_id = _class_teacher_id(c, class_id)
+            invalidate_query_cache(('class', class_id), ('teacher', teacher_id), ('teacher_students', teacher_id))
+            # foreign_keys=ON болғандықтан тәуелді жолдарды алдымен жою
+            c.execute("DELETE FROM student_tasks WHERE class_id = ? OR student_id IN (SELECT id FROM students WHERE class_id = ?)", (class_id, class_id))
+            c.execute("DELETE FROM student_logins WHERE student_id IN (SELECT id FROM students WHERE class_id = ?)", (class_id,))
+            c.execute("DELETE FROM students WHERE class_id = ?", (class_id,))
+            c.execute("DELETE FROM bzb_tasks WHERE class_id = ?", (class_id,))
+            c.execute("DELETE FROM lesson_plans WHERE class_id = ?", (class_id,))
+            c.execute("DELETE FROM classes WHERE id = ?", (class_id,))
+        purge_deleted_blobs()
+        return True
+    except Exception as e:
+        print(f"❌ Сыныпты жою қатесі: {e}")
+        return False
+
+@cached_query('class')
+def _load_students_by_class(class_id):
+    with db_connection() as conn:
+        c = conn.cursor()
+        c.execute("SELECT * FROM students WHERE class_id = ? ORDER BY full_name", (class_id,))
+        return c.fetchall()
+
+def get_students_by_class(class_id):
+    try:
+        return _load_students_by_class(class_id)
+    except Exception as e:
+        print(f"❌ Оқушыларды алу қатесі: {e}")
+        return []
+
+def add_student(class_id, full_name, student_code, grade_points, academic_performance):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            # grade_points мәнін санға түрлендіру
+            try:
+                if isinstance(grade_points, str):
+                    grade_points_int = int(float(grade_points.strip()))
+                else:
+                    grade_points_int = int(grade_points)
+            except (ValueError, TypeError):
+                grade_points_int = 5
+        
+            # Шектеулер
+            if grade_points_int < 1:
+                grade_points_int = 1
+            elif grade_points_int > 10:
+                grade_points_int = 10
+        
+            if not academic_performance:
+                academic_performance = "Орташа"
+        
+            # Оқушыны қосу
+            c.execute(
+                """INSERT INTO students (class_id, full_name, student_code, grade_points, academic_performance) 
+                VALUES (?, ?, ?, ?, ?)""",
+                (class_id, full_name, student_code, grade_points_int, academic_performance)
+            )
+            invalidate_query_cache(('class', class_id), ('teacher_students', _class_teacher_id(c, class_id)))
+            return True
+    except sqlite3.IntegrityError as e:
+        print(f"❌ Оқушы қосу қатесі (интеграция): {e}")
+        return False
+    except Exception as e:
+        print(f"❌ Оқушы қосу қатесі: {e}")
+        return False
+
+def delete_student(student_id):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute("SELECT class_id FROM students WHERE id = ?", (student_id,))
+            student = c.fetchone()
+            if student:
+                invalidate_query_cache(('class', student[0]), ('teacher_students', _class_teacher_id(c, student[0])))
+            # foreign_keys=ON болғандықтан тәуелді жолдарды алдымен жою
+            c.execute("DELETE FROM student_tasks WHERE student_id = ?", (student_id,))
+            c.execute("DELETE FROM student_logins WHERE student_id = ?", (student_id,))
+            c.execute("DELETE FROM students WHERE id = ?", (student_id,))
+        purge_deleted_blobs()
+        return True
+    except Exception as e:
+        print(f"❌ Оқушыны жою қатесі: {e}")
+        return False
+
+# ============ ОҚУШЫЛАРДЫ ИМПОРТТАУ ============
+STUDENT_IMPORT_REQUIRED_COLUMNS = ['full_name', 'student_code']
+STUDENT_IMPORT_COLUMNS = ['full_name', 'student_code', 'grade_points', 'academic_performance']
+# Үлкен файлдар осы өлшемдегі бөліктермен оқылып, әр бөлік жеке транзакцияда жазылады
+ROSTER_IMPORT_CHUNK_SIZE = 2000
+ROSTER_IMPORT_PREVIEW_ROWS = 20
+ROSTER_IMPORT_MAX_ERRORS = 1000
+
+def _roster_text_column(df, name):
+    """Мәтіндік бағанды бос жолдарға дейін тазалау (Excel 1001.0 кодын 1001 етеді)"""
+    import pandas as pd
+    if name not in df.columns:
+        return pd.Series('', index=df.index, dtype='string')
+    values = df[name]
+    if pd.api.types.is_float_dtype(values) and (values.dropna() % 1 == 0).all():
+        values = values.astype('Int64')
+    return values.astype('string').str.strip().fillna('')
+
+def validate_student_roster(df, seen_codes=None, class_id=None, class_ids=None):
+    """Оқушылар кестесін бір векторлық өтуде тексеру және қалыпқа келтіру.
+
+    (rows, errors) қайтарады. rows - Excel жол нөмірі (row), class_name, class_id
+    және STUDENT_IMPORT_COLUMNS бағандары, errors - row, student_code, error.
+    Жол нөмірі df индексінен алынады (бөліктер үшін индекс ығысуымен).
+    grade_points add_student-тегідей: сан емес болса 5, 1..10 аралығына қысылады.
+    class_ids ({сынып атауы: id}) берілсе, class_name бағаны толтырылған жолдар
+    сол сыныпқа, бос жолдар class_id сыныбына жатады; табылмаған сынып - қате.
+    seen_codes - алдыңғы бөліктердегі кодтар, қабылданған жолдардың кодтары
+    осы жиынға қосылады.
+    """
+    import numpy as np
+    import pandas as pd
+    missing = [column for column in STUDENT_IMPORT_REQUIRED_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"Файлда міндетті бағандар жоқ: {', '.join(missing)}")
+
+    grade_points = pd.to_numeric(_roster_text_column(df, 'grade_points'), errors='coerce')
+    academic_performance = _roster_text_column(df, 'academic_performance')
+    rows = pd.DataFrame({
+        'row': df.index + 2,  # 1-жол - бағандар атауы
+        'class_name': _roster_text_column(df, 'class_name'),
+        'full_name': _roster_text_column(df, 'full_name'),
+        'student_code': _roster_text_column(df, 'student_code'),
+        'grade_points': np.trunc(grade_points.fillna(5)).clip(1, 10).astype(int),
+        'academic_performance': academic_performance.mask(academic_performance == '', 'Орташа'),
+    }).reset_index(drop=True)
+
+    if class_ids is None:
+        rows['class_id'] = class_id
+        unknown_class = pd.Series(False, index=rows.index)
+    else:
+        rows['class_id'] = rows['class_name'].map(class_ids).mask(rows['class_name'] == '', class_id)
+        unknown_class = rows['class_id'].isna()
+
+    # Қайталану тек басқа тексерулерден өткен жолдар арасында - қабылданбайтын
+    # жолдың коды кейінгі дұрыс жолды бұғаттамауы керек
+    valid = (rows['full_name'] != '') & (rows['student_code'] != '') & ~unknown_class
+    duplicated = rows['student_code'].where(valid).duplicated() & valid
+    if seen_codes:
+        # isin() өскен жиынды әр бөлікте қайта түрлендіреді - бөлік өлшеміндегі тексеру
+        duplicated |= np.fromiter(map(seen_codes.__contains__, rows['student_code']), bool, len(rows)) & valid
+    error = np.select(
+        [rows['full_name'] == '', rows['student_code'] == '', unknown_class, duplicated],
+        ["Аты-жөні бос", "Оқушы коды бос", "Сынып табылмады (атауы бірегей болуы керек)",
+         "Код файлда қайталанады"],
+        default=''
+    )
+    rejected = error != ''
+    errors = rows.loc[rejected, ['row', 'student_code']].assign(error=error[rejected])
+    rows = rows[~rejected]
+    if class_ids is not None:
+        rows = rows.astype({'class_id': int})
+    if seen_codes is not None:
+        seen_codes.update(rows['student_code'])
+    return rows, errors
+
+def import_students(class_id, df, dry_run=False, class_ids=None, seen_codes=None):
+    """Оқушыларды бір транзакцияда executemany арқылы қосу.
+
+    Сынып сәйкестендіру мен тексеру validate_student_roster-де (class_ids сонда).
+    dry_run=True болса дерекқор өзгермейді - тек не қосылатыны мен не
+    қабылданбайтыны көрсетіледі. {'rows', 'errors', 'inserted'} қайтарады.
+    """
+    import pandas as pd
+    rows, errors = validate_student_roster(df, seen_codes, class_id, class_ids)
+    rejected = [errors]
+
+    with db_connection() as conn:
+        if not dry_run and not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        c = conn.cursor()
+        # student_code бүкіл мектеп бойынша бірегей
+        c.execute(
+            "SELECT student_code FROM students WHERE student_code IN (SELECT value FROM json_each(?))",
+            (json.dumps(rows['student_code'].tolist()),)
+        )
+        existing = rows['student_code'].isin([row[0] for row in c.fetchall()])
+        rejected.append(rows.loc[existing, ['row', 'student_code']].assign(error="Бұл код дерекқорда бар"))
+        rows = rows[~existing].reset_index(drop=True)
+
+        if not dry_run and len(rows):
+            c.executemany(
+                """INSERT INTO students (class_id, full_name, student_code, grade_points, academic_performance)
+                VALUES (?, ?, ?, ?, ?)""",
+                zip(*(rows[column].tolist() for column in ['class_id'] + STUDENT_IMPORT_COLUMNS))
+            )
+            for target_class_id in rows['class_id'].unique().tolist():
+                invalidate_query_cache(('class', target_class_id),
+                                       ('teacher_students', _class_teacher_id(c, target_class_id)))
+
+    errors = pd.concat(rejected).sort_values('row', ignore_index=True)
+    return {'rows': rows, 'errors': errors, 'inserted': 0 if dry_run else len(rows)}
+
+def iter_roster_chunks(uploaded_file, chunk_size=ROSTER_IMPORT_CHUNK_SIZE):
+    """Excel (openpyxl read-only) немесе CSV файлын бөліктермен оқу.
+
+    (chunk, оқылған жолдар, барлық жолдар немесе None) кортеждерін береді.
+    Бүкіл файл жадқа жүктелмейді. chunk индексі файлдағы жол ретімен жалғасады.
+    """
+    import pandas as pd
+    if uploaded_file.name.lower().endswith('.csv'):
+        uploaded_file.seek(0)
+        done = 0
+        for chunk in pd.read_csv(uploaded_file, chunksize=chunk_size, dtype=str, keep_default_na=False):
+            done += len(chunk)
+            yield chunk, done, None
+        return
+
+    if not OPENPYXL_AVAILABLE:
+        raise ValueError("Excel файлдарын оқу үшін openpyxl орнатыңыз немесе CSV жүктеңіз")
+    from openpyxl import load_workbook
+    uploaded_file.seek(0)
+    workbook = load_workbook(uploaded_file, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        # read_only режимінде max_row файл өлшемдерінен алынады және болмауы мүмкін
+        total = sheet.max_row - 1 if sheet.max_row else None
+        values = sheet.iter_rows(values_only=True)
+        header = [str(name).strip() if name is not None else '' for name in next(values, ())]
+        done = 0
+        while True:
+            batch = [row for _, row in zip(range(chunk_size), values)]
+            if not batch:
+                break
+            chunk = pd.DataFrame.from_records(batch, columns=header, index=range(done, done + len(batch)))
+            done += len(batch)
+            # Бос аяқталатын жолдар (тек пішімі бар ұяшықтар)
+            yield chunk.dropna(how='all'), done, total
+    finally:
+        workbook.close()
+
+def import_students_streaming(uploaded_file, class_id, teacher_id=None, dry_run=False,
+                              chunk_size=ROSTER_IMPORT_CHUNK_SIZE, progress=None):
+    """Үлкен файлды бөліктермен импорттау - жад файл өлшеміне тәуелсіз.
+
+    Әр бөлік жеке транзакцияда жазылады. teacher_id берілсе, class_name
+    бағаны мұғалімнің сыныптарына атауы бойынша сәйкестендіріледі.
+    progress(оқылған жолдар, барлық жолдар немесе None) әр бөліктен кейін шақырылады.
+    Қателер мен алдын ала көрініс ROSTER_IMPORT_MAX_ERRORS/PREVIEW_ROWS жолмен шектеледі.
+    """
+    import pandas as pd
+    class_ids = None
+    if teacher_id is not None:
+        classes = get_classes(teacher_id)
+        # Атауы қайталанатын сыныптарға атау бойынша сәйкестендіру мүмкін емес
+        names = Counter(class_item[1] for class_item in classes)
+        class_ids = {class_item[1]: class_item[0] for class_item in classes if names[class_item[1]] == 1}
+
+    seen_codes = set()
+    result = {'rows': [], 'errors': [], 'accepted': 0, 'rejected': 0, 'inserted': 0, 'read': 0}
+    for chunk, done, total in iter_roster_chunks(uploaded_file, chunk_size):
+        chunk_result = import_students(class_id, chunk, dry_run, class_ids, seen_codes)
+        result['accepted'] += len(chunk_result['rows'])
+        result['rejected'] += len(chunk_result['errors'])
+        result['inserted'] += chunk_result['inserted']
+        result['read'] = done
+        shown_rows = sum(len(rows) for rows in result['rows'])
+        if shown_rows < ROSTER_IMPORT_PREVIEW_ROWS:
+            result['rows'].append(chunk_result['rows'].head(ROSTER_IMPORT_PREVIEW_ROWS - shown_rows))
+        shown_errors = sum(len(errors) for errors in result['errors'])
+        if shown_errors < ROSTER_IMPORT_MAX_ERRORS:
+            result['errors'].append(chunk_result['errors'].head(ROSTER_IMPORT_MAX_ERRORS - shown_errors))
+        if progress:
+            progress(done, total)
+
+    result['rows'] = pd.concat(result['rows'], ignore_index=True) if result['rows'] else pd.DataFrame()
+    result['errors'] = pd.concat(result['errors'], ignore_index=True) if result['errors'] else pd.DataFrame()
+    return result
+
+# Баға әріптері: балл >= 9 - A, >= 7 - B, >= 5 - C, >= 3 - D, қалғаны F (points_to_grade сияқты)
+GRADE_LETTERS = ['A', 'B', 'C', 'D', 'F']
+GRADE_BINS = [float('-inf'), 3, 5, 7, 9, float('inf')]
+ROSTER_DTYPES = {'class': 'string', 'name': 'string', 'code': 'string', 'points': 'int64', 'performance': 'string'}
+
+@cached_query('teacher_students')
+def get_teacher_roster(teacher_id):
+    """Мұғалімнің барлық оқушылары сынып атауымен - бір сұраныс, типтелген DataFrame"""
+    import pandas as pd
+    with db_connection() as conn:
+        # CAST мәтіннің бастапқы сан бөлігін алады: '7.5' -> 7, '7а' -> 7, сан емес -> 0.
+        # Бұрынғы int() мәтіндік '7.5'-ке қате беріп, 0 қоятын еді; add_student
+        # бүтін сан жазатындықтан, айырма тек ескі мәтіндік мәндерде ғана
+        roster = pd.read_sql(
+            """SELECT cl.name AS class, s.full_name AS name, s.student_code AS code,
+                      CAST(IFNULL(s.grade_points, 0) AS INTEGER) AS points,
+                      IFNULL(s.academic_performance, 'Орташа') AS performance
+               FROM classes cl
+               JOIN students s ON s.class_id = cl.id
+               WHERE cl.teacher_id = ?
+               ORDER BY cl.name, s.full_name""",
+            conn, params=(teacher_id,), dtype=ROSTER_DTYPES
+        )
+    roster['grade'] = pd.cut(
+        roster['points'], bins=GRADE_BINS, right=False, labels=GRADE_LETTERS[::-1]
+    ).astype(pd.CategoricalDtype(GRADE_LETTERS, ordered=True))
+    return roster
+
+def register_student_login(student_id, username, password):
+    hashed_password = hash_password(password)
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute("SELECT id FROM students WHERE id = ?", (student_id,))
+            if not c.fetchone():
+                return False, "Оқушы табылмады"
+        
+            c.execute("SELECT id FROM student_logins WHERE username = ?", (username,))
+            if c.fetchone():
+                return False, "Бұл логин бос емес"
+        
+            c.execute("SELECT id FROM student_logins WHERE student_id = ?", (student_id,))
+            if c.fetchone():
+                return False, "Оқушыда логин бар"
+        
+            c.execute(
+                """INSERT INTO student_logins (student_id, username, password) 
+                VALUES (?, ?, ?)""",
+                (student_id, username, hashed_password)
+            )
+            return True, "Сәтті тіркелді"
+    except sqlite3.IntegrityError as e:
+        return False, f"Дерекқор қатесі: {str(e)}"
+    except Exception as e:
+        return False, f"Қате: {str(e)}"
+
+def generate_student_logins(teacher_id, class_id=None):
+    """Логині жоқ барлық оқушыларға (сыныптың немесе мұғалімнің) логин құру.
+
+    Тексерулер бір сұраныста, жазу бір транзакцияда executemany арқылы.
+    Хэштер транзакцияға дейін пулда қатар есептеледі; арада басқа сессия
+    логин құрып үлгерсе, ол жол өткізіліп, skipped тізіміне түседі.
+    Логин - student_<код>; ол бос емес болса немесе топтағы басқа оқушыда
+    да сондай болса (код 2 және коды жоқ id 2) - student_<код>_<id>.
+    (credentials, skipped) DataFrame-дерін қайтарады - құпия сөздер тек
+    credentials ішінде ашық түрде болады.
+    """
+    import pandas as pd
+    credential_columns = ['Сынып', 'Оқушы', 'Оқушы коды', 'Логин', 'Құпия сөз']
+    skipped_columns = credential_columns[:-1]
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(f'''
+                WITH candidates AS (
+                    SELECT s.id, cl.name AS class_name, s.full_name, s.student_code,
+                           'student_' || CASE WHEN IFNULL(s.student_code, '') = ''
+                                              THEN s.id ELSE s.student_code END AS username
+                    FROM students s
+                    JOIN classes cl ON cl.id = s.class_id
+                    WHERE cl.teacher_id = ? {"AND cl.id = ?" if class_id is not None else ""}
+                      AND NOT EXISTS (SELECT 1 FROM student_logins sl WHERE sl.student_id = s.id)
+                ),
+                ranked AS (
+                    SELECT id, class_name, full_name, student_code, username,
+                           ROW_NUMBER() OVER (PARTITION BY username ORDER BY id) AS username_rank
+                    FROM candidates
+                )
+                SELECT id, class_name, full_name, student_code,
+                       CASE WHEN username_rank > 1
+                                 OR EXISTS (SELECT 1 FROM student_logins WHERE username = ranked.username)
+                            THEN username || '_' || id ELSE username END AS username
+                FROM ranked
+                ORDER BY class_name, full_name
+            ''', (teacher_id,) if class_id is None else (teacher_id, class_id))
+            students = c.fetchall()
+        
+        passwords = [generate_random_password() for _ in students]
+        hashed_passwords = hash_passwords(passwords)
+        with db_connection() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            c = conn.cursor()
+            c.executemany(
+                """INSERT INTO student_logins (student_id, username, password)
+                SELECT ?, ?, ? WHERE NOT EXISTS (
+                    SELECT 1 FROM student_logins WHERE student_id = ? OR username = ?
+                )""",
+                [(student[0], student[4], hashed, student[0], student[4])
+                 for student, hashed in zip(students, hashed_passwords)]
+            )
+            # Хэш тұзы әр жолда бөлек - сақталған хэш біздікі болса, логинді осы шақыру құрды
+            c.execute(
+                "SELECT student_id, password FROM student_logins WHERE student_id IN (SELECT value FROM json_each(?))",
+                (json.dumps([student[0] for student in students]),)
+            )
+            stored_hashes = dict(c.fetchall())
+        
+        credentials, skipped = [], []
+        for (student_id, class_name, full_name, student_code, username), password, hashed in \
+                zip(students, passwords, hashed_passwords):
+            if stored_hashes.get(student_id) == hashed:
+                credentials.append((class_name, full_name, student_code, username, password))
+            else:
+                skipped.append((class_name, full_name, student_code, username))
+        return (pd.DataFrame(credentials, columns=credential_columns),
+                pd.DataFrame(skipped, columns=skipped_columns))
+    except Exception as e:
+        print(f"❌ Логиндерді құру қатесі: {e}")
+        traceback.print_exc()
+        return pd.DataFrame(columns=credential_columns), pd.DataFrame(columns=skipped_columns)
+
+def build_credentials_sheet(credentials):
+    """Тіркелгі деректерін Excel файлына (openpyxl жоқ болса CSV) жазу: (bytes, атауы, mime)"""
+    if OPENPYXL_AVAILABLE:
+        buffer = io.BytesIO()
+        credentials.to_excel(buffer, index=False, sheet_name="Логиндер")
+        return (buffer.getvalue(), "student_logins.xlsx",
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+    # utf-8-sig - Excel кириллицаны дұрыс ашуы үшін
+    return credentials.to_csv(index=False).encode('utf-8-sig'), "student_logins.csv", "text/csv"
+
+def get_student_logins(student_id):
+    with db_connection() as conn:
+        c = conn.cursor()
+        c.execute("SELECT id, username FROM student_logins WHERE student_id = ?", (student_id,))
+        logins = c.fetchall()
+        return logins
+
+def update_student_password(login_id, new_password):
+    hashed_password = hash_password(new_password)
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(
+                "UPDATE student_logins SET password = ? WHERE id = ?",
+                (hashed_password, login_id)
+            )
+            return True
+    except Exception as e:
+        print(f"❌ Құпия сөзді өзгерту қатесі: {e}")
+        return False
+
+def delete_student_login(login_id):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute("DELETE FROM student_logins WHERE id = ?", (login_id,))
+            return True
+    except Exception as e:
+        print(f"❌ Логинды жою қатесі: {e}")
+        return False
+
+def save_file_to_db(teacher_id, file_name, file_data, category):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            file_bytes = file_data.read()
+            file_type = file_data.type
+            file_hash = store_blob(conn, file_bytes)
+            c.execute(
+                """INSERT INTO visual_materials 
+                (teacher_id, file_name, file_hash, file_type, file_size, category) 
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                (teacher_id, file_name, file_hash, file_type, len(file_bytes), category)
+            )
+            return True
+    except Exception as e:
+        print(f"❌ Файлды сақтау қатесі: {e}")
+        return False
+
+def get_saved_files(teacher_id):
+    """Материалдар тізімі - тек метадеректер, файл мазмұны қажет кезде read_blob арқылы алынады"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(
+                """SELECT id, file_name, file_type, file_size, 
+                          category, upload_date, file_hash
+                   FROM visual_materials 
+                   WHERE teacher_id = ? 
+                   ORDER BY upload_date DESC""",
+                (teacher_id,)
+            )
+        
+            files = []
+            for row in c.fetchall():
+                files.append({
+                    'id': row[0],
+                    'name': row[1],
+                    'type': row[2],
+                    'size': f"{row[3]} байт",
+                    'category': row[4],
+                    'uploaded': row[5],
+                    'sha256': row[6]
+                })
+            return files
+    except Exception as e:
+        print(f"❌ Файлдарды алу қатесі: {e}")
+        return []
+
+def delete_file(file_id):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute("DELETE FROM visual_materials WHERE id = ?", (file_id,))
+        purge_deleted_blobs()
+        return True
+    except Exception as e:
+        print(f"❌ Файлды жою қатесі: {e}")
+        return False
+
+def get_visual_material(file_id):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(
+                """SELECT file_name, file_hash, file_type, file_size 
+                   FROM visual_materials 
+                   WHERE id = ?""",
+                (file_id,)
+            )
+            file = c.fetchone()
+            if file:
+                return {
+                    'name': file[0],
+                    'sha256': file[1],
+                    'type': file[2],
+                    'size': file[3]
+                }
+            return None
+    except Exception as e:
+        print(f"❌ Файлды алу қатесі: {e}")
+        return None
+
+def save_bzb_task(teacher_id, class_id, task_name, task_file, file_type, completion_rate, difficulty_level):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            file_bytes = task_file.read()
+            file_hash = store_blob(conn, file_bytes)
+            ai_solution = generate_ai_solution(completion_rate, difficulty_level)
+            c.execute(
+                """INSERT INTO bzb_tasks 
+                (teacher_id, class_id, task_name, file_hash, file_type, completion_rate, difficulty_level, ai_solution) 
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (teacher_id, class_id, task_name, file_hash, file_type, completion_rate, difficulty_level, ai_solution)
+            )
+            return True
+    except Exception as e:
+        print(f"❌ БЖБ тапсырмасын сақтау қатесі: {e}")
+        return False
+
+def generate_ai_solution(completion_rate, difficulty_level):
+    solutions = {
+        "Оңай": {
+            "low": "• Қарапайым түсініктемелер\n• Қадамдық нұсқаулар\n• Мысалдар келтіру",
+            "medium": "• Толық түсіндірме\n• Формулаларды түсіндіру\n• Практикалық мысалдар",
+            "high": "• Талдау және шешім\n• Баламалы тәсілдер\n• Түбіне дейін зерттеу"
+        },
+        "Орташа": {
+            "low": "• Негізгі түсініктемелер\n• Қадам-қалам нұсқау\n• Жеңілдетілген тәсіл",
+            "medium": "• Толық талдау\n• Формулалар мен ережелер\n• Мысалдармен түсіндіру",
+            "high": "• Кешенді түсініктеме\n• Ғылыми тәсілдер\n• Қосымша ресурстар"
+        },
+        "Қиын": {
+            "low": "• Негізгі тұжырымдар\n• Бастапқы тәсілдер\n• Мысалдармен түсіндіру",
+            "medium": "• Терең талдау\n• Күрделі формулалар\n• Көп деңгейлі шешімдер",
+            "high": "• Зерттеу және талдау\n• Инновациялық тәсілдер\n• Ғылыми негіздеу"
+        }
+    }
+    
+    if completion_rate < 30:
+        level = "low"
+    elif completion_rate < 70:
+        level = "medium"
+    else:
+        level = "high"
+    
+    return solutions.get(difficulty_level, {}).get(level, "Шешім табылмады")
+
+def get_bzb_tasks(teacher_id):
+    """БЖБ тізімі - тек метадеректер, файл мазмұны қажет кезде read_blob арқылы алынады"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute("""
+            SELECT b.id, b.task_name, b.file_type, b.upload_date, 
+                   b.completion_rate, b.difficulty_level, b.ai_solution,
+                   c.name as class_name, b.file_hash
+            FROM bzb_tasks b
+            JOIN classes c ON b.class_id = c.id
+            WHERE b.teacher_id = ?
+            ORDER BY b.upload_date DESC
+            """, (teacher_id,))
+        
+            tasks = []
+            for row in c.fetchall():
+                tasks.append({
+                    'id': row[0],
+                    'name': row[1],
+                    'type': row[2],
+                    'uploaded': row[3],
+                    'rate': row[4],
+                    'difficulty': row[5],
+                    'ai_solution': row[6],
+                    'class_name': row[7],
+                    'sha256': row[8]
+                })
+            return tasks
+    except Exception as e:
+        print(f"❌ БЖБ тапсырмаларын алу қатесі: {e}")
+        return []
+
+def get_bzb_task(task_id):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(
+                """SELECT task_name, file_hash, file_type, ai_solution
+                   FROM bzb_tasks 
+                   WHERE id = ?""",
+                (task_id,)
+            )
+            task = c.fetchone()
+            if task:
+                return {
+                    'name': task[0],
+                    'sha256': task[1],
+                    'type': task[2],
+                    'ai_solution': task[3]
+                }
+            return None
+    except Exception as e:
+        print(f"❌ БЖБ тапсырмасын алу қатесі: {e}")
+        return None
+
+def delete_bzb_task(task_id):
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute("DELETE FROM bzb_tasks WHERE id = ?", (task_id,))
+        purge_deleted_blobs()
+        return True
+    except Exception as e:
+        print(f"❌ БЖБ тапсырмасын жою қатесі: {e}")
+        return False
+
+@cached_query('teacher')
+def get_class_count(teacher_id):
+    with db_connection() as conn:
+        c = conn.cursor()
+        c.execute("SELECT COUNT(*) FROM classes WHERE teacher_id=?", (teacher_id,))
+        count = c.fetchone()[0]
+        return count
+
+@cached_query('teacher_students')
+def get_student_count(teacher_id):
+    with db_connection() as conn:
+        c = conn.cursor()
+        c.execute("""SELECT COUNT(*) FROM students s 
+                     JOIN classes c ON s.class_id = c.id 
+                     WHERE c.teacher_id=?""", (teacher_id,))
+        count = c.fetchone()[0]
+        return count
+
+# ============ БІРІКТІРІЛГЕН ТАПСЫРМА ФУНКЦИЯЛАРЫ (ТҮЗЕТІЛГЕН) ============
+
+def save_unified_student_task(teacher_id, student_id, class_id, task_data):
+    """Жаңа тапсырманы сақтау - ФАЙЛДАР МЕН БІРГЕ"""
+    results = assign_unified_task_bulk(teacher_id, task_data, student_ids=[student_id])
+    _, _, success, message = results[0]
+    return success, message
+
+def assign_unified_task_bulk(teacher_id, task_data, student_ids=None, class_ids=None):
+    """Бір тапсырманы көп оқушыға бір транзакцияда беру.
+
+    student_ids және/немесе class_ids (бүкіл сынып) бойынша оқушылар бір
+    сұраныспен анықталады, файл бір рет оқылып сақталады, барлық жолдар
+    executemany арқылы енгізіледі. Әр оқушы үшін
+    (student_id, student_name, success, message) қайтарылады.
+    """
+    student_ids = list(dict.fromkeys(student_ids or []))
+    class_ids = list(dict.fromkeys(class_ids or []))
+    if not student_ids and not class_ids:
+        return []
+    
+    try:
+        # Файлды бір рет оқу - барлық оқушыға бірдей мазмұн
+        task_file = task_data.get('task_file')
+        file_bytes = None
+        file_type = None
+        file_name = None
+        file_size = 0
+    
+        if task_file and hasattr(task_file, 'read'):
+            if hasattr(task_file, 'seek'):
+                task_file.seek(0)
+            file_bytes = task_file.read()
+            file_type = task_file.type
+            file_name = task_file.name
+            file_size = len(file_bytes)
+    
+        with db_connection() as conn:
+            c = conn.cursor()
+            # Мұғалім, оқушы және сынып аттарын бір сұраныспен алу
+            conditions = []
+            params = [teacher_id, teacher_id]
+            if student_ids:
+                conditions.append(f"s.id IN ({','.join('?' * len(student_ids))})")
+                params.extend(student_ids)
+            if class_ids:
+                conditions.append(f"s.class_id IN ({','.join('?' * len(class_ids))})")
+                params.extend(class_ids)
+            c.execute(f"""
+                SELECT s.id, s.full_name, s.class_id, cl.name,
+                       (SELECT full_name FROM teachers WHERE id = ?)
+                FROM students s
+                JOIN classes cl ON s.class_id = cl.id
+                WHERE cl.teacher_id = ? AND ({' OR '.join(conditions)})
+                ORDER BY cl.name, s.full_name
+            """, params)
+            students = c.fetchall()
+        
+            found_ids = {row[0] for row in students}
+            missing = [(sid, None, False, "Оқушы табылмады") for sid in student_ids if sid not in found_ids]
+            if not students:
+                return missing
+        
+            file_hash = store_blob(conn, file_bytes) if file_bytes is not None else None
+        
+            rows = []
+            for student_id, student_name, class_id, class_name, teacher_name in students:
+                rows.append((
+                    teacher_id,
+                    student_id,
+                    class_id,
+                    task_data.get('task_name'),
+                    task_data.get('task_description'),
+                    file_hash,
+                    file_type,
+                    file_name,
+                    file_size,
+                    teacher_name or "Мұғалім",
+                    student_name,
+                    class_name,
+                    task_data.get('due_date'),
+                    task_data.get('points', 10),
+                    'Тағайындалды',
+                    task_data.get('tags'),
+                    task_data.get('difficulty', 'Орташа')
+                ))
+        
+            c.executemany('''
+                INSERT INTO student_tasks 
+                (teacher_id, student_id, class_id, task_name, task_description, 
+                 task_file_hash, task_file_type, task_file_name, task_file_size,
+                 teacher_name, student_name, class_name, due_date, points, 
+                 status, tags, difficulty)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+        
+        saved = [(row[0], row[1], True, "✅ Тапсырма сәтті сақталды!") for row in students]
+        return saved + missing
+    except Exception as e:
+        print(f"❌ Тапсырма сақтау қатесі: {e}")
+        traceback.print_exc()
+        return [(sid, None, False, f"Қате: {str(e)}") for sid in student_ids or [None]]
+
+# student_tasks-тен тікелей оқылатын бағандар (TaskRecord өрістерінің реті осыған сәйкес)
+TASK_RECORD_COLUMNS = (
+    'id', 'task_name', 'task_description', 'due_date',
+    'points', 'status', 'assigned_date', 'teacher_feedback',
+    'student_answer_text', 'student_submitted_date', 'score',
+    'student_name', 'class_name', 'teacher_name',
+    'task_file_type', 'task_file_name', 'task_file_size',
+    'student_answer_file_type', 'student_answer_file_name', 'student_answer_file_size',
+    'task_file_hash', 'student_answer_file_hash',
+    'tags', 'difficulty', 'display_status'
+)
+# SQL-де есептелетін өрістер: даталар strftime/julianday арқылы, бүгінгі күн бір рет
+TASK_RECORD_EXPRESSIONS = {
+    'due_date_formatted': "IFNULL(strftime('%d.%m.%Y', st.due_date), st.due_date)",
+    'assigned_date_formatted': "IFNULL(strftime('%d.%m.%Y %H:%M', st.assigned_date), st.assigned_date)",
+    'student_submitted_date_formatted': (
+        "IFNULL(strftime('%d.%m.%Y %H:%M', st.student_submitted_date), st.student_submitted_date)"
+    ),
+    'days_left': f"CAST(ABS(ROUND(julianday(st.due_date) - julianday({TODAY_SQL}))) AS INTEGER)",
+}
+UNIFIED_TASK_COLUMNS = ", ".join(
+    [f"st.{column}" for column in TASK_RECORD_COLUMNS] +
+    [f"{expression} AS {name}" for name, expression in TASK_RECORD_EXPRESSIONS.items()]
+)
+UNIFIED_TASK_SELECT = f"SELECT {UNIFIED_TASK_COLUMNS} FROM student_tasks st"
+# FTS5 сәйкестіктері: rank - bm25 бағасы (кіші мән = сәйкесірек)
+UNIFIED_TASK_SEARCH_SELECT = f"""
+    SELECT {UNIFIED_TASK_COLUMNS}, student_tasks_fts.rank AS search_rank
+    FROM student_tasks_fts JOIN student_tasks st ON st.id = student_tasks_fts.rowid
+"""
+
+DISPLAY_STATUS_RANK = {'Кешікті': 1, 'Тағайындалды': 2, 'Жіберілді': 3, 'Тексерілді': 4}
+DISPLAY_STATUS_ORDER = "CASE display_status " + " ".join(
+    f"WHEN '{status}' THEN {rank}" for status, rank in DISPLAY_STATUS_RANK.items()
+) + " ELSE 5 END"
+
+class TaskRecord(namedtuple('TaskRecord', TASK_RECORD_COLUMNS + tuple(TASK_RECORD_EXPRESSIONS) + ('search_rank',),
+                            defaults=(None,))):
+    """Тапсырма жолы - кортеж негізіндегі жинақы жазба.
+
+    Жол бойы dict құрылмайды: өрістер атрибут ретінде оқылады (task.task_name),
+    ал туынды өрістер тек сұралғанда есептеледі. search_rank тек іздеу
+    сұраныстарында болады.
+    """
+    __slots__ = ()
+
+    @property
+    def is_overdue(self):
+        # Статус дерекқорда сақталған (sweep_overdue_tasks)
+        return self.display_status == 'Кешікті'
+
+    @property
+    def task_file_size_str(self):
+        return get_file_size_str(self.task_file_size) if self.task_file_size else None
+
+    @property
+    def student_answer_file_size_str(self):
+        if self.student_answer_file_size:
+            return get_file_size_str(self.student_answer_file_size)
+        return None
+
+    @property
+    def task_file(self):
+        """Файл метадеректері - тізім үшін бөлек сұраныс қажет емес"""
+        return build_task_file_info(
+            self.task_file_hash, self.task_file_type,
+            self.task_file_name, self.task_name, 'task'
+        )
+
+    @property
+    def answer_file(self):
+        return build_task_file_info(
+            self.student_answer_file_hash, self.student_answer_file_type,
+            self.student_answer_file_name, self.task_name, 'answer'
+        )
+
+def _fetch_unified_tasks(c):
+    return [TaskRecord(*row) for row in c.fetchall()]
+
+def get_unified_student_tasks_by_teacher(teacher_id):
+    """Мұғалім берген барлық тапсырмалар - ФАЙЛ АҚПАРАТЫМЕН"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(UNIFIED_TASK_SELECT + f'''
+                WHERE st.teacher_id = ?
+                ORDER BY {DISPLAY_STATUS_ORDER}, st.due_date ASC, st.assigned_date DESC
+            ''', (teacher_id,))
+            return _fetch_unified_tasks(c)
+    except Exception as e:
+        print(f"❌ Тапсырмаларды алу қатесі: {e}")
+        traceback.print_exc()
+        return []
+
+# Сұрыптау түрі -> (SQL кілт өрнектері, жолдан курсор құратын функция); соңғы кілт әрқашан id
+TASK_SORT_KEYS = {
+    "Мерзім": (
+        ["IFNULL(st.due_date, '')", "st.id"],
+        lambda task: [task.due_date or '', task.id]
+    ),
+    "Оқушы": (
+        ["IFNULL(st.student_name, '')", "st.id"],
+        lambda task: [task.student_name or '', task.id]
+    ),
+    "Статус": (
+        [DISPLAY_STATUS_ORDER, "IFNULL(st.due_date, '')", "st.id"],
+        lambda task: [DISPLAY_STATUS_RANK.get(task.display_status, 5), task.due_date or '', task.id]
+    ),
+    # Тек іздеу кезінде: FTS5 bm25 бағасы бойынша
+    "Сәйкестік": (
+        ["student_tasks_fts.rank", "st.id"],
+        lambda task: [task.search_rank, task.id]
+    ),
+}
+TASK_PAGE_SIZE = 25
+
+@st.cache_resource(show_spinner=False)
+def task_search_uses_fts(db_path=DB_PATH):
+    """FTS5 индексі бар ма (жоқ болса іздеу instr арқылы орындалады)"""
+    ensure_schema(db_path)
+    with db_connection() as conn:
+        return conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'student_tasks_fts'"
+        ).fetchone() is not None
+
+def build_fts_query(search):
+    """Пайдаланушы мәтінін қауіпсіз FTS5 сұранысына айналдыру: әр сөз - префикс, барлығы міндетті"""
+    terms = re.findall(r'\w+', (search or '').lower())
+    return ' '.join(f'"{term}"*' for term in terms)
+
+def _unified_task_query(search=None):
+    """(SELECT ... FROM бөлігі, шарттар, параметрлер) - іздеу болса FTS5 арқылы"""
+    if search and task_search_uses_fts(DB_PATH):
+        fts_query = build_fts_query(search)
+        if fts_query:
+            return UNIFIED_TASK_SEARCH_SELECT, ["student_tasks_fts MATCH ?"], [fts_query]
+    
+    select = f"SELECT {UNIFIED_TASK_COLUMNS}, 0 AS search_rank FROM student_tasks st"
+    conditions, params = [], []
+    for term in re.findall(r'\w+', (search or '').lower()):
+        conditions.append("(" + " OR ".join(
+            f"instr(unicode_lower(st.{col}), ?) > 0" for col in TASK_SEARCH_COLUMNS
+        ) + ")")
+        params.extend([term] * len(TASK_SEARCH_COLUMNS))
+    return select, conditions, params
+
+def _unified_task_filters(teacher_id=None, student_id=None, status=None, search=None):
+    select, conditions, params = _unified_task_query(search)
+    if teacher_id is not None:
+        conditions.append("st.teacher_id = ?")
+        params.append(teacher_id)
+    if student_id is not None:
+        conditions.append("st.student_id = ?")
+        params.append(student_id)
+    if status and status != "Барлығы":
+        conditions.append("display_status = ?")
+        params.append(status)
+    return select, conditions, params
+
+def get_unified_student_tasks_page(teacher_id, status=None, search=None, sort_by="Мерзім",
+                                   cursor=None, limit=TASK_PAGE_SIZE):
+    """Мұғалім тапсырмаларының бір беті (keyset pagination).
+
+    Сүзу, іздеу және сұрыптау SQL-де орындалады. cursor - алдыңғы беттің
+    соңғы жолының сұрыптау кілті; (tasks, next_cursor) қайтарылады,
+    келесі бет болмаса next_cursor = None.
+    """
+    select, conditions, params = _unified_task_filters(teacher_id, status=status, search=search)
+    if sort_by == "Сәйкестік" and select is not UNIFIED_TASK_SEARCH_SELECT:
+        sort_by = "Мерзім"
+    sort_keys, cursor_of = TASK_SORT_KEYS.get(sort_by, TASK_SORT_KEYS["Мерзім"])
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            if cursor:
+                # Бірінші кілт бойынша >= шарты индексті курсордан бастап іздеуге мүмкіндік береді
+                conditions.append(f"{sort_keys[0]} >= ?")
+                conditions.append(f"({', '.join(sort_keys)}) > ({', '.join('?' * len(sort_keys))})")
+                params.extend([cursor[0]] + list(cursor))
+            c.execute(select + f'''
+                WHERE {' AND '.join(conditions)}
+                ORDER BY {', '.join(sort_keys)}
+                LIMIT ?
+            ''', params + [limit + 1])
+            tasks = _fetch_unified_tasks(c)
+        
+            if len(tasks) > limit:
+                tasks = tasks[:limit]
+                return tasks, cursor_of(tasks[-1])
+            return tasks, None
+    except Exception as e:
+        print(f"❌ Тапсырмаларды алу қатесі: {e}")
+        traceback.print_exc()
+        return [], None
+
+def count_unified_student_tasks(teacher_id, status=None, search=None):
+    """Сүзгіге сәйкес тапсырмалар саны"""
+    try:
+        with db_connection() as conn:
+            select, conditions, params = _unified_task_filters(teacher_id, status=status, search=search)
+            return conn.execute(
+                f"SELECT COUNT(*) FROM ({select} WHERE {' AND '.join(conditions)})",
+                params
+            ).fetchone()[0]
+    except Exception as e:
+        print(f"❌ Тапсырмаларды санау қатесі: {e}")
+        return 0
+
+def search_unified_tasks(search, teacher_id=None, student_id=None, limit=50):
+    """Тапсырмаларды толық мәтін бойынша іздеу - мұғалім немесе оқушы үшін.
+
+    Атауы, сипаттамасы, оқушы аты, тегтер, жауап мәтіні және кері байланыс
+    бойынша префикспен, регистрсіз іздейді; нәтиже сәйкестік бойынша реттеледі.
+    """
+    if (teacher_id is None and student_id is None) or not build_fts_query(search):
+        return []
+    select, conditions, params = _unified_task_filters(teacher_id, student_id, search=search)
+    order = "student_tasks_fts.rank" if select is UNIFIED_TASK_SEARCH_SELECT else "st.due_date"
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(select + f'''
+                WHERE {' AND '.join(conditions)}
+                ORDER BY {order}, st.id
+                LIMIT ?
+            ''', params + [limit])
+            return _fetch_unified_tasks(c)
+    except Exception as e:
+        print(f"❌ Тапсырмаларды іздеу қатесі: {e}")
+        traceback.print_exc()
+        return []
+
+def get_unified_student_tasks_by_student(student_id):
+    """Оқушыға берілген барлық тапсырмалар - ФАЙЛДАРМЕН"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(UNIFIED_TASK_SELECT + f'''
+                WHERE st.student_id = ?
+                ORDER BY {DISPLAY_STATUS_ORDER}, st.due_date ASC
+            ''', (student_id,))
+            return _fetch_unified_tasks(c)
+    except Exception as e:
+        print(f"❌ Оқушы тапсырмаларын алу қатесі: {e}")
+        traceback.print_exc()
+        return []
+
+def update_unified_task_status(task_id, new_status, feedback=None, score=None):
+    """Тапсырма статусын жаңарту"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            if new_status == 'Тексерілді' and score is not None:
+                c.execute('''
+                    UPDATE student_tasks 
+                    SET status = ?, 
+                        teacher_feedback = ?,
+                        score = ?,
+                        checked_date = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                ''', (new_status, feedback, score, task_id))
+            else:
+                c.execute('''
+                    UPDATE student_tasks 
+                    SET status = ?, 
+                        teacher_feedback = ?
+                    WHERE id = ?
+                ''', (new_status, feedback, task_id))
+        
+            return True, "✅ Тапсырма күйі жаңартылды!"
+    except Exception as e:
+        print(f"❌ Статус жаңарту қатесі: {e}")
+        traceback.print_exc()
+        return False, f"Қате: {str(e)}"
+
+def submit_unified_student_answer(task_id, answer_text, answer_file=None):
+    """Оқушының жауабын сақтау - ФАЙЛДАРМЕН"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            file_hash = None
+            file_type = None
+            file_name = None
+            file_size = 0
+        
+            if answer_file and hasattr(answer_file, 'read'):
+                file_bytes = answer_file.read()
+                file_hash = store_blob(conn, file_bytes)
+                file_type = answer_file.type
+                file_name = answer_file.name
+                file_size = len(file_bytes)
+        
+            c.execute('''
+                UPDATE student_tasks 
+                SET student_answer_text = ?,
+                    student_answer_file_hash = ?,
+                    student_answer_file_type = ?,
+                    student_answer_file_name = ?,
+                    student_answer_file_size = ?,
+                    status = 'Жіберілді',
+                    student_submitted_date = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (answer_text, file_hash, file_type, file_name, file_size, task_id))
+        
+        purge_deleted_blobs()
+        return True, "✅ Жауап сәтті жіберілді!"
+    except Exception as e:
+        print(f"❌ Жауап сақтау қатесі: {e}")
+        traceback.print_exc()
+        return False, f"Қате: {str(e)}"
+
+def build_task_file_info(file_hash, file_type_db, file_name, task_name, file_type='task'):
+    """Тапсырма жолынан файл метадеректерін құру (мазмұны read_blob арқылы алынады)"""
+    if not file_hash:
+        return None
+    
+    if not file_name:
+        if file_type == 'task':
+            ext = get_file_extension(file_type_db)
+            file_name = f"Тапсырма_{task_name}.{ext}"
+        else:
+            ext = get_file_extension(file_type_db) if file_type_db else 'file'
+            file_name = f"Жауап_{task_name}.{ext}"
+    
+    return {
+        'sha256': file_hash,
+        'type': file_type_db,
+        'filename': file_name
+    }
+
+def get_unified_task_file(task_id, file_type='task'):
+    """Тапсырма немесе жауап файлын алу"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            if file_type == 'task':
+                c.execute('''
+                    SELECT task_file_hash, task_file_type, task_file_name, task_name 
+                    FROM student_tasks 
+                    WHERE id = ? AND task_file_hash IS NOT NULL
+                ''', (task_id,))
+            else:  # answer
+                c.execute('''
+                    SELECT student_answer_file_hash, student_answer_file_type, student_answer_file_name, task_name 
+                    FROM student_tasks 
+                    WHERE id = ? AND student_answer_file_hash IS NOT NULL
+                ''', (task_id,))
+        
+            file_data = c.fetchone()
+        
+            if file_data:
+                return build_task_file_info(*file_data, file_type=file_type)
+        
+            return None
+    except Exception as e:
+        print(f"❌ Файл алу қатесі: {e}")
+        traceback.print_exc()
+        return None
+
+def delete_unified_task(task_id):
+    """Тапсырманы жою"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute("DELETE FROM student_tasks WHERE id = ?", (task_id,))
+        purge_deleted_blobs()
+        return True, "✅ Тапсырма жойылды!"
+    except Exception as e:
+        print(f"❌ Тапсырманы жою қатесі: {e}")
+        return False, f"Қате: {str(e)}"
+
+def get_task_stats(scope, scope_id):
+    """task_stats бойынша статус -> тапсырмалар саны (scope: 'teacher', 'class', 'student')"""
+    with db_connection() as conn:
+        rows = conn.execute(
+            "SELECT status, task_count FROM task_stats WHERE scope = ? AND scope_id = ? AND task_count != 0",
+            (scope, scope_id)
+        ).fetchall()
+    return dict(rows)
+
+def _count_overdue_tasks(c, teacher_id):
+    c.execute(
+        "SELECT COUNT(*) FROM student_tasks WHERE teacher_id = ? AND display_status = 'Кешікті'",
+        (teacher_id,)
+    )
+    return c.fetchone()[0]
+
+OVERDUE_SWEEP_INTERVAL_SECONDS = 300
+
+def sweep_overdue_tasks():
+    """Мерзімі өткен 'Тағайындалды' тапсырмаларды 'Кешікті' күйіне ауыстыру"""
+    with db_connection() as conn:
+        cursor = conn.execute(f"""
+            UPDATE student_tasks SET display_status = 'Кешікті'
+            WHERE display_status = 'Тағайындалды' AND due_date < {TODAY_SQL}
+        """)
+        return cursor.rowcount
+
+@st.cache_resource(show_spinner=False)
+def start_overdue_sweeper(interval=OVERDUE_SWEEP_INTERVAL_SECONDS):
+    """Процесс бойы бір фондық ағын: іске қосылғанда және әр interval секунд сайын sweep"""
+    stop = threading.Event()
+    
+    def run():
+        while True:
+            try:
+                swept = sweep_overdue_tasks()
+                if swept:
+                    print(f"⏰ {swept} тапсырма 'Кешікті' күйіне ауысты")
+            except Exception as e:
+                print(f"❌ Мерзім sweeper қатесі: {e}")
+            if stop.wait(interval):
+                break
+    
+    threading.Thread(target=run, name="overdue-sweeper", daemon=True).start()
+    return stop
+
+def get_task_statistics_unified(teacher_id):
+    """Тапсырмалар статистикасы (task_stats кестесінен, кілт бойынша)"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            counts = get_task_stats('teacher', teacher_id)
+            return {
+                'total': sum(counts.values()),
+                'assigned': counts.get('Тағайындалды', 0),
+                'submitted': counts.get('Жіберілді', 0),
+                'checked': counts.get('Тексерілді', 0),
+                'overdue': _count_overdue_tasks(c, teacher_id)
+            }
+    except Exception as e:
+        print(f"❌ Статистика алу қатесі: {e}")
+        return {}
+
+def rebuild_task_stats(verify_only=False):
+    """task_stats кестесін student_tasks-пен салыстыру және қажет болса қайта құру.
+
+    Айырмашылықтар тізімін [(scope, scope_id, status, сақталған, нақты), ...]
+    қайтарады. Мысалы: python -c "from ai_qazaq.data import rebuild_task_stats; rebuild_task_stats()"
+    """
+    ensure_schema(DB_PATH)
+    with db_connection() as conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        stored = {
+            row[:3]: row[3]
+            for row in conn.execute("SELECT scope, scope_id, status, task_count FROM task_stats WHERE task_count != 0")
+        }
+        expected = {row[:3]: row[3] for row in conn.execute(_task_stats_expected_sql())}
+        mismatches = sorted(
+            (key + (stored.get(key, 0), expected.get(key, 0)))
+            for key in stored.keys() | expected.keys()
+            if stored.get(key, 0) != expected.get(key, 0)
+        )
+        if mismatches and not verify_only:
+            _fill_task_stats(conn)
+    
+    if mismatches:
+        action = "тексерілді" if verify_only else "қайта құрылды"
+        print(f"⚠️ task_stats: {len(mismatches)} айырмашылық табылды ({action})")
+    else:
+        print("✅ task_stats негізгі кестеге сәйкес")
+    return mismatches
+
+DASHBOARD_RECENT_TASKS = 5
+
+def get_dashboard_summary(teacher_id, recent_limit=DASHBOARD_RECENT_TASKS):
+    """Басқару панелінің барлық көрсеткіштері мен соңғы тапсырмалары - бір сұраныспен"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute(f'''
+                WITH class_stats AS (
+                    SELECT COUNT(*) AS class_count,
+                           COUNT(DISTINCT IFNULL(subject, '')) AS subject_count
+                    FROM classes WHERE teacher_id = :teacher_id
+                ),
+                student_stats AS (
+                    SELECT COUNT(*) AS student_count
+                    FROM students s JOIN classes c ON s.class_id = c.id
+                    WHERE c.teacher_id = :teacher_id
+                ),
+                teacher_task_stats AS (
+                    SELECT 
+                        IFNULL(SUM(task_count), 0) AS total,
+                        SUM(CASE WHEN status = 'Тағайындалды' THEN task_count ELSE 0 END) AS assigned,
+                        SUM(CASE WHEN status = 'Жіберілді' THEN task_count ELSE 0 END) AS submitted,
+                        SUM(CASE WHEN status = 'Тексерілді' THEN task_count ELSE 0 END) AS checked,
+                        (SELECT COUNT(*) FROM student_tasks
+                         WHERE teacher_id = :teacher_id AND display_status = 'Кешікті') AS overdue
+                    FROM task_stats WHERE scope = 'teacher' AND scope_id = :teacher_id
+                ),
+                recent AS (
+                    SELECT {UNIFIED_TASK_COLUMNS}
+                    FROM student_tasks st
+                    WHERE st.teacher_id = :teacher_id
+                    ORDER BY st.id DESC
+                    LIMIT :recent_limit
+                )
+                SELECT class_stats.*, student_stats.*, teacher_task_stats.*, recent.*
+                FROM class_stats, student_stats, teacher_task_stats
+                LEFT JOIN recent ON 1 = 1
+                ORDER BY recent.id DESC
+            ''', {'teacher_id': teacher_id, 'recent_limit': recent_limit})
+        
+            columns = [desc[0] for desc in c.description]
+            rows = c.fetchall()
+            first = dict(zip(columns, rows[0]))
+            # recent.* бағандары соңында тұр
+            offset = columns.index('id')
+            return {
+                'class_count': first['class_count'],
+                'student_count': first['student_count'],
+                'subject_count': first['subject_count'],
+                'task_stats': {
+                    'total': first['total'] or 0,
+                    'assigned': first['assigned'] or 0,
+                    'submitted': first['submitted'] or 0,
+                    'checked': first['checked'] or 0,
+                    'overdue': first['overdue'] or 0
+                },
+                'recent_tasks': [TaskRecord(*row[offset:]) for row in rows if row[offset] is not None]
+            }
+    except Exception as e:
+        print(f"❌ Басқару панелі деректерін алу қатесі: {e}")
+        traceback.print_exc()
+        return {
+            'class_count': 0, 'student_count': 0, 'subject_count': 0,
+            'task_stats': {}, 'recent_tasks': []
+        }
+
+# ============ ОҚУШЫ ПОРТАЛЫ ФУНКЦИЯЛАРЫ ============
+def student_login(username, password):
+    """Оқушы кіруі"""
+    try:
+        with db_connection() as conn:
+            c = conn.cursor()
+            c.execute("""
+            SELECT s.id, s.full_name, s.student_code, s.class_id, c.name as class_name,
+                   c.subject, s.grade_points, s.academic_performance, sl.id, sl.password
+            FROM students s
+            JOIN student_logins sl ON s.id = sl.student_id
+            JOIN classes c ON s.class_id = c.id
+            WHERE sl.username = ?
+            """, (username,))
+        
+            row = c.fetchone()
+        if not row or not verify_password(password, row[-1]):
+            return None
+        
+        login_id, stored_password = row[-2:]
+        if password_needs_rehash(stored_password):
+            with db_connection() as conn:
+                conn.execute("UPDATE student_logins SET password = ? WHERE id = ? AND password = ?",
+                             (hash_password(password), login_id, stored_password))
+        
+        student = row[:-2]
+        # Егер academic_performance жоқ болса, әдепкі мән қосу
+        if len(student) == 7:  # academic_performance жоқ
+            student = student + ("Орташа",)
+        
+        return student
+    except Exception as e:
+        print(f"❌ Оқушы кіру қатесі: {e}")
+        return None
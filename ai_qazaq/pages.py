@@ -0,0 +1,1973 @@
+# ai_qazaq/pages.py - Streamlit беттері және main()
+import streamlit as st
+from datetime import datetime, timedelta
+import random
+import time
+
+from .data import (
+    DB_PATH, add_class, add_student, assign_unified_task_bulk, build_credentials_sheet,
+    clear_student_session, clear_user_session, count_unified_student_tasks, delete_bzb_task,
+    delete_class, delete_file, delete_student, delete_student_login, delete_unified_task,
+    ensure_schema, generate_random_password, generate_student_logins, get_bzb_task,
+    get_bzb_tasks, get_classes, get_dashboard_summary, get_file_extension, get_grade_class,
+    get_saved_files, get_student_logins, get_students_by_class, get_task_statistics_unified,
+    get_teacher_roster, get_unified_student_tasks_by_student, get_unified_student_tasks_page,
+    get_unified_task_file, get_visual_material, import_students_streaming, iter_roster_chunks,
+    load_session, login_user, points_to_grade, read_blob, register_student_login, register_user,
+    save_bzb_task, save_file_to_db, save_student_session, save_user_session,
+    search_unified_tasks, start_overdue_sweeper, student_login, submit_unified_student_answer,
+    update_student_password, update_unified_task_status,
+)
+from .rendering import (
+    APP_CSS, display_file_preview, draw_performance_charts, draw_student_analysis_charts,
+    draw_task_status_chart, preview_file, render_chart, texts,
+)
+
+# ============ КӨРСЕТУ ФУНКЦИЯЛАРЫ (ТҮЗЕТІЛГЕН) ============
+def show_logo_header():
+    t = texts[st.session_state.language]
+    
+    st.markdown(f"""
+    <div style='background: linear-gradient(135deg, #0066CC, #CC0000); 
+                padding: 1.5rem; border-radius: 10px; color: white; margin-bottom: 20px;'>
+        <h1 style='margin: 0; text-align: center;'>🇰🇿 AI QAZAQ TEACHERS</h1>
+        <p style='margin: 0; text-align: center; font-size: 1.2rem;'>{t['subtitle']}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+def show_classes_management():
+    """Сыныптарды басқару"""
+    t = texts[st.session_state.language]
+    
+    col1, col2 = st.columns([3, 1])
+    
+    with col1:
+        st.markdown(f"<h2>🏫 {t['classes']}</h2>", unsafe_allow_html=True)
+    
+    with col2:
+        if st.button(f"➕ {t['add_class']}", use_container_width=True):
+            st.session_state.show_add_class = True
+    
+    if st.session_state.get('show_add_class', False):
+        with st.form("add_class_form"):
+            st.subheader(f"➕ {t['add_class']}")
+            
+            name = st.text_input(f"🏫 {t['class_name']}")
+            subject = st.text_input(f"📚 {t['subject']}")
+            grade_level = st.selectbox("🎯 Сынып деңгейі", ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"])
+            description = st.text_area(f"📄 {t['description']}")
+            
+            col_submit, col_cancel = st.columns(2)
+            
+            with col_submit:
+                if st.form_submit_button(f"✅ {t['add']}", use_container_width=True):
+                    if name and subject:
+                        if add_class(st.session_state.user[0], name, subject, grade_level, description):
+                            st.success(f"✅ '{name}' сыныбы сәтті қосылды!")
+                            st.session_state.show_add_class = False
+                            time.sleep(1)
+                            st.rerun()
+                        else:
+                            st.error("❌ Сыныпты қосу кезінде қате пайда болды")
+                    else:
+                        st.error("❌ Сынып атауы мен пәнді толтырыңыз!")
+            
+            with col_cancel:
+                if st.form_submit_button(f"❌ Болдырмау", use_container_width=True):
+                    st.session_state.show_add_class = False
+                    st.rerun()
+    
+    # Сыныптар тізімі
+    classes = get_classes(st.session_state.user[0])
+    
+    if not classes:
+        st.info(f"📭 {t['no_classes']}")
+        return
+    
+    for class_item in classes:
+        with st.expander(f"🏫 {class_item[1]} - {class_item[2]} (Сынып {class_item[3]})", expanded=False):
+            col_info, col_actions = st.columns([3, 1])
+            
+            with col_info:
+                st.markdown(f"**Пән:** {class_item[2]}")
+                st.markdown(f"**Сынып деңгейі:** {class_item[3]}")
+                if st.button(f"👨‍🎓 Оқушыларды басқару", key=f"manage_{class_item[0]}"):
+                    st.session_state.current_class_id = class_item[0]
+                    st.session_state.current_page = 'students'
+                    st.rerun()
+            
+            with col_actions:
+                if st.button("🗑️ Сыныпты жою", key=f"delete_{class_item[0]}"):
+                    st.session_state.class_to_delete = class_item[0]
+                    st.session_state.confirm_delete = True
+    
+    # Сыныпты жою растау
+    if st.session_state.get('confirm_delete', False) and st.session_state.get('class_to_delete'):
+        st.warning(f"⚠️ {t['delete_warning']}")
+        col_confirm, col_cancel = st.columns(2)
+        
+        with col_confirm:
+            if st.button("✅ Иә, жою", use_container_width=True):
+                if delete_class(st.session_state.class_to_delete):
+                    st.success(f"✅ {t['class_deleted']}")
+                    st.session_state.class_to_delete = None
+                    st.session_state.confirm_delete = False
+                    time.sleep(1)
+                    st.rerun()
+                else:
+                    st.error("❌ Сыныпты жою кезінде қате пайда болды")
+        
+        with col_cancel:
+            if st.button("❌ Жоқ, болдырмау", use_container_width=True):
+                st.session_state.class_to_delete = None
+                st.session_state.confirm_delete = False
+                st.rerun()
+
+def show_students_management():
+    """Оқушыларды басқару"""
+    t = texts[st.session_state.language]
+    
+    st.markdown(f"<h2>👨‍🎓 {t['students']}</h2>", unsafe_allow_html=True)
+    
+    # Session state инициализациясы
+    if 'current_class_id' not in st.session_state:
+        st.session_state.current_class_id = None
+    
+    # Сыныпты таңдау
+    classes = get_classes(st.session_state.user[0])
+    
+    if not classes:
+        st.info(f"📭 {t['no_classes']}")
+        return
+    
+    # Сынып опцияларын құру
+    class_options = {}
+    for c in classes:
+        class_id, name, subject, grade_level = c
+        class_name = f"{name} - {subject} (Сынып {grade_level})"
+        class_options[class_name] = class_id
+    
+    # Тандалған сыныпты анықтау
+    if st.session_state.current_class_id is None:
+        st.session_state.current_class_id = classes[0][0]
+        selected_class_name = list(class_options.keys())[0]
+    else:
+        # Тандалған сыныптың атауын табу
+        selected_class_name = ""
+        for c in classes:
+            if c[0] == st.session_state.current_class_id:
+                selected_class_name = f"{c[1]} - {c[2]} (Сынып {c[3]})"
+                break
+        
+        if not selected_class_name:
+            selected_class_name = list(class_options.keys())[0]
+            st.session_state.current_class_id = class_options[selected_class_name]
+    
+    # Сыныпты таңдау
+    selected_class_name = st.selectbox(
+        f"🎯 {t['select_class']}",
+        list(class_options.keys()),
+        index=list(class_options.keys()).index(selected_class_name) if selected_class_name in class_options else 0
+    )
+    
+    # Тандалған сыныпты сақтау
+    st.session_state.current_class_id = class_options[selected_class_name]
+    current_class_id = st.session_state.current_class_id
+    
+    # Тандалған сынып ақпараты
+    for class_item in classes:
+        if class_item[0] == current_class_id:
+            st.info(f"**Тандалған сынып:** {class_item[1]} - {class_item[2]} (Сынып {class_item[3]})")
+            break
+    
+    # Оқушыларды қосу формасы
+    st.markdown("---")
+    st.markdown(f"### ➕ {t['add_student']}")
+    
+    with st.form("add_student_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            full_name = st.text_input(f"👤 {t['student_name']}", placeholder="Мысалы: Әлімхан Сағатов")
+            student_code = st.text_input(f"🎯 {t['student_id']}", placeholder="Мысалы: S001")
+        
+        with col2:
+            grade_points = st.number_input(f"⭐ {t['points']}", min_value=0, max_value=10, value=5)
+            academic_performance = st.selectbox(
+                f"📊 {t['academic_performance']}",
+                ["Өте жақсы", "Жақсы", "Орташа", "Қанағаттанарлық", "Әлсіз"]
+            )
+        
+        submit_button = st.form_submit_button(f"➕ {t['add_student']}", use_container_width=True)
+        
+        if submit_button:
+            if full_name and student_code:
+                if add_student(current_class_id, full_name, student_code, grade_points, academic_performance):
+                    st.success(f"✅ {t['student_added']}")
+                    time.sleep(1)
+                    st.rerun()
+                else:
+                    st.error("❌ Оқушыны қосу кезінде қате пайда болды")
+            else:
+                st.error("❌ Оқушының аты мен кодын толтырыңыз!")
+    
+    # Оқушылар тізімі
+    st.markdown("---")
+    st.markdown("### 👨‍🎓 Оқушылар тізімі")
+    
+    students = get_students_by_class(current_class_id)
+    
+    if not students:
+        st.info(f"📭 {t['no_students']}")
+        return
+    
+    st.success(f"✅ Барлығы: {len(students)} оқушы")
+    
+    # Логиндерді топтап құру - құпия сөздер тек осы бетте бір рет көрсетіледі
+    with st.expander("🔐 Логині жоқ оқушыларға логин құру"):
+        login_scope = st.radio("Қамту", ["Осы сынып", "Барлық сыныптарым"], horizontal=True, key="login_scope")
+        if st.button("🔐 Логиндерді құру", key="generate_logins", use_container_width=True):
+            st.session_state.generated_credentials = generate_student_logins(
+                st.session_state.user[0],
+                current_class_id if login_scope == "Осы сынып" else None
+            )
+        
+        generated = st.session_state.get('generated_credentials')
+        if generated is not None:
+            credentials, skipped = generated
+            if not skipped.empty:
+                st.warning(f"⚠️ {len(skipped)} оқушыға логин құрылмады (логин бос емес немесе басқа сессия құрып үлгерді)")
+                st.dataframe(skipped, hide_index=True, use_container_width=True)
+            if credentials.empty and skipped.empty:
+                st.info("📭 Логині жоқ оқушы табылмады")
+            elif not credentials.empty:
+                st.success(f"✅ {len(credentials)} логин құрылды. Құпия сөздер қайта көрсетілмейді - файлды сақтап алыңыз!")
+                st.dataframe(credentials, hide_index=True, use_container_width=True)
+                data, file_name, mime = build_credentials_sheet(credentials)
+                st.download_button(
+                    "📥 Тіркелгі деректерін жүктеу",
+                    data=data,
+                    file_name=file_name,
+                    mime=mime,
+                    key="download_credentials"
+                )
+            if st.button("✖️ Жабу", key="dismiss_credentials"):
+                del st.session_state.generated_credentials
+                st.rerun()
+    
+    # Әр оқушы үшін карточка
+    for student in students:
+        student_id = student[0]
+        student_name = student[2] if len(student) > 2 else "Аты жоқ"
+        student_code_val = student[3] if len(student) > 3 else "Коды жоқ"
+        grade_points_val = student[4] if len(student) > 4 else 0
+        academic_performance_val = student[5] if len(student) > 5 else "Орташа"
+        
+        with st.expander(f"**{student_name}** ({student_code_val}) - {grade_points_val} балл", expanded=False):
+            col_info, col_login, col_delete = st.columns([3, 2, 1])
+            
+            with col_info:
+                st.markdown(f"**Оқушы коды:** {student_code_val}")
+                st.markdown(f"**Балл:** {grade_points_val}")
+                st.markdown(f"**Оқу деңгейі:** {academic_performance_val}")
+                st.markdown(f"**ID:** {student_id}")
+            
+            with col_login:
+                st.markdown("**🔐 Логин басқару**")
+                logins = get_student_logins(student_id)
+                
+                if not logins:
+                    if st.button("Логин құру", key=f"create_{student_id}", use_container_width=True):
+                        # Логин құру
+                        username = f"student_{student_code_val}"
+                        password = generate_random_password()
+                        
+                        success, message = register_student_login(student_id, username, password)
+                        if success:
+                            st.success(f"✅ Логин құрылды!")
+                            st.code(f"Логин: {username}\nҚұпия сөз: {password}", language="text")
+                            time.sleep(2)
+                            st.rerun()
+                        else:
+                            st.error(f"❌ {message}")
+                else:
+                    for login in logins:
+                        login_id, username = login
+                        
+                        st.markdown(f"**Логин:** `{username}`")
+                        
+                        col_btn1, col_btn2 = st.columns(2)
+                        
+                        with col_btn1:
+                            if st.button("🔄", key=f"change_{login_id}", help="Құпия сөзді өзгерту"):
+                                new_password = generate_random_password()
+                                if update_student_password(login_id, new_password):
+                                    st.success(f"✅ Жаңа құпия сөз: {new_password}")
+                                    time.sleep(2)
+                                    st.rerun()
+                        
+                        with col_btn2:
+                            if st.button("🗑️", key=f"del_login_{login_id}", help="Логинды жою"):
+                                if delete_student_login(login_id):
+                                    st.success("✅ Логин жойылды")
+                                    time.sleep(1)
+                                    st.rerun()
+            
+            with col_delete:
+                st.markdown("**⚠️ Оқушыны жою**")
+                if st.button("🗑️ Жою", key=f"delete_{student_id}", use_container_width=True):
+                    if delete_student(student_id):
+                        st.success("✅ Оқушы жойылды!")
+                        time.sleep(1)
+                        st.rerun()
+                    else:
+                        st.error("❌ Оқушыны жою кезінде қате пайда болды")
+    
+    # Excel импорттау опциясы
+    st.markdown("---")
+    with st.expander(f"📁 {t['import_excel']}"):
+        uploaded_file = st.file_uploader("Excel немесе CSV файлын жүктеңіз", type=["xlsx", "csv"])
+        st.caption(
+            "Бағандар: full_name, student_code (міндетті), grade_points, academic_performance, "
+            "class_name (бос болса - таңдалған сынып)"
+        )
+        
+        if uploaded_file is not None:
+            # pandas тек файл жүктелгенде керек - бет алғаш ашылғанда жүктелмейді
+            import pandas as pd
+            try:
+                # Алдын ала көрініс үшін тек бірінші бөлік оқылады
+                first_chunk = next(iter_roster_chunks(uploaded_file, chunk_size=5), (pd.DataFrame(),))[0]
+                st.write("Файл құрамы:", first_chunk)
+                
+                col_preview, col_import = st.columns(2)
+                with col_preview:
+                    dry_run = st.button("🔍 Алдын ала тексеру", key="import_dry_run", use_container_width=True)
+                with col_import:
+                    do_import = st.button("📥 Оқушыларды импорттау", key="import_students", use_container_width=True)
+                
+                if dry_run or do_import:
+                    progress_bar = st.progress(0.0, text="Файл оқылуда...")
+                    
+                    def show_progress(done, total):
+                        if total:
+                            progress_bar.progress(min(done / total, 1.0), text=f"{done} / {total} жол")
+                        else:
+                            progress_bar.progress(0.0, text=f"{done} жол")
+                    
+                    result = import_students_streaming(
+                        uploaded_file, current_class_id, teacher_id=st.session_state.user[0],
+                        dry_run=dry_run, progress=show_progress
+                    )
+                    progress_bar.progress(1.0, text=f"{result['read']} жол өңделді")
+                    if dry_run:
+                        st.info(f"🔍 {result['accepted']} оқушы қосылады, {result['rejected']} жол қабылданбайды")
+                        st.dataframe(result['rows'], hide_index=True, use_container_width=True)
+                    else:
+                        st.success(f"✅ {result['inserted']} оқушы сәтті импортталды!")
+                    
+                    if result['rejected']:
+                        st.warning(f"⚠️ {result['rejected']} жол қабылданбады (алғашқы {len(result['errors'])}):")
+                        st.dataframe(result['errors'], hide_index=True, use_container_width=True)
+                    elif do_import:
+                        time.sleep(1)
+                        st.rerun()
+            except Exception as e:
+                st.error(f"❌ Файлды өңдеу кезінде қате: {e}")
+
+def show_student_performance():
+    """Оқушылардың үлгерімін көрсету"""
+    t = texts[st.session_state.language]
+    st.markdown(f"<h2>📊 {t['student_performance']}</h2>", unsafe_allow_html=True)
+    
+    classes = get_classes(st.session_state.user[0])
+    if not classes:
+        st.info("📭 Сізде әлі сыныптар жоқ")
+        return
+    
+    df = get_teacher_roster(st.session_state.user[0])
+    if df.empty:
+        st.info("📭 Оқушылар жоқ")
+        return
+    
+    # Статистика
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Барлық оқушылар", len(df))
+    with col2:
+        avg_points = df['points'].mean()
+        st.metric("Орташа балл", f"{avg_points:.1f}")
+    with col3:
+        excellent = len(df[df['grade'] == 'A'])
+        st.metric("Өте жақсы (A)", excellent)
+    with col4:
+        weak = len(df[df['grade'] == 'F'])
+        st.metric("Әлсіз (F)", weak)
+    
+    # Кесте
+    display_df = df.copy()
+    display_df['points'] = display_df['points'].astype(str) + ' балл'
+    st.dataframe(display_df, use_container_width=True)
+    
+    # График
+    if len(df) > 0:
+        # Категория бойынша - бос бағалар да 0 бағанмен, түстер әріпке бекітілген
+        grade_counts = df['grade'].value_counts().sort_index()
+        class_avg = df.groupby('class')['points'].mean()
+        chart = render_chart(
+            draw_performance_charts,
+            grade_counts.index.astype(str).tolist(), grade_counts.tolist(),
+            class_avg.index.tolist(), class_avg.round(4).tolist(),
+            figsize=(12, 5)
+        )
+        st.image(chart, use_container_width=True)
+
+def show_bzb_tasks():
+    """БЖБ тапсырмаларын көрсету (өшіру функциясы қосылды)"""
+    t = texts[st.session_state.language]
+    st.markdown(f"<h2>📝 {t['bzb_tasks']}</h2>", unsafe_allow_html=True)
+    
+    # Тапсырма қосу формасы
+    with st.form("add_bzb_task"):
+        st.subheader("📤 Жаңа БЖБ тапсырмасын қосу")
+        
+        classes = get_classes(st.session_state.user[0])
+        if not classes:
+            st.info("Алдымен сынып қосыңыз.")
+            return
+        
+        class_options = {f"{c[1]} (Сынып {c[3]})": c[0] for c in classes}
+        selected_class = st.selectbox("🎯 Сыныпты таңдаңыз", list(class_options.keys()))
+        class_id = class_options[selected_class]
+        
+        task_name = st.text_input("📝 Тапсырма атауы")
+        task_file = st.file_uploader("📁 Файл жүктеу", type=['pdf', 'doc', 'docx', 'txt', 'xlsx', 'jpg', 'png', 'pptx'])
+        completion_rate = st.slider("✅ Орындалу деңгейі (%)", 0, 100, 50)
+        difficulty_level = st.selectbox("⚡ Қиындық деңгейі", ["Оңай", "Орташа", "Қиын"])
+        
+        if st.form_submit_button("📤 Тапсырманы жүктеу", use_container_width=True):
+            if task_name and task_file:
+                if save_bzb_task(st.session_state.user[0], class_id, task_name, task_file, 
+                               task_file.type, completion_rate, difficulty_level):
+                    st.success("✅ БЖБ тапсырмасы сәтті жүктелді!")
+                    time.sleep(1)
+                    st.rerun()
+                else:
+                    st.error("❌ Тапсырманы жүктеу кезінде қате пайда болды")
+            else:
+                st.error("❌ Тапсырма атауы мен файлын толтырыңыз!")
+    
+    # Тапсырмалар тізімі
+    st.markdown("---")
+    st.subheader("📋 БЖБ тапсырмалары тізімі")
+    
+    tasks = get_bzb_tasks(st.session_state.user[0])
+    
+    if not tasks:
+        st.info("📭 БЖБ тапсырмалары жоқ")
+        return
+    
+    for task in tasks:
+        with st.expander(f"📝 {task['name']} - {task['class_name']}", expanded=False):
+            col1, col2, col3 = st.columns([3, 1, 1])
+            
+            with col1:
+                st.markdown(f"**Сынып:** {task['class_name']}")
+                st.markdown(f"**Жүктелген күні:** {task['uploaded']}")
+                st.markdown(f"**Орындалу деңгейі:** {task['rate']}%")
+                st.markdown(f"**Қиындық деңгейі:** {task['difficulty']}")
+                
+                if task['ai_solution']:
+                    with st.expander("🤖 AI шешімі", expanded=False):
+                        st.info(task['ai_solution'])
+            
+            with col2:
+                if st.button("👁️ Алдын ала қарау", key=f"preview_{task['id']}"):
+                    st.session_state.preview_file = {'id': task['id'], 'type': 'bzb', 'name': task['name']}
+                    st.rerun()
+                
+                if task['sha256']:
+                    file_extension = get_file_extension(task['type'])
+                    st.download_button(
+                        label="📥 Жүктеп алу",
+                        data=lambda sha256=task['sha256']: read_blob(sha256),
+                        file_name=f"{task['name']}.{file_extension}",
+                        mime=task['type'],
+                        key=f"download_{task['id']}"
+                    )
+            
+            with col3:
+                if st.button("🗑️ Өшіру", key=f"delete_{task['id']}", use_container_width=True):
+                    if delete_bzb_task(task['id']):
+                        st.success("✅ БЖБ тапсырмасы өшірілді!")
+                        time.sleep(1)
+                        st.rerun()
+                    else:
+                        st.error("❌ Тапсырманы өшіру кезінде қате пайда болды")
+
+def show_student_tasks():
+    """Оқушыларға тапсырмалар бөлімі - ТҮЗЕТІЛГЕН ФАЙЛДАРМЕН"""
+    t = texts[st.session_state.language]
+    
+    st.markdown(f"<h2>🎯 {t['student_tasks']}</h2>", unsafe_allow_html=True)
+    
+    # Бөлімдер
+    tab1, tab2, tab3 = st.tabs(["📤 Тапсырма беру", "📋 Тапсырмалар тізімі", "📊 Статистика"])
+    
+    with tab1:
+        show_unified_assign_task_form()
+    
+    with tab2:
+        show_unified_assigned_tasks()
+    
+    with tab3:
+        show_task_statistics_unified_section()
+
+def show_unified_assign_task_form():
+    """Жаңа тапсырма беру формасы - ФАЙЛДАРМЕН"""
+    t = texts[st.session_state.language]
+    
+    st.subheader("📤 Жаңа тапсырма беру")
+    
+    with st.form("new_task_form"):
+        # Сыныпты таңдау
+        classes = get_classes(st.session_state.user[0])
+        if not classes:
+            st.info("Алдымен сынып қосыңыз.")
+            return
+        
+        class_options = {f"{c[1]} - {c[2]}": c[0] for c in classes}
+        selected_class_name = st.selectbox("🎯 Сыныпты таңдаңыз", list(class_options.keys()))
+        selected_class_id = class_options[selected_class_name]
+        
+        # Оқушыны таңдау
+        students = get_students_by_class(selected_class_id)
+        if not students:
+            st.info("Бұл сыныпта оқушылар жоқ.")
+            return
+        
+        student_options = {}
+        for s in students:
+            student_name = s[2] if len(s) > 2 else "Аты жоқ"
+            student_code = s[3] if len(s) > 3 else "Коды жоқ"
+            student_options[f"{student_name} ({student_code})"] = s[0]
+        
+        selected_students = st.multiselect(
+            "👨‍🎓 Оқушыларды таңдаңыз (бір немесе бірнеше)",
+            list(student_options.keys())
+        )
+        assign_whole_class = st.checkbox("👥 Бүкіл сыныпқа беру")
+        
+        # Тапсырма ақпараты
+        col1, col2 = st.columns(2)
+        with col1:
+            task_name = st.text_input(f"📝 {t['task_name']}", placeholder="Тапсырма атауы")
+            due_date = st.date_input(f"📅 {t['due_date']}", value=datetime.now().date() + timedelta(days=7))
+            points = st.number_input(f"⭐ {t['points']}", min_value=0, max_value=100, value=10)
+        
+        with col2:
+            difficulty = st.selectbox("⚡ Қиындық", ["Оңай", "Орташа", "Қиын"])
+            tags = st.multiselect("🏷️ Тегтер", ["Математика", "Қазақ тілі", "Физика", "Тест", "Үй тапсырмасы", "Практика"])
+            task_file = st.file_uploader(
+                f"📁 {t['upload_file']} (міндетті емес)",
+                type=['pdf', 'doc', 'docx', 'txt', 'jpg', 'png', 'ppt', 'pptx', 'xlsx', 'zip']
+            )
+        
+        task_description = st.text_area(
+            f"📄 {t['task_description']}",
+            placeholder="Тапсырманың толық сипаттамасы...",
+            height=150
+        )
+        
+        if st.form_submit_button(f"🚀 {t['assign_task']}", use_container_width=True):
+            if task_name and (selected_students or assign_whole_class):
+                task_data = {
+                    'task_name': task_name,
+                    'task_description': task_description,
+                    'due_date': due_date.strftime('%Y-%m-%d'),
+                    'points': points,
+                    'difficulty': difficulty,
+                    'tags': ','.join(tags) if tags else None,
+                    'task_file': task_file
+                }
+                
+                results = assign_unified_task_bulk(
+                    st.session_state.user[0],
+                    task_data,
+                    student_ids=[student_options[s] for s in selected_students],
+                    class_ids=[selected_class_id] if assign_whole_class else None
+                )
+                
+                student_labels = {v: k for k, v in student_options.items()}
+                success_count = sum(1 for r in results if r[2])
+                error_messages = [
+                    f"{student_labels.get(student_id, student_id)}: {message}"
+                    for student_id, _, success, message in results if not success
+                ]
+                
+                if success_count > 0:
+                    success_msg = f"✅ {success_count} оқушыға тапсырма сәтті жіберілді!"
+                    if error_messages:
+                        success_msg += f"\n\n⚠️ Қателіктер:\n" + "\n".join(error_messages)
+                    st.success(success_msg)
+                    time.sleep(2)
+                    st.rerun()
+                else:
+                    error_msg = "❌ Тапсырмалар жіберілмеді!\n" + "\n".join(error_messages)
+                    st.error(error_msg)
+            else:
+                st.error("❌ Тапсырма атауы мен оқушыларды таңдаңыз!")
+
+def show_unified_assigned_tasks():
+    """Жіберілген тапсырмалар тізімі - ФАЙЛДАРМЕН КӨРСЕТУ"""
+    t = texts[st.session_state.language]
+    
+    st.subheader("📋 Жіберілген тапсырмалар")
+    
+    # Статистика - SQL агрегаты, тапсырмалардың өзі жүктелмейді
+    stats = get_task_statistics_unified(st.session_state.user[0])
+    
+    if not stats.get('total'):
+        st.info("📭 Тапсырмалар жоқ")
+        return
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Барлығы", stats['total'])
+    with col2:
+        st.metric("Тағайындалды", stats['assigned'])
+    with col3:
+        st.metric("Жіберілді", stats['submitted'])
+    with col4:
+        st.metric("Кешікті", stats['overdue'])
+    
+    # Сүзгілер
+    st.markdown("---")
+    col_filter1, col_filter2, col_filter3 = st.columns(3)
+    with col_filter1:
+        status_filter = st.selectbox(
+            "Статус бойынша",
+            ["Барлығы", "Тағайындалды", "Кешікті", "Жіберілді", "Тексерілді"]
+        )
+    with col_filter2:
+        search_query = st.text_input("Іздеу...")
+    with col_filter3:
+        sort_by = st.selectbox("Сұрыптау", ["Мерзім", "Оқушы", "Статус", "Сәйкестік"])
+    
+    # Сүзгі өзгерсе беттеу басынан басталады
+    filter_key = (status_filter, search_query, sort_by)
+    if st.session_state.get('task_list_filter') != filter_key:
+        st.session_state.task_list_filter = filter_key
+        st.session_state.task_page_cursors = [None]
+    cursors = st.session_state.task_page_cursors
+    
+    filtered_tasks, next_cursor = get_unified_student_tasks_page(
+        st.session_state.user[0],
+        status=status_filter,
+        search=search_query,
+        sort_by=sort_by,
+        cursor=cursors[-1]
+    )
+    filtered_count = count_unified_student_tasks(st.session_state.user[0], status_filter, search_query)
+    
+    # Көрсету
+    st.info(f"📊 Көрсетілуде: {len(filtered_tasks)} / {filtered_count} тапсырма (бет {len(cursors)})")
+    
+    col_prev, col_next = st.columns(2)
+    with col_prev:
+        if len(cursors) > 1 and st.button("⬅️ Алдыңғы бет", key="task_page_prev", use_container_width=True):
+            cursors.pop()
+            st.rerun()
+    with col_next:
+        if next_cursor and st.button("Келесі бет ➡️", key="task_page_next", use_container_width=True):
+            cursors.append(next_cursor)
+            st.rerun()
+    
+    for task in filtered_tasks:
+        status_icons = {
+            'Тағайындалды': '🔴',
+            'Кешікті': '⏰',
+            'Жіберілді': '🟡',
+            'Тексерілді': '🟢'
+        }
+        
+        status_icon = status_icons.get(task.display_status, '⚪')
+        
+        with st.expander(f"{status_icon} {task.task_name} - {task.student_name}", expanded=False):
+            col_info, col_actions, col_delete = st.columns([3, 2, 1])
+            
+            with col_info:
+                st.write(f"**👨‍🎓 Оқушы:** {task.student_name}")
+                st.write(f"**🏫 Сынып:** {task.class_name}")
+                st.write(f"**📅 Мерзімі:** {task.due_date_formatted}")
+                
+                if task.is_overdue:
+                    st.error(f"⏰ Мерзімі өткен! ({task.days_left or 0} күн бұрын)")
+                
+                st.write(f"**⭐ Ұпай:** {task.points}")
+                st.write(f"**📊 Статус:** {task.display_status}")
+                
+                if task.tags:
+                    st.write(f"**🏷️ Тегтер:** {task.tags}")
+                
+                if task.difficulty:
+                    st.write(f"**⚡ Қиындық:** {task.difficulty}")
+                
+                # ТАПСЫРМА ФАЙЛЫ ТУРАЛЫ АҚПАРАТ
+                if task.task_file_name:
+                    st.write(f"**📎 Тапсырма файлы:** {task.task_file_name}")
+                    if task.task_file_size_str:
+                        st.write(f"**📦 Көлемі:** {task.task_file_size_str}")
+                
+                if task.student_submitted_date_formatted:
+                    st.write(f"**📤 Жіберілді:** {task.student_submitted_date_formatted}")
+                
+                # ЖАУАП ФАЙЛЫ ТУРАЛЫ АҚПАРАТ
+                if task.student_answer_file_name:
+                    st.write(f"**📎 Жауап файлы:** {task.student_answer_file_name}")
+                    if task.student_answer_file_size_str:
+                        st.write(f"**📦 Көлемі:** {task.student_answer_file_size_str}")
+                
+                if task.score:
+                    st.success(f"**📊 Баға:** {task.score}/{task.points}")
+                
+                if task.task_description:
+                    with st.expander("📝 Сипаттама", expanded=False):
+                        st.write(task.task_description)
+                
+                if task.student_answer_text:
+                    with st.expander("✍️ Оқушының жауабы", expanded=False):
+                        st.write(task.student_answer_text)
+                
+                if task.teacher_feedback:
+                    with st.expander("💬 Кері байланыс", expanded=False):
+                        st.write(task.teacher_feedback)
+            
+            with col_actions:
+                # ТАПСЫРМА ФАЙЛЫН КӨРСЕТУ ЖӘНЕ ЖҮКТЕП АЛУ
+                task_file = task.task_file
+                if task_file:
+                    st.markdown("**📥 Тапсырма файлы:**")
+                    
+                    # Файлды көрсету түймесі
+                    if st.button("👁️ Көрсету", key=f"show_task_{task.id}", use_container_width=True):
+                        st.session_state.preview_file = {
+                            'id': task.id,
+                            'type': 'task',
+                            'name': task_file['filename']
+                        }
+                        st.rerun()
+                    
+                    # Файлды жүктеп алу түймесі
+                    st.download_button(
+                        label="📥 Жүктеп алу",
+                        data=lambda sha256=task_file['sha256']: read_blob(sha256),
+                        file_name=task_file['filename'],
+                        mime=task_file['type'],
+                        key=f"task_dl_{task.id}"
+                    )
+                
+                # ЖАУАП ФАЙЛЫН КӨРСЕТУ ЖӘНЕ ЖҮКТЕП АЛУ
+                answer_file = task.answer_file
+                if answer_file:
+                    st.markdown("---")
+                    st.markdown("**📥 Жауап файлы:**")
+                    
+                    # Файлды көрсету түймесі
+                    if st.button("👁️ Көрсету", key=f"show_answer_{task.id}", use_container_width=True):
+                        st.session_state.preview_file = {
+                            'id': task.id,
+                            'type': 'answer',
+                            'name': answer_file['filename']
+                        }
+                        st.rerun()
+                    
+                    # Файлды жүктеп алу түймесі
+                    st.download_button(
+                        label="📥 Жүктеп алу",
+                        data=lambda sha256=answer_file['sha256']: read_blob(sha256),
+                        file_name=answer_file['filename'],
+                        mime=answer_file['type'],
+                        key=f"answer_dl_{task.id}"
+                    )
+                
+                # Бағалау формасы
+                st.markdown("---")
+                with st.form(key=f"grade_form_{task.id}"):
+                    st.write("**📊 Бағалау**")
+                    
+                    score = st.number_input(
+                        "Балл",
+                        min_value=0,
+                        max_value=task.points,
+                        value=task.score or 0,
+                        key=f"score_{task.id}"
+                    )
+                    
+                    feedback = st.text_area(
+                        "Кері байланыс",
+                        value=task.teacher_feedback or '',
+                        height=100,
+                        key=f"feedback_{task.id}"
+                    )
+                    
+                    col_btn1, col_btn2 = st.columns(2)
+                    
+                    with col_btn1:
+                        if st.form_submit_button("💾 Сақтау", use_container_width=True):
+                            success, message = update_unified_task_status(
+                                task.id, 
+                                'Тексерілді',
+                                feedback,
+                                score
+                            )
+                            if success:
+                                st.success("✅ Баға сақталды!")
+                                time.sleep(1)
+                                st.rerun()
+            
+            with col_delete:
+                st.markdown("---")
+                if st.button("🗑️ Жою", key=f"delete_task_{task.id}", use_container_width=True):
+                    success, message = delete_unified_task(task.id)
+                    if success:
+                        st.success("✅ Тапсырма жойылды!")
+                        time.sleep(1)
+                        st.rerun()
+
+def show_task_statistics_unified_section():
+    """Тапсырма статистикасы"""
+    st.subheader("📊 Тапсырмалар статистикасы")
+    
+    stats = get_task_statistics_unified(st.session_state.user[0])
+    
+    if not stats:
+        st.info("Статистика жоқ")
+        return
+    
+    # Статистиканы көрсету
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.metric("Барлығы", stats['total'])
+    
+    with col2:
+        st.metric("Тағайындалды", stats['assigned'])
+    
+    with col3:
+        st.metric("Жіберілді", stats['submitted'])
+    
+    with col4:
+        st.metric("Тексерілді", stats['checked'])
+    
+    with col5:
+        st.metric("Кешікті", stats['overdue'])
+    
+    # График
+    st.markdown("---")
+    st.subheader("📈 Статистика графигі")
+    
+    categories = ['Тағайындалды', 'Жіберілді', 'Тексерілді', 'Кешікті']
+    values = [stats['assigned'], stats['submitted'], stats['checked'], stats['overdue']]
+    
+    st.image(render_chart(draw_task_status_chart, categories, values), use_container_width=True)
+
+def show_visual_materials():
+    """Көрнекіліктерді көрсету"""
+    t = texts[st.session_state.language]
+    
+    st.markdown(f"<h2>📁 {t['visual_materials']}</h2>", unsafe_allow_html=True)
+    
+    # Файл жүктеу бөлімі
+    with st.form("upload_file_form"):
+        st.subheader("📤 Жаңа файл жүктеу")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            file_name = st.text_input("📝 Файл атауы")
+            uploaded_file = st.file_uploader(
+                "📁 Файлды таңдаңыз",
+                type=['pdf', 'doc', 'docx', 'txt', 'xlsx', 'pptx', 'jpg', 'png', 'mp4', 'mp3', 'zip']
+            )
+        
+        with col2:
+            category = st.selectbox(
+                "📂 Категория",
+                ["Сабақ материалы", "Көрнекілік", "Тапсырма", "Бақылау", "БЖБ", "Басқа"]
+            )
+        
+        if st.form_submit_button("📤 Файлды жүктеу", use_container_width=True):
+            if file_name and uploaded_file:
+                if save_file_to_db(st.session_state.user[0], file_name, uploaded_file, category):
+                    st.success("✅ Файл сәтті жүктелді!")
+                    time.sleep(1)
+                    st.rerun()
+                else:
+                    st.error("❌ Файлды жүктеу кезінде қате пайда болды")
+            else:
+                st.error("❌ Файл атауы мен файлды толтырыңыз!")
+    
+    # Файлдар тізімі
+    st.markdown("---")
+    st.subheader("📋 Файлдар тізімі")
+    
+    files = get_saved_files(st.session_state.user[0])
+    
+    if not files:
+        st.info("📭 Файлдар жоқ")
+        return
+    
+    # Категория бойынша сүзгі
+    categories = ["Барлығы"] + sorted(list(set([f['category'] for f in files])))
+    selected_category = st.selectbox("Категория бойынша сүзгі", categories)
+    
+    # Көрсетілетін файлдар
+    display_files = files
+    if selected_category != "Барлығы":
+        display_files = [f for f in files if f['category'] == selected_category]
+    
+    for file in display_files:
+        with st.expander(f"📁 {file['name']} ({file['category']})", expanded=False):
+            col_info, col_preview, col_actions = st.columns([2, 2, 1])
+            
+            with col_info:
+                st.markdown(f"**Түрі:** {file['type']}")
+                st.markdown(f"**Көлемі:** {file['size']}")
+                st.markdown(f"**Жүктелген:** {file['uploaded']}")
+                st.markdown(f"**Категория:** {file['category']}")
+            
+            with col_preview:
+                if st.button("👁️ Көрсету", key=f"preview_{file['id']}"):
+                    st.session_state.preview_file = {'id': file['id'], 'type': 'visual'}
+                    st.rerun()
+                
+                # Файлды жүктеп алу - мазмұны тек басылғанда оқылады
+                if file['sha256']:
+                    st.download_button(
+                        label="📥 Жүктеп алу",
+                        data=lambda sha256=file['sha256']: read_blob(sha256),
+                        file_name=file['name'],
+                        mime=file['type'],
+                        key=f"download_{file['id']}"
+                    )
+            
+            with col_actions:
+                if st.button("🗑️", key=f"delete_{file['id']}"):
+                    if delete_file(file['id']):
+                        st.success("✅ Файл жойылды!")
+                        time.sleep(1)
+                        st.rerun()
+
+def show_ai_tools():
+    """AI құралдарын көрсету"""
+    t = texts[st.session_state.language]
+    
+    st.markdown(f"<h2>🤖 {t['ai_tools']}</h2>", unsafe_allow_html=True)
+    
+    # AI құралдары карточкалары
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        with st.container():
+            st.markdown("""
+            <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                        padding: 20px; border-radius: 10px; color: white; margin-bottom: 20px;'>
+                <h3>📝 AI Сабақ жоспары</h3>
+                <p>Пән, сынып деңгейі және тақырып негізінде сабақ жоспарын жасау</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            if st.button("📝 Жасау", use_container_width=True):
+                st.session_state.current_ai_tool = "lesson_plan"
+                st.rerun()
+    
+    with col2:
+        with st.container():
+            st.markdown("""
+            <div style='background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); 
+                        padding: 20px; border-radius: 10px; color: white; margin-bottom: 20px;'>
+                <h3>📊 Оқушы талдауы</h3>
+                <p>Оқушылардың үлгерімі бойынша толық талдау жасау</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            if st.button("📊 Талдау", use_container_width=True):
+                st.session_state.current_ai_tool = "student_analysis"
+                st.rerun()
+    
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        with st.container():
+            st.markdown("""
+            <div style='background: linear-gradient(135deg, #4facfe 0%, #00f2fe 100%); 
+                        padding: 20px; border-radius: 10px; color: white; margin-bottom: 20px;'>
+                <h3>🎯 Тапсырма генераторы</h3>
+                <p>Тақырып пен деңгей бойынша тапсырмалар жасау</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            if st.button("🎯 Құру", use_container_width=True):
+                st.session_state.current_ai_tool = "task_generator"
+                st.rerun()
+    
+    with col4:
+        with st.container():
+            st.markdown("""
+            <div style='background: linear-gradient(135deg, #43e97b 0%, #38f9d7 100%); 
+                        padding: 20px; border-radius: 10px; color: white; margin-bottom: 20px;'>
+                <h3>📋 Бағалау критерийлері</h3>
+                <p>Тапсырмалар үшін бағалау критерийлерін жасау</p>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            if st.button("📋 Жасау", use_container_width=True):
+                st.session_state.current_ai_tool = "assessment_rubric"
+                st.rerun()
+    
+    # AI құралын көрсету
+    if st.session_state.get('current_ai_tool'):
+        show_ai_tool_content(st.session_state.current_ai_tool)
+
+def show_ai_tool_content(tool_name):
+    """AI құралының мазмұнын көрсету"""
+    t = texts[st.session_state.language]
+    
+    st.markdown("---")
+    
+    if st.button(f"← {t['back']}"):
+        st.session_state.current_ai_tool = None
+        st.rerun()
+    
+    if tool_name == "lesson_plan":
+        show_ai_lesson_plan()
+    elif tool_name == "student_analysis":
+        show_student_analysis()
+    elif tool_name == "task_generator":
+        show_task_generator()
+    elif tool_name == "assessment_rubric":
+        show_assessment_rubric()
+
+def show_ai_lesson_plan():
+    """AI сабақ жоспары"""
+    st.subheader("📝 AI Сабақ жоспары")
+    
+    with st.form("lesson_plan_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            subject = st.text_input("Пән", value="Математика")
+            grade_level = st.selectbox("Сынып", ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"])
+            lesson_type = st.selectbox("Сабақ түрі", ["Жаңа білім", "Бекіту", "Қорытынды", "Практикалық", "Бақылау"])
+        
+        with col2:
+            topic = st.text_input("Тақырып", value="Бөлшектерді қосу")
+            duration = st.number_input("Сабақ ұзақтығы (минут)", min_value=20, max_value=120, value=40)
+            teaching_method = st.selectbox("Оқыту әдісі", ["Дәстүрлі", "Интерактивті", "Топтық", "Жобалық", "Проблемалық"])
+        
+        goals = st.text_area("Сабақтың мақсаттары", 
+                           value="1. Бөлшектерді қосу ережесін меңгерту\n2. Есептер шығару дағдысын дамыту")
+        equipment = st.text_input("Қажетті құрал-жабдықтар", 
+                                value="Оқулық, дәптер, бор, слайдтар, интерактивті тақта")
+        
+        if st.form_submit_button("🤖 Сабақ жоспарын жасау"):
+            with st.spinner("AI сабақ жоспарын жасауда..."):
+                time.sleep(2)
+                
+                st.success("✅ Сабақ жоспары сәтті жасалды!")
+                
+                # AI жасаған сабақ жоспары
+                st.markdown("### 🤖 AI жасаған сабақ жоспары")
+                
+                lesson_plan = f"""
+## 📚 Сабақ жоспары: {subject} - {topic}
+
+### 🎯 Сабақтың мақсаттары:
+{goals}
+
+### 📝 Негізгі құзыреттіліктер:
+1. Білімділік: {topic} тақырыбын түсіну және қолдану
+2. Іскерлік: Есептер шығару дағдысын дамыту
+3. Тәрбиелік: Өздігінен жұмыс істеу дағдысын қалыптастыру
+
+### ⏰ Сабақ кезеңдері:
+#### 1. Ұйымдастыру кезеңі (5 минут)
+- Сыныптың дайындығын тексеру
+- Сабақтың мақсатын түсіндіру
+- Мотивациялық сәт
+
+#### 2. Жаңа білімді меңгеру (15 минут)
+- Жаңа тақырыпты түсіндіру
+- Мысалдар келтіру
+- Оқушылармен бірлесіп жұмыс
+
+#### 3. Бекіту кезеңі (15 минут)
+- Практикалық тапсырмалар
+- Топтық жұмыс
+- Жеке жұмыс
+
+#### 4. Қорытынды (5 минут)
+- Өтілген тақырыпты қорытындылау
+- Бағалау
+- Үйге тапсырма беру
+
+### 📊 Бағалау критерийлері:
+- Өздігінен жұмыс істеу - 25%
+- Дұрыс шешім - 50%
+- Түсіндіру қабілеті - 25%
+
+### 🏠 Үй тапсырмасы:
+Оқулықтан №1-20 есептер
+
+### 🔍 Рефлексия:
+Сабақ соңында оқушылардан кері байланыс алу, қиындықтарды анықтау және шешу жолдарын ұсыну.
+"""
+                
+                st.markdown(lesson_plan)
+                
+                # Жүктеп алу опциясы
+                st.download_button(
+                    label="📥 Сабақ жоспарын жүктеп алу",
+                    data=lesson_plan,
+                    file_name=f"Сабақ_жоспары_{subject}_{topic}.txt",
+                    mime="text/plain"
+                )
+
+def show_student_analysis():
+    """Оқушылардың үлгерімін талдау"""
+    st.subheader("📊 Оқушы талдауы")
+    
+    classes = get_classes(st.session_state.user[0])
+    if not classes:
+        st.info("Алдымен сынып қосыңыз.")
+        return
+    
+    class_options = {f"{c[1]} (Сынып {c[3]})": c[0] for c in classes}
+    selected_class_name = st.selectbox("Сыныпты таңдаңыз", list(class_options.keys()))
+    selected_class_id = class_options[selected_class_name]
+    
+    students = get_students_by_class(selected_class_id)
+    
+    if not students:
+        st.info("Бұл сыныпта оқушылар жоқ.")
+        return
+    
+    # Оқушыларды талдау
+    if st.button("🤖 Оқушыларды талдау", use_container_width=True):
+        with st.spinner("AI оқушыларды талдауда..."):
+            time.sleep(2)
+            
+            # Статистиканы есептеу
+            total_students = len(students)
+            grade_points_list = []
+            performance_levels = {"Өте жақсы": 0, "Жақсы": 0, "Орташа": 0, "Қанағаттанарлық": 0, "Әлсіз": 0}
+            
+            for student in students:
+                points = student[4] if len(student) > 4 else 0
+                if isinstance(points, str):
+                    try:
+                        points = float(points)
+                    except:
+                        points = 0
+                grade_points_list.append(points)
+                
+                performance = student[5] if len(student) > 5 else "Орташа"
+                performance_levels[performance] = performance_levels.get(performance, 0) + 1
+            
+            avg_points = sum(grade_points_list) / total_students if total_students > 0 else 0
+            max_points = max(grade_points_list) if grade_points_list else 0
+            min_points = min(grade_points_list) if grade_points_list else 0
+            
+            # AI талдауы
+            analysis = f"""
+## 📊 Оқушы талдауы: {selected_class_name}
+
+### 📈 Статистика:
+- **Барлық оқушылар:** {total_students} адам
+- **Орташа балл:** {avg_points:.1f}/10
+- **Ең жоғары балл:** {max_points}/10
+- **Ең төмен балл:** {min_points}/10
+
+### 📊 Оқу деңгейлері:
+- Өте жақсы: {performance_levels['Өте жақсы']} адам ({performance_levels['Өте жақсы']/total_students*100:.1f}%)
+- Жақсы: {performance_levels['Жақсы']} адам ({performance_levels['Жақсы']/total_students*100:.1f}%)
+- Орташа: {performance_levels['Орташа']} адам ({performance_levels['Орташа']/total_students*100:.1f}%)
+- Қанағаттанарлық: {performance_levels['Қанағаттанарлық']} адам ({performance_levels['Қанағаттанарлық']/total_students*100:.1f}%)
+- Әлсіз: {performance_levels['Әлсіз']} адам ({performance_levels['Әлсіз']/total_students*100:.1f}%)
+
+### 🎯 AI Ұсынымдары:
+
+#### 1. Өте жақсы оқушыларға ({performance_levels['Өте жақсы']} адам):
+- Күрделі тапсырмалар беру
+- Зерттеу жобаларын ұсыну
+- Басқа оқушыларға көмектесуге ынталандыру
+
+#### 2. Жақсы оқушыларға ({performance_levels['Жақсы']} адам):
+- Қосымша практикалық тапсырмалар
+- Білімдерін тереңдету
+- Өздігінен жұмыс істеу дағдысын дамыту
+
+#### 3. Орташа оқушыларға ({performance_levels['Орташа']} адам):
+- Негізгі білімді нығайту
+- Қадамдық түсіндіру
+- Көп практика
+
+#### 4. Қанағаттанарлық оқушыларға ({performance_levels['Қанағаттанарлық']} адам):
+- Жеңілдетілген тапсырмалар
+- Жеке көмек
+- Мотивацияны арттыру
+
+#### 5. Әлсіз оқушыларға ({performance_levels['Әлсіз']} адам):
+- Индивидуалды көмек
+- Негізгі білімді қайталау
+- Қарапайым тапсырмалар
+- Жетістіктерін марапаттау
+
+### 📝 Жалпы ұсынымдар:
+1. **Дифференциалды оқыту:** Әр оқушының деңгейіне қарай тапсырмалар беру
+2. **Топтық жұмыс:** Өте жақсы оқушыларды әлсіз оқушылармен топтастыру
+3. **Қайталау:** Көп қайталау арқылы білімді бекіту
+4. **Мотивация:** Жетістіктерін марапаттап, ынталандыру
+5. **Үй тапсырмасы:** Әр оқушының деңгейіне сай үй тапсырмасы беру
+"""
+            
+            st.markdown(analysis)
+            
+            # Графиктер
+            grade_categories = ['Өте жақсы', 'Жақсы', 'Орташа', 'Қанағаттанарлық', 'Әлсіз']
+            grade_values = [performance_levels[cat] for cat in grade_categories]
+            chart = render_chart(
+                draw_student_analysis_charts,
+                grade_categories, grade_values, grade_points_list, avg_points,
+                figsize=(14, 6)
+            )
+            st.image(chart, use_container_width=True)
+            
+            # Жүктеп алу опциясы
+            st.download_button(
+                label="📥 Талдауды жүктеп алу",
+                data=analysis,
+                file_name=f"Оқушы_талдауы_{selected_class_name}.txt",
+                mime="text/plain"
+            )
+
+def show_task_generator():
+    """Тапсырма генераторы"""
+    st.subheader("🎯 AI Тапсырма генераторы")
+    
+    with st.form("task_generator_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            subject = st.text_input("Пән", value="Математика")
+            topic = st.text_input("Тақырып", value="Бөлшектер")
+            difficulty = st.selectbox("Қиындық деңгейі", ["Оңай", "Орташа", "Қиын"])
+        
+        with col2:
+            grade_level = st.selectbox("Сынып", ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"])
+            task_type = st.selectbox("Тапсырма түрі", ["Теориялық", "Практикалық", "Есептер", "Сынақ", "Жоба"])
+            task_count = st.slider("Тапсырмалар саны", 1, 20, 5)
+        
+        additional_info = st.text_area("Қосымша ақпарат", 
+                                     placeholder="Тапсырмаға қажетті қосымша ақпарат...")
+        
+        if st.form_submit_button("🤖 Тапсырмаларды жасау", use_container_width=True):
+            with st.spinner("AI тапсырмаларды жасауда..."):
+                time.sleep(2)
+                
+                st.success("✅ Тапсырмалар сәтті жасалды!")
+                
+                # AI жасаған тапсырмалар
+                tasks = f"""
+## 📚 {subject} - {topic}
+## 🎯 Қиындық: {difficulty}
+## 👨‍🎓 Сынып: {grade_level}
+
+### 📝 Тапсырмалар:
+
+"""
+                
+                # Әр түрлі тапсырмалар
+                task_templates = {
+                    "Оңай": [
+                        "Түсіндіріп беріңіз:",
+                        "Анықтамасын жазыңыз:",
+                        "Мысал келтіріңіз:",
+                        "Салыстырыңыз:",
+                        "Тізім жасаңыз:"
+                    ],
+                    "Орташа": [
+                        "Талдап жазсаңыз:",
+                        "Сипаттап беріңіз:",
+                        "Себеп-салдарын түсіндіріңіз:",
+                        "Есеп шығарыңіз:",
+                        "Дәлелдеңіз:"
+                    ],
+                    "Қиын": [
+                        "Зерттеп, қорытынды жасаңіз:",
+                        "Талдау жүргізіңіз:",
+                        "Өз пікіріңізді негіздеңіз:",
+                        "Кешенді есеп шығарыңыз:",
+                        "Жоба әзірлеңіз:"
+                    ]
+                }
+                
+                selected_templates = task_templates.get(difficulty, task_templates["Орташа"])
+                
+                for i in range(task_count):
+                    task_template = selected_templates[i % len(selected_templates)]
+                    tasks += f"""
+#### Тапсырма {i+1}: {task_template} {topic} тақырыбы бойынша.
+
+**Баға:** {random.randint(5, 10)} балл
+**Күрделілік:** {difficulty}
+**Уақыт:** {random.randint(5, 15)} минут
+**Ұсыныс:** Оқулықтан {random.randint(1, 50)}-есепті қараңыз
+
+---
+"""
+                
+                st.markdown(tasks)
+                
+                # Жүктеп алу опциясы
+                st.download_button(
+                    label="📥 Тапсырмаларды жүктеп алу",
+                    data=tasks,
+                    file_name=f"Тапсырмалар_{subject}_{topic}.txt",
+                    mime="text/plain"
+                )
+
+def show_assessment_rubric():
+    """Бағалау критерийлері"""
+    st.subheader("📋 AI Бағалау критерийлері")
+    
+    with st.form("rubric_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            subject = st.text_input("Пән", value="Математика")
+            task_type = st.selectbox("Тапсырма түрі", 
+                                   ["Теориялық сұрақ", "Есеп шығару", "Жоба", "Презентация", "Сынақ"])
+            max_score = st.number_input("Максималды балл", min_value=1, max_value=100, value=10)
+        
+        with col2:
+            grade_level = st.selectbox("Сынып", ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11"])
+            criteria_count = st.slider("Критерийлер саны", 1, 10, 4)
+        
+        task_description = st.text_area("Тапсырма сипаттамасы", 
+                                      placeholder="Тапсырманың толық сипаттамасы...")
+        
+        if st.form_submit_button("🤖 Критерийлерді жасау", use_container_width=True):
+            with st.spinner("AI критерийлерді жасауда..."):
+                time.sleep(2)
+                
+                st.success("✅ Бағалау критерийлері сәтті жасалды!")
+                
+                # Бағалау критерийлері
+                rubric = f"""
+## 📋 Бағалау критерийлері
+## 📚 Пән: {subject}
+## 🎯 Тапсырма түрі: {task_type}
+## 👨‍🎓 Сынып: {grade_level}
+## ⭐ Максималды балл: {max_score}
+
+### 📝 Тапсырма сипаттамасы:
+{task_description if task_description else "Жоқ"}
+
+### 📊 Бағалау критерийлері:
+"""
+                
+                # Әр түрлі критерийлер
+                criteria_options = [
+                    ("Білімділік", "Тақырыпты түсіну деңгейі", 25),
+                    ("Іскерлік", "Есеп шығару дағдысы", 25),
+                    ("Талдау", "Талдау және салыстыру қабілеті", 20),
+                    ("Шығармашылық", "Шығармашылық және инновация", 15),
+                    ("Ұйымдастыру", "Жұмысты ұйымдастыру", 10),
+                    ("Уақыт", "Уақытты тиімді пайдалану", 5),
+                    ("Өздігінен жұмыс", "Өздігінен жұмыс істеу", 10),
+                    ("Түсіндіру", "Нәтижелерді түсіндіру", 15),
+                    ("Дәлдік", "Есептеулердің дәлдігі", 20),
+                    ("Толықтық", "Жауаптың толықтығы", 15)
+                ]
+                
+                # Критерийлерді таңдау
+                selected_criteria = random.sample(criteria_options, min(criteria_count, len(criteria_options)))
+                
+                # Баллды бөлу
+                total_percentage = sum(c[2] for c in selected_criteria)
+                for i, (name, description, percentage) in enumerate(selected_criteria):
+                    adjusted_percentage = (percentage / total_percentage) * 100
+                    score = (adjusted_percentage / 100) * max_score
+                    
+                    rubric += f"""
+#### Критерий {i+1}: {name}
+**Сипаттама:** {description}
+**Балл:** {score:.1f} / {max_score * (adjusted_percentage/100):.1f}
+**Бағалау дескрипторлары:**
+
+- **5 (Өте жақсы):** Толық сәйкестік, барлық талаптар орындалған
+- **4 (Жақсы):** Жетілдіруге болатын аздаған қателіктер
+- **3 (Қанағаттанарлық):** Негізгі талаптар орындалған
+- **2 (Қанағаттанарлықсыз):** Маңызды қателіктер бар
+- **1 (Әлсіз):** Тапсырма орындалмаған
+
+---
+"""
+                
+                st.markdown(rubric)
+                
+                # Жүктеп алу опциясы
+                st.download_button(
+                    label="📥 Критерийлерді жүктеп алу",
+                    data=rubric,
+                    file_name=f"Бағалау_критерийлері_{subject}_{task_type}.txt",
+                    mime="text/plain"
+                )
+
+def show_student_portal():
+    """Оқушы порталы - ФАЙЛДАРМЕН КӨРСЕТУ"""
+    t = texts[st.session_state.language]
+    
+    # Шығу
+    with st.sidebar:
+        if st.button(f"🚪 {t['logout']}", use_container_width=True, key="student_logout"):
+            clear_student_session()
+            st.session_state.clear()
+            st.rerun()
+    
+    st.markdown(f"""
+    <div style='background: linear-gradient(135deg, #00b09b, #96c93d); 
+                padding: 1.5rem; border-radius: 10px; color: white; margin-bottom: 20px;'>
+        <h2 style='margin: 0; text-align: center;'>🎒 ОҚУШЫ ПОРТАЛЫ</h2>
+        <p style='margin: 0; text-align: center; font-size: 1.2rem;'>{st.session_state.student[1]} - {st.session_state.student[4]}</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Статистика
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Балл", f"{st.session_state.student[6]}/10")
+    
+    with col2:
+        grade = points_to_grade(st.session_state.student[6])
+        grade_class = get_grade_class(grade)
+        st.markdown(f"""
+        <div style='text-align: center;'>
+            <div style='font-size: 2rem; font-weight: bold; color: {grade_class};'>{grade}</div>
+            <div>Баға</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.metric("Оқу деңгейі", st.session_state.student[7])
+    
+    with col4:
+        tasks = get_unified_student_tasks_by_student(st.session_state.student[0])
+        completed_tasks = len([t for t in tasks if t.status == 'Тексерілді'])
+        total_tasks = len(tasks)
+        if total_tasks > 0:
+            completion_rate = int((completed_tasks / total_tasks) * 100)
+            st.metric("Тапсырмалар", f"{completion_rate}%")
+        else:
+            st.metric("Тапсырмалар", "0%")
+    
+    # Оқушыға берілген тапсырмалар
+    st.markdown("---")
+    st.subheader("📋 Менің тапсырмаларым")
+    
+    tasks = get_unified_student_tasks_by_student(st.session_state.student[0])
+    
+    if not tasks:
+        st.info("📭 Сізге тапсырмалар әлі жіберілмеген")
+    else:
+        # Сүзгілер
+        col1, col2 = st.columns(2)
+        with col1:
+            status_filter = st.selectbox(
+                "Статус бойынша сүзгі",
+                ["Барлығы", "Тағайындалды", "Кешікті", "Жіберілді", "Тексерілді"],
+                key="student_task_filter"
+            )
+        with col2:
+            student_search = st.text_input("Іздеу...", key="student_task_search")
+        
+        # Тапсырмаларды көрсету
+        display_tasks = tasks
+        if student_search:
+            display_tasks = search_unified_tasks(
+                student_search, student_id=st.session_state.student[0], limit=len(tasks)
+            )
+        if status_filter != "Барлығы":
+            display_tasks = [t for t in display_tasks if t.display_status == status_filter]
+        
+        for task in display_tasks:
+            status_colors = {
+                "Тағайындалды": "🔴",
+                "Кешікті": "⏰",
+                "Жіберілді": "🟡",
+                "Тексерілді": "🟢"
+            }
+            status_icon = status_colors.get(task.display_status, "⚪")
+            
+            with st.expander(f"{status_icon} {task.task_name} - {task.teacher_name}", expanded=False):
+                col_info, col_submit = st.columns([3, 2])
+                
+                with col_info:
+                    st.markdown(f"**👨‍🏫 Мұғалім:** {task.teacher_name}")
+                    st.markdown(f"**🏫 Сынып:** {task.class_name}")
+                    st.markdown(f"**📅 Мерзімі:** {task.due_date_formatted}")
+                    
+                    if task.is_overdue:
+                        st.error(f"⏰ Мерзімі өткен! ({task.days_left or 0} күн бұрын)")
+                    
+                    st.markdown(f"**⭐ Ұпай:** {task.points}")
+                    st.markdown(f"**📊 Статус:** {task.display_status}")
+                    
+                    # ТАПСЫРМА ФАЙЛЫ ТУРАЛЫ АҚПАРАТ
+                    if task.task_file_name:
+                        st.markdown(f"**📎 Тапсырма файлы:** {task.task_file_name}")
+                        if task.task_file_size_str:
+                            st.markdown(f"**📦 Көлемі:** {task.task_file_size_str}")
+                    
+                    if task.student_submitted_date_formatted:
+                        st.markdown(f"**📤 Сіз жібердіңіз:** {task.student_submitted_date_formatted}")
+                    
+                    if task.score:
+                        st.success(f"**📊 Бағаңыз:** {task.score}/{task.points}")
+                    
+                    if task.task_description:
+                        with st.expander("📝 Тапсырма сипаттамасы", expanded=False):
+                            st.write(task.task_description)
+                    
+                    if task.teacher_feedback:
+                        with st.expander("💬 Мұғалімнің кері байланысы", expanded=False):
+                            st.write(task.teacher_feedback)
+                
+                with col_submit:
+                    # ТАПСЫРМА ФАЙЛЫН КӨРСЕТУ ЖӘНЕ ЖҮКТЕП АЛУ
+                    task_file = task.task_file
+                    if task_file:
+                        st.markdown("**📥 Тапсырма файлы:**")
+                        
+                        # Файлды көрсету түймесі
+                        if st.button("👁️ Көрсету", key=f"student_show_task_{task.id}", use_container_width=True):
+                            st.session_state.preview_file = {
+                                'id': task.id,
+                                'type': 'task',
+                                'name': task_file['filename']
+                            }
+                            st.rerun()
+                        
+                        # Файлды жүктеп алу түймесі
+                        st.download_button(
+                            label="📥 Жүктеп алу",
+                            data=lambda sha256=task_file['sha256']: read_blob(sha256),
+                            file_name=task_file['filename'],
+                            mime=task_file['type'],
+                            key=f"student_download_{task.id}"
+                        )
+                    
+                    # ЖАУАП ЖІБЕРУ (ЕГЕР ӘЛІ ЖІБЕРМЕГЕН БОЛСА)
+                    if task.display_status in ['Тағайындалды', 'Кешікті']:
+                        st.markdown("---")
+                        st.write("**✍️ Жауап беру:**")
+                        
+                        with st.form(key=f"student_submit_{task.id}"):
+                            answer_text = st.text_area(
+                                "Жауап мәтіні",
+                                value=task.student_answer_text or '',
+                                height=150,
+                                key=f"student_answer_{task.id}"
+                            )
+                            
+                            answer_file = st.file_uploader(
+                                "📁 Файл жүктеу (міндетті емес)",
+                                type=['pdf', 'doc', 'docx', 'txt', 'jpg', 'png', 'xlsx', 'pptx'],
+                                key=f"student_file_{task.id}"
+                            )
+                            
+                            if st.form_submit_button("📤 Жауап жіберу", use_container_width=True):
+                                if answer_text or answer_file:
+                                    success, message = submit_unified_student_answer(
+                                        task.id,
+                                        answer_text,
+                                        answer_file
+                                    )
+                                    
+                                    if success:
+                                        st.success("✅ Жауап сәтті жіберілді!")
+                                        time.sleep(2)
+                                        st.rerun()
+                                    else:
+                                        st.error(f"❌ {message}")
+                                else:
+                                    st.warning("⚠️ Жауап мәтінін енгізіңіз немесе файл жүктеңіз")
+                    
+                    # ӨЗ ЖАУАБЫҢЫЗДЫ КӨРУ
+                    elif task.student_answer_text:
+                        st.markdown("---")
+                        st.info(f"**✍️ Сіздің жауабыңыз:**\n{task.student_answer_text}")
+                        
+                        # ЖАУАП ФАЙЛЫН КӨРСЕТУ
+                        answer_file = task.answer_file
+                        if answer_file:
+                            st.markdown("**📎 Сіздің файлыңыз:**")
+                            
+                            # Файлды көрсету түймесі
+                            if st.button("👁️ Көрсету", key=f"student_show_answer_{task.id}", use_container_width=True):
+                                st.session_state.preview_file = {
+                                    'id': task.id,
+                                    'type': 'answer',
+                                    'name': answer_file['filename']
+                                }
+                                st.rerun()
+                            
+                            # Файлды жүктеп алу түймесі
+                            st.download_button(
+                                label="📥 Жүктеп алу",
+                                data=lambda sha256=answer_file['sha256']: read_blob(sha256),
+                                file_name=answer_file['filename'],
+                                mime=answer_file['type'],
+                                key=f"student_answer_dl_{task.id}"
+                            )
+
+def show_file_preview():
+    """Файлды алдын ала көру - ЖАҢА ТҮЗЕТІЛГЕН"""
+    if st.session_state.get('preview_file'):
+        file_info = st.session_state.preview_file
+        
+        st.markdown("---")
+        st.subheader("📄 Файлды көрсету")
+        
+        if file_info['type'] == 'bzb':
+            file_data = get_bzb_task(file_info['id'])
+            if file_data:
+                preview_file(file_data['sha256'], file_data['type'], file_data['name'])
+        
+        elif file_info['type'] == 'visual':
+            file_data = get_visual_material(file_info['id'])
+            if file_data:
+                preview_file(file_data['sha256'], file_data['type'], file_data['name'])
+        
+        elif file_info['type'] == 'task':
+            file_data = get_unified_task_file(file_info['id'], 'task')
+            if file_data:
+                display_file_preview(file_data['sha256'], file_data['type'], file_data['filename'])
+        
+        elif file_info['type'] == 'answer':
+            file_data = get_unified_task_file(file_info['id'], 'answer')
+            if file_data:
+                display_file_preview(file_data['sha256'], file_data['type'], file_data['filename'])
+        
+        if st.button("← Артқа"):
+            st.session_state.preview_file = None
+            st.rerun()
+
+def show_dashboard():
+    """Басқару панелі"""
+    t = texts[st.session_state.language]
+    
+    # Барлық көрсеткіштер бір сұраныспен
+    summary = get_dashboard_summary(st.session_state.user[0])
+    
+    # Ақпарат панелі
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("🏫 Сыныптар", summary['class_count'])
+    
+    with col2:
+        st.metric("👨‍🎓 Оқушылар", summary['student_count'])
+    
+    with col3:
+        st.metric("📚 Пәндер", summary['subject_count'])
+    
+    with col4:
+        # Тапсырма статистикасы
+        st.metric("📋 Тапсырмалар", summary['task_stats'].get('total', 0))
+    
+    # Жылдам қолжетімділік карточкалары
+    st.markdown("---")
+    st.subheader("⚡ Жылдам қолжетімділік")
+    
+    cols = st.columns(4)
+    tools = [
+        ("🏫 Сыныптар", "classes", "blue"),
+        ("👨‍🎓 Оқушылар", "students", "green"),
+        ("🎯 Тапсырмалар", "student_tasks", "orange"),
+        ("🤖 AI құралдары", "ai_tools", "purple")
+    ]
+    
+    for i, (title, page, color) in enumerate(tools):
+        with cols[i]:
+            if st.button(title, use_container_width=True, 
+                        key=f"quick_{page}"):
+                st.session_state.current_page = page
+                st.rerun()
+    
+    # Соңғы тапсырмалар
+    st.markdown("---")
+    st.subheader("📝 Соңғы тапсырмалар")
+    
+    tasks = summary['recent_tasks']
+    if tasks:
+        for task in tasks:
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown(f"**{task.task_name}** - {task.student_name}")
+            with col2:
+                status_badge = {
+                    'Тағайындалды': '🔴',
+                    'Жіберілді': '🟡',
+                    'Тексерілді': '🟢',
+                    'Кешікті': '⏰'
+                }.get(task.display_status, '⚪')
+                st.markdown(f"`{status_badge} {task.display_status}`")
+            st.markdown("---")
+    else:
+        st.info("📭 Әрекеттер жоқ")
+
+# ============ НЕГІЗГІ БАҒДАРЛАМА ============
+def main():
+    # Streamlit session state инициализациясы
+    if 'current_class_id' not in st.session_state:
+        st.session_state.current_class_id = None
+    
+    if 'show_add_class' not in st.session_state:
+        st.session_state.show_add_class = False
+    
+    if 'current_page' not in st.session_state:
+        st.session_state.current_page = 'dashboard'
+    
+    if 'language' not in st.session_state:
+        st.session_state.language = 'kk'
+    
+    if 'class_to_delete' not in st.session_state:
+        st.session_state.class_to_delete = None
+    
+    if 'confirm_delete' not in st.session_state:
+        st.session_state.confirm_delete = False
+    
+    if 'preview_file' not in st.session_state:
+        st.session_state.preview_file = None
+    
+    if 'current_ai_tool' not in st.session_state:
+        st.session_state.current_ai_tool = None
+    
+    if 'show_student_login' not in st.session_state:
+        st.session_state.show_student_login = False
+    
+    # Дерекқор схемасы (процесте бір рет, кейін тексеру ғана)
+    ensure_schema(DB_PATH)
+    start_overdue_sweeper()
+    
+    # Басты бағдарлама
+    st.set_page_config(
+        page_title="AI QAZAQ Teachers",
+        page_icon="🇰🇿",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # CSS стильдері
+    st.markdown(APP_CSS, unsafe_allow_html=True)
+    
+    # Сессияны тексеру
+    session = load_session()
+    
+    # Сессияны баптау
+    if session and session[0] == 'teacher':
+        st.session_state.user = session[1]
+        st.session_state.is_authenticated = True
+        st.session_state.is_student = False
+    elif session and session[0] == 'student':
+        st.session_state.student = session[1]
+        st.session_state.is_authenticated = True
+        st.session_state.is_student = True
+    else:
+        st.session_state.is_authenticated = False
+    
+    # Навигация
+    if not st.session_state.is_authenticated:
+        show_login_page()
+    else:
+        if st.session_state.is_student:
+            show_student_portal()
+        else:
+            show_teacher_dashboard()
+
+def show_login_page():
+    """Кіру бетін көрсету"""
+    t = texts[st.session_state.language]
+    
+    show_logo_header()
+    
+    # Кіру және тіркелу табы
+    tab1, tab2 = st.tabs(["✅ Кіру", "📝 Тіркелу"])
+    
+    with tab1:
+        st.subheader("👤 Мұғалім кіруі")
+        
+        with st.form("teacher_login_form"):
+            username = st.text_input(f"{t['username']}", key="login_username")
+            password = st.text_input(f"{t['password']}", type="password", key="login_password")
+            
+            col_login, col_student = st.columns(2)
+            
+            with col_login:
+                if st.form_submit_button(f"🚀 {t['login']}", use_container_width=True):
+                    user = login_user(username, password)
+                    if user:
+                        st.session_state.user = user
+                        st.session_state.is_authenticated = True
+                        st.session_state.is_student = False
+                        save_user_session(user)
+                        st.success(f"🎉 {t['welcome']}, {user[2]}!")
+                        time.sleep(1)
+                        st.rerun()
+                    else:
+                        st.error("❌ Қате логин немесе құпия сөз!")
+            
+            with col_student:
+                if st.button("🎒 Оқушы ретінде кіру", use_container_width=True):
+                    st.session_state.show_student_login = True
+                    st.rerun()
+        
+        # Оқушы кіруі
+        if st.session_state.get('show_student_login', False):
+            st.markdown("---")
+            st.subheader("🎒 Оқушы кіруі")
+            
+            with st.form("student_login_form"):
+                student_username = st.text_input("👤 Оқушы логині", key="student_username")
+                student_password = st.text_input("🔒 Құпия сөз", type="password", key="student_password")
+                
+                if st.form_submit_button("🚀 Оқушы ретінде кіру", use_container_width=True):
+                    student = student_login(student_username, student_password)
+                    if student:
+                        st.session_state.student = student
+                        st.session_state.is_authenticated = True
+                        st.session_state.is_student = True
+                        save_student_session(student)
+                        st.success(f"🎉 Қош келдің, {student[1]}!")
+                        time.sleep(1)
+                        st.rerun()
+                    else:
+                        st.error("❌ Қате логин немесе құпия сөз!")
+            
+            if st.button("← Мұғалім кіруіне оралу"):
+                st.session_state.show_student_login = False
+                st.rerun()
+    
+    with tab2:
+        st.subheader("📝 Жаңа тіркелу")
+        
+        with st.form("register_form"):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                full_name = st.text_input(f"{t['fullname']}")
+                username = st.text_input(f"{t['username']}")
+                password = st.text_input(f"{t['password']}", type="password")
+            
+            with col2:
+                email = st.text_input(f"{t['email']}")
+                school = st.text_input(f"{t['school']}")
+                confirm_password = st.text_input(f"{t['confirm_pass']}", type="password")
+                city = st.text_input("🏙️ Қала")
+            
+            if st.form_submit_button(f"📝 {t['register']}", use_container_width=True):
+                if password != confirm_password:
+                    st.error("❌ Құпия сөздер сәйкес емес!")
+                elif not all([username, password, full_name, school, city]):
+                    st.error("❌ Барлық өрістерді толтырыңыз!")
+                else:
+                    if register_user(username, password, email, full_name, school, city):
+                        st.success("✅ Тіркелу сәтті аяқталды! Енді кіре аласыз.")
+                        time.sleep(2)
+                        st.rerun()
+                    else:
+                        st.error("❌ Бұл пайдаланучы аты бос емес!")
+
+def show_teacher_dashboard():
+    """Мұғалім басқару панелі"""
+    t = texts[st.session_state.language]
+    
+    # Бүйірлік мәзір
+    with st.sidebar:
+        st.markdown(f"""
+        <div style='text-align: center; margin-bottom: 20px;'>
+            <h3>👤 {st.session_state.user[2]}</h3>
+            <p>{st.session_state.user[3]}, {st.session_state.user[4]}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Навигация
+        pages = [
+            ("📊 Басқару панелі", "dashboard"),
+            ("🏫 Сыныптар", "classes"),
+            ("👨‍🎓 Оқушылар", "students"),
+            ("📊 Оқушы үлгерімі", "performance"),
+            ("📝 БЖБ тапсырмалары", "bzb_tasks"),
+            ("🎯 Оқушыларға тапсырмалар", "student_tasks"),
+            ("📁 Көрнекіліктер", "visual_materials"),
+            ("🤖 AI құралдары", "ai_tools")
+        ]
+        
+        for page_name, page_key in pages:
+            if st.button(page_name, use_container_width=True, 
+                        key=f"nav_{page_key}"):
+                st.session_state.current_page = page_key
+        
+        st.markdown("---")
+        
+        # Тіл таңдау
+        lang = st.selectbox("🌐 Тіл", ["Қазақша", "Русский"], 
+                           index=0, key="language_select")
+        st.session_state.language = 'kk' if lang == "Қазақша" else 'ru'
+        
+        # Шығу
+        if st.button(f"🚪 {t['logout']}", use_container_width=True):
+            clear_user_session()
+            st.session_state.clear()
+            st.success("✅ Сіз жүйеден шықтыңыз!")
+            time.sleep(1)
+            st.rerun()
+    
+    # Қолжетімділік түймелері
+    col1, col2 = st.columns([6, 1])
+    
+    with col1:
+        show_logo_header()
+    
+    with col2:
+        if st.button("🔄", help="Жаңарту"):
+            st.rerun()
+    
+    # Файл алдын ала көру
+    if st.session_state.get('preview_file'):
+        show_file_preview()
+        return
+    
+    # Ағымдағы бетті көрсету
+    current_page = st.session_state.current_page
+    
+    if current_page == 'dashboard':
+        show_dashboard()
+    elif current_page == 'classes':
+        show_classes_management()
+    elif current_page == 'students':
+        show_students_management()
+    elif current_page == 'performance':
+        show_student_performance()
+    elif current_page == 'bzb_tasks':
+        show_bzb_tasks()
+    elif current_page == 'student_tasks':
+        show_student_tasks()
+    elif current_page == 'visual_materials':
+        show_visual_materials()
+    elif current_page == 'ai_tools':
+        show_ai_tools()
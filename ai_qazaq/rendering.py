@@ -0,0 +1,373 @@
+# ai_qazaq/rendering.py - көрсету көмекшілері: файлды алдын ала қарау, графиктер, мәтіндер және CSS
+import streamlit as st
+import hashlib
+import io
+import base64
+import threading
+from collections import OrderedDict, Counter
+
+from .data import get_blob_media_source, read_blob
+
+# ============ ФАЙЛДЫ АЛДЫН АЛА ҚАРАУ ============
+def preview_file(sha256, file_type, file_name):
+    """Файлды алдын ала көру - ЖАҢА ТҮЗЕТІЛГЕН"""
+    st.markdown(f"### 📄 {file_name}")
+    
+    try:
+        # Жүктеп алу түймелері файлды тек басылғанда оқиды
+        download_data = lambda: read_blob(sha256)
+        
+        # Мазмұны көрсетілетін түрлер ғана жадқа толық жүктеледі
+        file_data = None
+        if (file_type.startswith('image/') or file_type == 'application/pdf'
+                or file_type == 'text/plain' or file_name.endswith('.txt')):
+            file_data = read_blob(sha256)
+        
+        # Файл түріне байланысты көрсету
+        if file_type.startswith('image/'):
+            st.image(file_data, caption=file_name, use_container_width=True)
+        
+        elif file_type == 'application/pdf':
+            # PDF файлды көрсету
+            base64_pdf = base64.b64encode(file_data).decode('utf-8')
+            pdf_display = f'''
+            <div style="height: 600px; overflow: auto; border: 1px solid #ddd; border-radius: 5px; padding: 10px;">
+                <iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="580px"></iframe>
+            </div>
+            '''
+            st.markdown(pdf_display, unsafe_allow_html=True)
+            
+            # Жүктеп алу түймесі
+            st.download_button(
+                label="📥 PDF файлды жүктеп алу",
+                data=file_data,
+                file_name=file_name,
+                mime=file_type
+            )
+        
+        elif file_type == 'text/plain' or file_name.endswith('.txt'):
+            try:
+                text_content = file_data.decode('utf-8')
+                st.text_area("📝 Файл мазмұны", text_content, height=300)
+            except:
+                # Басқа кодировкаларды көру
+                try:
+                    text_content = file_data.decode('latin-1')
+                    st.text_area("📝 Файл мазмұны", text_content, height=300)
+                except:
+                    st.warning("⚠️ Мәтінді декодтау мүмкін болмады")
+        
+        elif file_type in ['application/vnd.openxmlformats-officedocument.wordprocessingml.document', 
+                          'application/msword']:
+            # Word файлдары үшін
+            st.info(f"📄 Word файлы: {file_name}")
+            st.download_button(
+                label="📥 Word файлды жүктеп алу",
+                data=download_data,
+                file_name=file_name,
+                mime=file_type
+            )
+        
+        elif file_type in ['application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+                          'application/vnd.ms-excel']:
+            # Excel файлдары үшін
+            st.info(f"📊 Excel файлы: {file_name}")
+            st.download_button(
+                label="📥 Excel файлды жүктеп алу",
+                data=download_data,
+                file_name=file_name,
+                mime=file_type
+            )
+        
+        elif file_type.startswith('video/'):
+            st.video(get_blob_media_source(sha256))
+        
+        elif file_type.startswith('audio/'):
+            st.audio(get_blob_media_source(sha256))
+        
+        elif file_type in ['application/vnd.ms-powerpoint', 
+                          'application/vnd.openxmlformats-officedocument.presentationml.presentation']:
+            # PowerPoint файлдары
+            st.info(f"📊 PowerPoint файлы: {file_name}")
+            st.download_button(
+                label="📥 PowerPoint жүктеп алу",
+                data=download_data,
+                file_name=file_name,
+                mime=file_type
+            )
+        
+        else:
+            st.info(f"📁 Файл түрі: {file_type}")
+            st.info(f"📁 Файл атауы: {file_name}")
+            
+            # Әр түрлі файл үшін жүктеп алу
+            st.download_button(
+                label="📥 Файлды жүктеп алу",
+                data=download_data,
+                file_name=file_name,
+                mime=file_type
+            )
+            
+    except Exception as e:
+        st.error(f"❌ Файлды көрсету кезінде қате: {e}")
+
+def display_file_preview(sha256, file_type, file_name):
+    """Файлды көрсетуді жеңілдетілген нұсқасы"""
+    file_data = None
+    if sha256 and (file_type.startswith('image/') or file_type == 'application/pdf'
+                   or file_type.endswith('.txt') or file_type == 'text/plain'):
+        file_data = read_blob(sha256)
+    
+    if sha256:
+        # Файл түріне байланысты әртүрлі көрсету
+        if file_type.startswith('image/'):
+            st.image(file_data, caption=file_name, use_container_width=True)
+        
+        elif file_type == 'application/pdf':
+            st.info(f"📄 PDF файл: {file_name}")
+            base64_pdf = base64.b64encode(file_data).decode('utf-8')
+            pdf_display = f'''
+            <div style="height: 500px; overflow: auto;">
+                <iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="480px"></iframe>
+            </div>
+            '''
+            st.markdown(pdf_display, unsafe_allow_html=True)
+        
+        elif file_type.endswith('.txt') or file_type == 'text/plain':
+            try:
+                text = file_data.decode('utf-8')
+                st.text_area("📝 Мәтін мазмұны", text, height=200)
+            except:
+                st.info(f"📝 Текст файлы: {file_name}")
+        
+        else:
+            st.info(f"📁 Файл: {file_name} ({file_type})")
+    
+    # Әрдайым жүктеп алу түймесі
+    if sha256:
+        st.download_button(
+            label="📥 Файлды жүктеп алу",
+            data=lambda: read_blob(sha256),
+            file_name=file_name,
+            mime=file_type,
+            use_container_width=True
+        )
+
+# ============ ГРАФИКТЕР ============
+# Дайын PNG графиктерінің жалпы көлемі (байт) - асса, ең ескілері шығарылады
+CHART_CACHE_MAX_BYTES = 32 * 1024 * 1024
+CHART_DPI = 100
+
+class ChartCache:
+    """Графиктердің PNG байттарын деректер хэші бойынша сақтайтын LRU кэш"""
+
+    def __init__(self, max_bytes=CHART_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._counters = Counter()
+
+    def get(self, key, render):
+        with self._lock:
+            png = self._entries.get(key)
+            if png is not None:
+                self._entries.move_to_end(key)
+                self._counters['hits'] += 1
+                return png
+            self._counters['misses'] += 1
+        
+        # Сурет салу құлыптан тыс - басқа сессиялар күтпейді
+        png = render()
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = png
+                self._size += len(png)
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+        return png
+
+    def stats(self):
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._size, **self._counters}
+
+@st.cache_resource(show_spinner=False)
+def get_chart_cache():
+    return ChartCache()
+
+def render_chart(draw, *data, figsize=(10, 6)):
+    """draw(fig, *data) графигін PNG байттарына айналдыру - бірдей деректер кэштен алынады.
+
+    Фигура pyplot-сыз (matplotlib.figure.Figure) құрылады, сондықтан pyplot
+    тізілімінде жиналмайды және PNG сақталған соң бірден тазаланады.
+    matplotlib тек кэште жоқ график алғаш салынғанда импортталады.
+    data кэш кілтіне repr арқылы кіреді - қарапайым тізімдер мен сандар беріңіз.
+    """
+    key = hashlib.sha256(repr((draw.__name__, data, figsize)).encode()).hexdigest()
+    
+    def render():
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=figsize)
+        try:
+            draw(fig, *data)
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format='png', dpi=CHART_DPI, bbox_inches='tight')
+            return buffer.getvalue()
+        finally:
+            fig.clear()
+    
+    return get_chart_cache().get(key, render)
+
+def draw_performance_charts(fig, grade_labels, grade_values, class_labels, class_averages):
+    ax = fig.subplots(1, 2)
+    colors = ['#28a745', '#ffc107', '#fd7e14', '#dc3545', '#6c757d']
+    ax[0].bar(grade_labels, grade_values, color=colors[:len(grade_values)])
+    ax[0].set_title('Бағалардың таралуы')
+    ax[0].set_xlabel('Баға')
+    ax[0].set_ylabel('Оқушылар саны')
+    
+    ax[1].bar(class_labels, class_averages)
+    ax[1].set_title('Сыныптар бойынша орташа балл')
+    ax[1].set_xlabel('Сынып')
+    ax[1].set_ylabel('Орташа балл')
+    ax[1].tick_params(axis='x', rotation=45)
+
+def draw_task_status_chart(fig, categories, values):
+    ax = fig.subplots()
+    bars = ax.bar(categories, values, color=['#ffc107', '#28a745', '#007bff', '#dc3545'])
+    
+    # Мәндерді бағандардың үстіне жазу
+    for bar, value in zip(bars, values):
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                f'{value}', ha='center', va='bottom')
+    
+    ax.set_title('Тапсырмалардың статусы бойынша таралуы')
+    ax.set_ylabel('Тапсырмалар саны')
+
+def draw_student_analysis_charts(fig, grade_categories, grade_values, grade_points, avg_points):
+    ax = fig.subplots(1, 2)
+    
+    # Бағалардың таралуы
+    colors = ['#28a745', '#20c997', '#ffc107', '#fd7e14', '#dc3545']
+    ax[0].bar(grade_categories, grade_values, color=colors)
+    ax[0].set_title('Оқу деңгейлерінің таралуы')
+    ax[0].set_xlabel('Деңгей')
+    ax[0].set_ylabel('Оқушылар саны')
+    ax[0].tick_params(axis='x', rotation=45)
+    
+    # Баллдардың таралуы
+    ax[1].hist(grade_points, bins=10, edgecolor='black', alpha=0.7)
+    ax[1].set_title('Баллдардың таралуы')
+    ax[1].set_xlabel('Балл (0-10)')
+    ax[1].set_ylabel('Оқушылар саны')
+    ax[1].axvline(avg_points, color='red', linestyle='--', label=f'Орташа: {avg_points:.1f}')
+    ax[1].legend()
+
+# ============ МӘТІНДЕР ============
+texts = {
+    "kk": {
+        "title": "AI QAZAQ Teachers",
+        "subtitle": "Қазақстандық мұғалімдерге арналған AI платформасы",
+        "login": "✅ Кіру",
+        "register": "📝 Тіркелу",
+        "username": "👤 Пайдаланушы аты",
+        "password": "🔒 Құпия сөз",
+        "fullname": "📛 Толық аты-жөні",
+        "email": "📧 Электронды пошта",
+        "school": "🏫 Мектеп атауы",
+        "confirm_pass": "🔐 Құпия сөзді растау",
+        "welcome": "🎉 Қош келдіңіз",
+        "dashboard": "📊 Басқару панелі",
+        "classes": "🏫 Сыныптар",
+        "students": "👨‍🎓 Оқушылар",
+        "student_performance": "📊 Оқушылардың үлгерімі",
+        "bzb_tasks": "📝 БЖБ тапсырмалары",
+        "student_tasks": "🎯 Оқушыларға тапсырмалар",
+        "visual_materials": "📁 Көрнекіліктер",
+        "ai_tools": "🤖 AI құралдары",
+        "logout": "🚪 Шығу",
+        "add_class": "➕ Жаңа сынып",
+        "class_name": "Сынып атауы",
+        "subject": "Пән",
+        "description": "Сипаттама",
+        "add": "Қосу",
+        "import_students": "📥 Оқушыларды импорттау",
+        "select_class": "Сыныпты таңдаңыз",
+        "no_classes": "Сізде әлі сыныптар жоқ",
+        "student_added": "✅ Оқушы сәтті қосылды!",
+        "class_deleted": "✅ Сынып сәтті жойылды!",
+        "delete_warning": "⚠️ Сыныпты жоюға сенімдісіз бе? Бұл әрекетті кері қайтару мүмкін емес!",
+        "add_student": "➕ Оқушы қосу",
+        "student_name": "Оқушының аты-жөні",
+        "student_id": "Оқушының коды",
+        "import_excel": "Excel файлын жүктеу",
+        "no_students": "📚 Бұл сыныпта оқушылар әлі жоқ",
+        "points": "Ұпай",
+        "academic_performance": "📚 Оқу үлгерімі",
+        "delete_student": "🗑️ Оқушыны жою",
+        "student_portal": "🎒 Оқушы порталы",
+        "ai_lesson_plan": "AI сабақ жоспары",
+        "student_analysis": "Оқушы талдауы",
+        "task_generator": "Тапсырма генераторы",
+        "assessment_rubric": "Бағалау критерийлері",
+        "predictive_analysis": "Прогноздық талдау",
+        "teaching_advice": "Педагогикалық кеңестер",
+        "ai_assistant": "AI көмекші",
+        "back": "Артқа",
+        "generate": "Жасау",
+        "analyze": "Талдау",
+        "create": "Құру",
+        "view_analysis": "Талдауды қарау",
+        "class": "Сынып",
+        "average_grade": "Орташа баға",
+        "performance_level": "Оқу деңгейі",
+        "grade_distribution": "Бағалардың таралуы",
+        "export_to_excel": "📥 Excel-ге экспорттау",
+        "filter_by_class": "Сынып бойынша сүзгі",
+        "filter_by_subject": "Пән бойынша сүзгі",
+        "view_details": "Толығырақ қарау",
+        "total_students": "Барлық оқушылар",
+        "excellent": "Өте жақсы",
+        "good": "Жақсы",
+        "average": "Орташа",
+        "satisfactory": "Қанағаттанарлық",
+        "weak": "Әлсіз",
+        "assign_task": "➕ Тапсырма беру",
+        "task_name": "Тапсырма атауы",
+        "task_description": "Тапсырма сипаттамасы",
+        "due_date": "Мерзімі",
+        "upload_file": "Файл жүктеу",
+        "status": "Статус",
+        "assigned": "Тағайындалды",
+        "not_completed": "Орындалмады",
+        "completed": "Орындалды",
+        "late": "Кешікті",
+        "view_tasks": "Тапсырмаларды қарау",
+        "feedback": "Кері байланыс",
+        "give_feedback": "Кері байланыс беру",
+        "mark_completed": "Орындалды деп белгілеу",
+        "download_task": "Тапсырманы жүктеп алу",
+        "in_progress": "Орындалуда",
+        "all_tasks": "Барлық тапсырмалар",
+        "submit_answer": "Жауап жіберу",
+        "answer_text": "Жауап мәтіні",
+        "answer_file": "Жауап файлы",
+        "submit": "Жіберу"
+    }
+}
+
+# Әр бетке қосылатын CSS стильдері
+APP_CSS = """
+    <style>
+    .stButton > button {
+        width: 100%;
+    }
+    .grade-a { color: #28a745; }
+    .grade-b { color: #20c997; }
+    .grade-c { color: #ffc107; }
+    .grade-d { color: #fd7e14; }
+    .grade-f { color: #dc3545; }
+    </style>
+    """
@@ -0,0 +1,86 @@
+# ai_qazaq/startup.py - іске қосу құнын өлшеу: python -m ai_qazaq.startup
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_SCRIPT = os.path.join(PROJECT_DIR, 'app.py')
+# Кіру беті мен оқушы порталы бұларсыз ашылуы керек - оларды керек беттер өздері импорттайды
+HEAVY_MODULES = ('pandas', 'numpy', 'matplotlib', 'openpyxl', 'flask', 'plotly')
+
+def measure_import_time(module='ai_qazaq.pages', runs=3):
+    """Жаңа процесте модульді импорттау уақыты (мс) - бірнеше өлшеудің ең жақсысы"""
+    code = (
+        "import time; started = time.perf_counter(); "
+        f"import {module}; print((time.perf_counter() - started) * 1000)"
+    )
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_DIR,
+                                capture_output=True, text=True, check=True)
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return min(timings)
+
+def measure_rerun_overhead(runs=200):
+    """app.py скриптін Streamlit сияқты қайта орындау құны (мс, медиана).
+
+    Streamlit скрипт байт-кодын кэштейді, сондықтан компиляция есептелмейді;
+    __name__ "__main__" емес болғандықтан main() шақырылмайды - тек скрипттің өз құны.
+    """
+    sys.path.insert(0, PROJECT_DIR)
+    with open(APP_SCRIPT, encoding='utf-8') as f:
+        code = compile(f.read(), APP_SCRIPT, 'exec')
+    # Алғашқы орындау пакетті импорттайды
+    exec(code, {'__name__': '__rerun__'})
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        exec(code, {'__name__': '__rerun__'})
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2] * 1000
+
+def profile_imports(module='ai_qazaq.pages'):
+    """Жаңа процесте python -X importtime есебі: {түбір пакет: cumulative мс}.
+
+    Пакеттің ең сыртқы импорты оның барлық ішкі модульдерін қамтиды, сондықтан
+    ең үлкен cumulative мәні алынады. importtime сәтсіз импорт әрекеттерін де
+    жазады (мысалы, streamlit plotly-ді тексереді), сондықтан тек процесс
+    соңында sys.modules-та бар пакеттер қалдырылады.
+    """
+    code = f"import sys, {module}; print(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    loaded = {name.split('.')[0] for name in result.stdout.split()}
+    packages = {}
+    for line in result.stderr.splitlines():
+        # "import time:       self |  cumulative | name" - бірінші жол бағандар атауы
+        parts = line.removeprefix('import time:').split('|')
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        package = parts[2].strip().split('.')[0]
+        if package in loaded:
+            packages[package] = max(packages.get(package, 0), int(parts[1]) / 1000)
+    return packages
+
+def measure_import_profile(module='ai_qazaq.pages', top=10):
+    """Пакеттер бойынша ең қымбат импорттар [(мс, пакет)]"""
+    packages = profile_imports(module)
+    return sorted(((ms, package) for package, ms in packages.items()), reverse=True)[:top]
+
+def find_eager_heavy_imports(module='ai_qazaq.pages'):
+    """Модульді импорттағанда жүктелетін HEAVY_MODULES тізімі (бос болуы керек)"""
+    packages = profile_imports(module)
+    return [name for name in HEAVY_MODULES if name in packages]
+
+if __name__ == "__main__":
+    print(f"⏱️ ai_qazaq.pages импорты: {measure_import_time():.0f} мс")
+    print(f"⏱️ app.py қайта орындалуы: {measure_rerun_overhead():.3f} мс")
+    for ms, package in measure_import_profile():
+        print(f"   {ms:8.1f} мс  {package}")
+    eager = find_eager_heavy_imports()
+    if eager:
+        print(f"❌ Іске қосылғанда ауыр модульдер жүктеледі: {', '.join(eager)}")
+        sys.exit(1)
+    print("✅ Ауыр модульдер тек керек беттерде жүктеледі")
@@ -0,0 +1,23 @@
+# ai_qazaq/web.py - Flask қосымшасы (Streamlit-тен бөлек іске қосылады: python -m ai_qazaq.web)
+from flask import Flask
+
+app = Flask(__name__)
+
+@app.route("/")
+def home():
+    return """
+    <h2>Білім беру платформасы</h2>
+    <a href='/student'>Оқушы</a><br><br>
+    <a href='/teacher'>Мұғалім</a>
+    """
+
+@app.route("/student")
+def student():
+    return "<h3>Оқушы беті</h3>"
+
+@app.route("/teacher")
+def teacher():
+    return "<h3>Мұғалім беті</h3>"
+
+if __name__ == "__main__":
+    app.run(debug=True)
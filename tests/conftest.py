@@ -0,0 +1,33 @@
+# tests/conftest.py - тесттерге ортақ уақытша дерекқор және жүктелген файл
+import pytest
+
+from ai_qazaq import data
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Пулды уақытша дерекқорға бағыттау - қолданбаның дерекқоры өзгермейді"""
+    db_path = str(tmp_path / 'test.db')
+    monkeypatch.setattr(data, 'DB_PATH', db_path)
+    monkeypatch.setattr(data, 'BLOB_STORAGE', 'sqlite')
+    data.get_query_cache().clear()
+    data.ensure_schema(db_path)
+    yield data.get_connection_pool(db_path).holder().conn
+    data.get_query_cache().clear()
+
+class Upload:
+    """st.file_uploader нәтижесінің орнына қолданылатын файл"""
+    def __init__(self, name, file_type, data):
+        self.name = name
+        self.type = file_type
+        self._data = data
+
+    def read(self):
+        return self._data
+
+    def seek(self, position):
+        pass
+
+@pytest.fixture
+def upload():
+    """upload('a.txt') - мазмұны атауына тең мәтіндік файл"""
+    return lambda name, content=None: Upload(name, 'text/plain', (content or name).encode())
@@ -0,0 +1,67 @@
+# tests/test_blobs.py - blobs кестесінің сілтеме санағы (ref_count триггерлері)
+import pytest
+
+from ai_qazaq import data
+
+@pytest.fixture
+def filesystem_backend(tmp_path, monkeypatch):
+    backend = data.BLOB_BACKENDS['filesystem']
+    monkeypatch.setattr(backend, 'root', tmp_path / 'blob_store')
+    return backend
+
+def blob_ref_count(db, sha256):
+    row = db.execute("SELECT ref_count FROM blobs WHERE sha256 = ?", (sha256,)).fetchone()
+    return row[0] if row else None
+
+def test_shared_upload_is_released_with_last_reference(db, upload):
+    data.register_user('teacher', 'pw', '', 'Teacher', 'School', 'City')
+    teacher_id = data.login_user('teacher', 'pw')[0]
+    data.add_class(teacher_id, '7A', 'Математика', '7', '')
+    data.add_class(teacher_id, '8B', 'Физика', '8', '')
+    class_a, class_b = (class_item[0] for class_item in data.get_classes(teacher_id))
+    for class_id, codes in [(class_a, ['A1', 'A2', 'A3']), (class_b, ['B1'])]:
+        for code in codes:
+            data.add_student(class_id, f'Оқушы {code}', code, 7, 'Жақсы')
+    students_a = [student[0] for student in data.get_students_by_class(class_a)]
+    student_b = data.get_students_by_class(class_b)[0][0]
+
+    results = data.assign_unified_task_bulk(
+        teacher_id, {'task_name': 'Алгебра', 'task_file': upload('task.txt', 'ортақ файл')},
+        class_ids=[class_a, class_b])
+    assert all(result[2] for result in results)
+    sha256 = data._blob_sha256('ортақ файл')
+    assert blob_ref_count(db, sha256) == 4
+
+    task_id = db.execute("SELECT id FROM student_tasks WHERE student_id = ?", (students_a[0],)).fetchone()[0]
+    assert data.delete_unified_task(task_id)[0]
+    assert blob_ref_count(db, sha256) == 3
+
+    assert data.delete_student(student_b)
+    assert blob_ref_count(db, sha256) == 2
+
+    # Сыныппен бірге қалған екі тапсырма да жойылады
+    assert data.delete_class(class_a)
+    assert blob_ref_count(db, sha256) is None
+
+def test_filesystem_write_skips_blob_stored_in_sqlite(db, filesystem_backend):
+    with data.db_connection() as conn:
+        sha256 = data.store_blob(conn, b'content', 'sqlite')
+        data.store_blob(conn, b'content', 'filesystem')
+    assert not filesystem_backend.path(sha256).exists()
+    assert data.get_blob_media_source(sha256) == b'content'
+
+def test_move_blobs_to_filesystem(db, filesystem_backend):
+    with data.db_connection() as conn:
+        sha256 = data.store_blob(conn, b'content', 'sqlite')
+    assert data.move_blobs('filesystem') == 1
+    assert filesystem_backend.path(sha256).read_bytes() == b'content'
+    assert data.read_blob(sha256) == b'content'
+    assert data.get_blob_media_source(sha256) == str(filesystem_backend.path(sha256))
+
+def test_rolled_back_filesystem_blob_is_removed(db, filesystem_backend):
+    with pytest.raises(RuntimeError):
+        with data.db_connection() as conn:
+            sha256 = data.store_blob(conn, b'content', 'filesystem')
+            assert filesystem_backend.path(sha256).exists()
+            raise RuntimeError("rollback")
+    assert not filesystem_backend.path(sha256).exists()
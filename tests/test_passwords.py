@@ -0,0 +1,28 @@
+# tests/test_passwords.py - scrypt хэштеу пулдары
+import threading
+
+from ai_qazaq import data
+
+def test_hash_passwords_round_trip(monkeypatch):
+    monkeypatch.setattr(data, 'PASSWORD_SCRYPT_N', 2 ** 10)
+    hashes = data.hash_passwords(['alpha', 'beta'])
+    assert data.verify_password('alpha', hashes[0])
+    assert not data.verify_password('alpha', hashes[1])
+
+def test_login_hashing_not_queued_behind_batch(monkeypatch):
+    monkeypatch.setattr(data, 'PASSWORD_SCRYPT_N', 2 ** 10)
+    release = threading.Event()
+    batch_pool = data.get_password_batch_hash_pool()
+    # Топтық пулдың барлық ағындары бос емес және артында кезек бар
+    blocked = [batch_pool.submit(release.wait) for _ in range(data.PASSWORD_BATCH_HASH_WORKERS * 3)]
+    try:
+        verified = []
+        login = threading.Thread(target=lambda: verified.append(
+            data.verify_password('pw', data.hash_password('pw'))))
+        login.start()
+        login.join(timeout=10)
+        assert verified == [True]
+    finally:
+        release.set()
+        for future in blocked:
+            future.result()
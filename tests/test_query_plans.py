@@ -0,0 +1,111 @@
+# tests/test_query_plans.py - дерек функцияларының сұраныс жоспарларын тексеру
+# Іске қосу (жоба түбірінен): python -m pytest -q tests
+import re
+
+import pandas as pd
+
+from ai_qazaq import data
+
+# Әдейі толық оқылатын кішкентай кестелер (blob_trash - әдетте бос кезек)
+QUERY_PLAN_ALLOWED_SCANS = {'blob_trash'}
+
+def query_plan_audit_steps(upload):
+    """(атауы, функция) - әр қадам алдыңғыларының деректеріне сүйенеді"""
+    state = {}
+
+    def seed():
+        data.register_user('audit_teacher', 'pw', '', 'Audit Teacher', 'School', 'City')
+        state['teacher_id'] = data.login_user('audit_teacher', 'pw')[0]
+        data.add_class(state['teacher_id'], '7A', 'Математика', '7', '')
+        data.add_class(state['teacher_id'], '8B', 'Физика', '8', '')
+        state['class_id'] = data.get_classes(state['teacher_id'])[0][0]
+        for i in range(3):
+            data.add_student(state['class_id'], f'Оқушы {i}', f'AUDIT{i}', 5 + i, 'Жақсы')
+        state['student_id'] = data.get_students_by_class(state['class_id'])[0][0]
+        data.register_student_login(state['student_id'], 'audit_student', 'pw')
+
+    teacher = lambda: state['teacher_id']
+    return [
+        ('seed', seed),
+        ('login_user', lambda: data.login_user('audit_teacher', 'pw')),
+        ('student_login', lambda: data.student_login('audit_student', 'pw')),
+        ('get_classes', lambda: data.get_classes(teacher())),
+        ('get_class_count', lambda: data.get_class_count(teacher())),
+        ('get_student_count', lambda: data.get_student_count(teacher())),
+        ('get_teacher_roster', lambda: data.get_teacher_roster(teacher())),
+        ('get_students_by_class', lambda: data.get_students_by_class(state['class_id'])),
+        ('import_students', lambda: data.import_students(
+            state['class_id'], pd.DataFrame({'full_name': ['Импорт'], 'student_code': ['AUDIT_IMPORT']}))),
+        ('get_student_logins', lambda: data.get_student_logins(state['student_id'])),
+        ('generate_student_logins', lambda: data.generate_student_logins(teacher(), state['class_id'])),
+        ('assign_unified_task_bulk', lambda: data.assign_unified_task_bulk(
+            teacher(), {'task_name': 'Алгебра', 'due_date': '2020-01-01', 'task_file': upload('task.txt')},
+            class_ids=[state['class_id']])),
+        ('save_unified_student_task', lambda: data.save_unified_student_task(
+            teacher(), state['student_id'], state['class_id'], {'task_name': 'Геометрия', 'due_date': '2099-01-01'})),
+        ('save_file_to_db', lambda: data.save_file_to_db(teacher(), 'material.txt', upload('material.txt'), 'Басқа')),
+        ('save_bzb_task', lambda: data.save_bzb_task(teacher(), state['class_id'], 'БЖБ', upload('bzb.txt'), 'text/plain', 50, 'Орташа')),
+        ('get_saved_files', lambda: state.update(files=data.get_saved_files(teacher()))),
+        ('get_visual_material', lambda: data.get_visual_material(state['files'][0]['id'])),
+        ('read_blob', lambda: data.read_blob(state['files'][0]['sha256'])),
+        ('get_bzb_tasks', lambda: state.update(bzb=data.get_bzb_tasks(teacher()))),
+        ('get_bzb_task', lambda: data.get_bzb_task(state['bzb'][0]['id'])),
+        ('get_unified_student_tasks_by_teacher', lambda: state.update(tasks=data.get_unified_student_tasks_by_teacher(teacher()))),
+        ('get_unified_student_tasks_by_student', lambda: data.get_unified_student_tasks_by_student(state['student_id'])),
+        ('get_unified_task_file', lambda: data.get_unified_task_file(state['tasks'][0].id, 'task')),
+        ('get_unified_student_tasks_page', lambda: [
+            data.get_unified_student_tasks_page(teacher(), status, search, sort_by, cursor, limit=1)
+            for sort_by in data.TASK_SORT_KEYS
+            for status, search in [(None, None), ('Кешікті', None), (None, 'алг')]
+            for cursor in [None, data.get_unified_student_tasks_page(teacher(), status, search, sort_by, None, limit=1)[1]]
+        ]),
+        ('count_unified_student_tasks', lambda: data.count_unified_student_tasks(teacher(), 'Кешікті', 'алг')),
+        ('search_unified_tasks', lambda: (data.search_unified_tasks('алг', teacher_id=teacher()),
+                                          data.search_unified_tasks('алг', student_id=state['student_id']))),
+        ('update_unified_task_status', lambda: data.update_unified_task_status(state['tasks'][0].id, 'Тексерілді', 'Жақсы', 9)),
+        ('submit_unified_student_answer', lambda: data.submit_unified_student_answer(
+            state['tasks'][1].id, 'Жауап', upload('answer.txt'))),
+        ('get_task_statistics_unified', lambda: data.get_task_statistics_unified(teacher())),
+        ('get_task_stats', lambda: (data.get_task_stats('class', state['class_id']), data.get_task_stats('student', state['student_id']))),
+        ('get_dashboard_summary', lambda: data.get_dashboard_summary(teacher())),
+        ('sweep_overdue_tasks', data.sweep_overdue_tasks),
+        ('session_store', lambda: (lambda store: store.delete(store.create('teacher', [teacher()])))(data.SessionStore())),
+        ('delete_unified_task', lambda: data.delete_unified_task(state['tasks'][-1].id)),
+        ('delete_file', lambda: data.delete_file(state['files'][0]['id'])),
+        ('delete_bzb_task', lambda: data.delete_bzb_task(state['bzb'][0]['id'])),
+        ('delete_student', lambda: data.delete_student(state['student_id'])),
+        ('delete_class', lambda: data.delete_class(state['class_id'])),
+    ]
+
+def full_scans(conn, sql):
+    """EXPLAIN QUERY PLAN бойынша толық оқылатын нақты кестелер"""
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    scans = []
+    for row in conn.execute("EXPLAIN QUERY PLAN " + sql):
+        detail = row[3]
+        match = re.match(r'SCAN (\w+)', detail)
+        if match and match.group(1) in tables and 'VIRTUAL TABLE' not in detail \
+                and match.group(1) not in QUERY_PLAN_ALLOWED_SCANS:
+            scans.append(detail)
+    return scans
+
+def test_data_functions_avoid_full_table_scans(db, upload):
+    """Әр дерек функциясын шақырып, орындалған SQL жоспарларында толық кесте сканы жоқ"""
+    offenders = []
+    checked = 0
+    for name, step in query_plan_audit_steps(upload):
+        statements = []
+        db.set_trace_callback(statements.append)
+        try:
+            step()
+        finally:
+            db.set_trace_callback(None)
+        for sql in dict.fromkeys(statements):
+            if not re.match(r'\s*(SELECT|WITH|UPDATE|DELETE|INSERT)', sql, re.IGNORECASE):
+                continue
+            checked += 1
+            for detail in full_scans(db, sql):
+                offenders.append(f"{name}: {detail}\n   {' '.join(sql.split())[:200]}")
+
+    assert checked > 0
+    assert not offenders, "Толық кесте сканы:\n" + "\n".join(offenders)
@@ -0,0 +1,13 @@
+# tests/test_startup.py - суық іске қосу: ауыр модульдер тек керек беттерде жүктеледі
+from ai_qazaq import startup
+
+def test_app_import_does_not_load_heavy_modules():
+    assert startup.find_eager_heavy_imports() == []
+
+def test_import_profile_reports_app_package():
+    packages = startup.profile_imports('ai_qazaq.pages')
+    assert 'ai_qazaq' in packages and 'streamlit' in packages
+
+def test_heavy_module_is_detected():
+    eager = startup.find_eager_heavy_imports('ai_qazaq.rendering, matplotlib.figure')
+    assert 'matplotlib' in eager and 'numpy' in eager
@@ -0,0 +1,67 @@
+# tests/test_students.py - оқушыларды импорттау және логин құру
+import io
+
+import pandas as pd
+import pytest
+
+from ai_qazaq import data
+
+def make_class(teacher_name='teacher'):
+    data.register_user(teacher_name, 'pw', '', 'Teacher', 'School', 'City')
+    teacher_id = data.login_user(teacher_name, 'pw')[0]
+    data.add_class(teacher_id, '7A', 'Математика', '7', '')
+    return teacher_id, data.get_classes(teacher_id)[0][0]
+
+def test_rejected_row_code_does_not_block_later_row():
+    roster = pd.DataFrame({'full_name': ['', 'Айгерім'], 'student_code': ['101', '101']})
+    rows, errors = data.validate_student_roster(roster)
+    assert rows['student_code'].tolist() == ['101']
+    assert errors['error'].tolist() == ["Аты-жөні бос"]
+
+def test_duplicate_codes_between_valid_rows_are_rejected():
+    roster = pd.DataFrame({'full_name': ['Айгерім', 'Ерлан', 'Дана'], 'student_code': ['101', '101', '102']})
+    rows, errors = data.validate_student_roster(roster, seen_codes={'102'})
+    assert rows['full_name'].tolist() == ['Айгерім']
+    assert errors['error'].tolist() == ["Код файлда қайталанады"] * 2
+
+def test_import_students_inserts_valid_rows(db):
+    _, class_id = make_class()
+    roster = pd.DataFrame({'full_name': ['', 'Айгерім'], 'student_code': ['101', '101']})
+    result = data.import_students(class_id, roster)
+    assert result['inserted'] == 1
+    assert [student[3] for student in data.get_students_by_class(class_id)] == ['101']
+
+class CsvUpload(io.BytesIO):
+    name = 'roster.csv'
+
+@pytest.mark.parametrize('chunk_size', [1, 100])
+def test_unknown_class_row_does_not_claim_code(db, chunk_size):
+    teacher_id, class_id = make_class()
+    roster = CsvUpload('class_name,full_name,student_code\nZZ,Айгерім,9\n7A,Ерлан,9\n'.encode('utf-8'))
+    result = data.import_students_streaming(roster, class_id, teacher_id, chunk_size=chunk_size)
+    assert result['inserted'] == 1
+    assert result['errors']['error'].tolist() == ["Сынып табылмады (атауы бірегей болуы керек)"]
+    assert [student[2] for student in data.get_students_by_class(class_id)] == ['Ерлан']
+
+def test_generated_logins_resolve_username_collisions_in_batch(db):
+    teacher_id, class_id = make_class()
+    data.add_student(class_id, 'Айгерім', 'X1', 7, 'Жақсы')
+    data.add_student(class_id, 'Ерлан', '', 7, 'Жақсы')  # id 2, коды жоқ - student_2
+    data.add_student(class_id, 'Дана', '2', 7, 'Жақсы')
+    credentials, skipped = data.generate_student_logins(teacher_id, class_id)
+    assert skipped.empty
+    assert sorted(credentials['Логин']) == ['student_2', 'student_2_3', 'student_X1']
+    for username, password in zip(credentials['Логин'], credentials['Құпия сөз']):
+        assert data.student_login(username, password) is not None
+
+def test_generated_logins_report_taken_usernames_as_skipped(db):
+    teacher_id, class_id = make_class()
+    for name, code in [('Айгерім', '101'), ('Ерлан', '102'), ('Дана', '103')]:
+        data.add_student(class_id, name, code, 7, 'Жақсы')
+    student_ids = {student[3]: student[0] for student in data.get_students_by_class(class_id)}
+    # Айгерімге student_101 те, student_101_<id> де бос емес
+    assert data.register_student_login(student_ids['102'], 'student_101', 'pw')[0]
+    assert data.register_student_login(student_ids['103'], f"student_101_{student_ids['101']}", 'pw')[0]
+    credentials, skipped = data.generate_student_logins(teacher_id, class_id)
+    assert credentials.empty
+    assert skipped['Оқушы'].tolist() == ['Айгерім']
@@ -0,0 +1,66 @@
+# tests/test_task_stats.py - task_stats есептегіштері мен оларды жүргізетін триггерлер
+from ai_qazaq import data
+
+def assert_no_drift():
+    assert data.rebuild_task_stats(verify_only=True) == []
+
+def task_ids(db, student_id):
+    return [row[0] for row in db.execute("SELECT id FROM student_tasks WHERE student_id = ? ORDER BY id", (student_id,))]
+
+def test_triggers_keep_task_stats_in_sync(db, upload):
+    data.register_user('teacher', 'pw', '', 'Teacher', 'School', 'City')
+    teacher_id = data.login_user('teacher', 'pw')[0]
+    data.add_class(teacher_id, '7A', 'Математика', '7', '')
+    data.add_class(teacher_id, '8B', 'Физика', '8', '')
+    class_a, class_b = (class_item[0] for class_item in data.get_classes(teacher_id))
+    for class_id, codes in [(class_a, ['A1', 'A2']), (class_b, ['B1'])]:
+        for code in codes:
+            data.add_student(class_id, f'Оқушы {code}', code, 7, 'Жақсы')
+    student_a1, student_a2 = (student[0] for student in data.get_students_by_class(class_a))
+    student_b1 = data.get_students_by_class(class_b)[0][0]
+
+    data.assign_unified_task_bulk(teacher_id, {'task_name': 'Алгебра', 'due_date': '2099-01-01'},
+                                  class_ids=[class_a, class_b])
+    data.save_unified_student_task(teacher_id, student_a1, class_a, {'task_name': 'Геометрия', 'due_date': '2099-01-01'})
+    assert data.get_task_stats('teacher', teacher_id) == {'Тағайындалды': 4}
+    assert data.get_task_stats('class', class_a) == {'Тағайындалды': 3}
+    assert_no_drift()
+
+    first_task, second_task = task_ids(db, student_a1)
+    assert data.submit_unified_student_answer(first_task, 'Жауап', upload('answer.txt'))[0]
+    assert data.update_unified_task_status(second_task, 'Тексерілді', 'Жақсы', 9)[0]
+    assert data.get_task_stats('student', student_a1) == {'Жіберілді': 1, 'Тексерілді': 1}
+    assert_no_drift()
+
+    # Тапсырманы басқа сыныптағы оқушыға ауыстыру (қолданбада функциясы жоқ - тек триггер)
+    with data.db_connection() as conn:
+        conn.execute("UPDATE student_tasks SET student_id = ?, class_id = ? WHERE id = ?",
+                     (student_b1, class_b, second_task))
+    assert data.get_task_stats('class', class_b) == {'Тағайындалды': 1, 'Тексерілді': 1}
+    assert_no_drift()
+
+    assert data.delete_unified_task(first_task)[0]
+    assert data.delete_student(student_a2)
+    assert_no_drift()
+
+    assert data.delete_class(class_b)
+    assert data.get_task_stats('class', class_b) == {}
+    assert data.get_task_stats('teacher', teacher_id) == {}
+    assert_no_drift()
+
+def test_verify_only_reports_drift_without_rebuilding(db):
+    data.register_user('teacher', 'pw', '', 'Teacher', 'School', 'City')
+    teacher_id = data.login_user('teacher', 'pw')[0]
+    data.add_class(teacher_id, '7A', 'Математика', '7', '')
+    class_id = data.get_classes(teacher_id)[0][0]
+    data.add_student(class_id, 'Оқушы', 'A1', 7, 'Жақсы')
+    student_id = data.get_students_by_class(class_id)[0][0]
+    data.save_unified_student_task(teacher_id, student_id, class_id, {'task_name': 'Алгебра', 'due_date': '2099-01-01'})
+    with data.db_connection() as conn:
+        conn.execute("UPDATE task_stats SET task_count = 5 WHERE scope = 'teacher'")
+
+    assert data.rebuild_task_stats(verify_only=True) == [('teacher', teacher_id, 'Тағайындалды', 5, 1)]
+    assert data.get_task_stats('teacher', teacher_id) == {'Тағайындалды': 5}
+    assert len(data.rebuild_task_stats()) == 1
+    assert_no_drift()
+    assert data.get_task_stats('teacher', teacher_id) == {'Тағайындалды': 1}
@@ -0,0 +1,34 @@
+# tests/test_tasks.py - тапсырмалардың мерзімі мен көрсетілетін статусы
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ai_qazaq import data
+
+@pytest.fixture
+def shifted_local_date(monkeypatch):
+    """Жергілікті күн UTC күнінен өзгеше болатын уақыт белдеуі (қазіргі сағатқа қарай)"""
+    utc_hour = datetime.now(timezone.utc).hour
+    monkeypatch.setenv('TZ', 'Etc/GMT-14' if utc_hour >= 10 else 'Etc/GMT+12')
+    time.tzset()
+    assert datetime.now().date() != datetime.now(timezone.utc).date()
+    yield datetime.now().date()
+    monkeypatch.undo()
+    time.tzset()
+
+def test_display_status_and_days_left_share_local_today(db, shifted_local_date):
+    data.register_user('teacher', 'pw', '', 'Teacher', 'School', 'City')
+    teacher_id = data.login_user('teacher', 'pw')[0]
+    data.add_class(teacher_id, '7A', 'Математика', '7', '')
+    class_id = data.get_classes(teacher_id)[0][0]
+    data.add_student(class_id, 'Оқушы', 'A1', 7, 'Жақсы')
+    student_id = data.get_students_by_class(class_id)[0][0]
+    for name, due_date in [('Кеше', shifted_local_date - timedelta(days=1)), ('Бүгін', shifted_local_date)]:
+        data.save_unified_student_task(teacher_id, student_id, class_id,
+                                       {'task_name': name, 'due_date': due_date.isoformat()})
+    data.sweep_overdue_tasks()
+
+    tasks = {task.task_name: task for task in data.get_unified_student_tasks_by_student(student_id)}
+    assert (tasks['Кеше'].display_status, tasks['Кеше'].days_left) == ('Кешікті', 1)
+    assert (tasks['Бүгін'].display_status, tasks['Бүгін'].days_left) == ('Тағайындалды', 0)